@@ -3,28 +3,33 @@
 from __future__ import annotations
 
 import importlib.metadata
+from typing import TYPE_CHECKING
 
-from semantic_release.commit_parser import (
-    CommitParser,
-    ParsedCommit,
-    ParseError,
-    ParseResult,
-    ParseResultType,
-    ParserOptions,
-)
-from semantic_release.enums import LevelBump
-from semantic_release.errors import (
-    CommitParseError,
-    InvalidConfiguration,
-    InvalidVersion,
-    SemanticReleaseBaseError,
-)
-from semantic_release.version import (
-    Version,
-    VersionTranslator,
-    next_version,
-    tags_and_versions,
-)
+from semantic_release.helpers import lazy_module_attributes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from semantic_release.commit_parser import (
+        CommitParser,
+        ParsedCommit,
+        ParseError,
+        ParseResult,
+        ParseResultType,
+        ParserOptions,
+    )
+    from semantic_release.enums import LevelBump
+    from semantic_release.errors import (
+        CommitParseError,
+        InvalidConfiguration,
+        InvalidVersion,
+        SemanticReleaseBaseError,
+    )
+    from semantic_release.version import (
+        Version,
+        VersionTranslator,
+        next_version,
+        next_versions,
+        tags_and_versions,
+    )
 
 __version__ = importlib.metadata.version(f"python_{__package__}".replace("_", "-"))
 
@@ -43,9 +48,34 @@ __all__ = [
     "Version",
     "VersionTranslator",
     "next_version",
+    "next_versions",
     "tags_and_versions",
 ]
 
+# The public API is imported on first access only, so that e.g. the CLI does not pay
+# for the commit parsers, GitPython & pydantic before it knows that it needs them
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "CommitParser": f"{__name__}.commit_parser",
+        "ParsedCommit": f"{__name__}.commit_parser",
+        "ParseError": f"{__name__}.commit_parser",
+        "ParseResult": f"{__name__}.commit_parser",
+        "ParseResultType": f"{__name__}.commit_parser",
+        "ParserOptions": f"{__name__}.commit_parser",
+        "LevelBump": f"{__name__}.enums",
+        "SemanticReleaseBaseError": f"{__name__}.errors",
+        "CommitParseError": f"{__name__}.errors",
+        "InvalidConfiguration": f"{__name__}.errors",
+        "InvalidVersion": f"{__name__}.errors",
+        "Version": f"{__name__}.version",
+        "VersionTranslator": f"{__name__}.version",
+        "next_version": f"{__name__}.version",
+        "next_versions": f"{__name__}.version",
+        "tags_and_versions": f"{__name__}.version",
+    },
+)
+
 
 def setup_hook(argv: list[str]) -> None:
     """
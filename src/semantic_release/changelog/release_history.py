@@ -4,15 +4,13 @@ from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, TypedDict
 
-from git.objects.tag import TagObject
-
 from semantic_release.commit_parser import ParseError
 from semantic_release.commit_parser.token import ParsedCommit
 from semantic_release.commit_parser.util import force_str
 from semantic_release.enums import LevelBump
 from semantic_release.globals import logger
 from semantic_release.helpers import validate_types_in_sequence
-from semantic_release.version.algorithm import tags_and_versions
+from semantic_release.history.snapshot import HistorySnapshot
 
 if TYPE_CHECKING:  # pragma: no cover
     from re import Pattern
@@ -38,16 +36,32 @@ class ReleaseHistory:
         translator: VersionTranslator,
         commit_parser: CommitParser[ParseResult, ParserOptions],
         exclude_commit_patterns: Iterable[Pattern[str]] = (),
+        history: HistorySnapshot | None = None,
+        rev: str = "HEAD",
     ) -> ReleaseHistory:
-        all_git_tags_and_versions = tags_and_versions(repo.tags, translator)
+        # Re-use the tags, commits & parse results of a snapshot shared with
+        # other consumers of this run when provided. The exclude_paths only keep
+        # commits from causing a release, such commits are still part of the
+        # changelog.
+        history = (
+            history
+            or HistorySnapshot(
+                repo=repo,
+                translator=translator,
+                commit_parser=commit_parser,
+                rev=rev,
+            )
+        ).without_exclusions()
+        all_git_tags_and_versions = history.tags_and_versions
         unreleased: dict[str, list[ParseResult]] = defaultdict(list)
         released: dict[Version, Release] = {}
 
         # Performance optimization: create a mapping of tag sha to version
         # so we can quickly look up the version for a given commit based on sha
         tag_sha_2_version_lookup = {
-            tag.commit.hexsha: (tag, version)
+            tag.commit_sha: (tag, version)
             for tag, version in all_git_tags_and_versions
+            if tag.commit_sha
         }
 
         ignore_merge_commits = bool(
@@ -68,7 +82,15 @@ class ReleaseHistory:
 
         the_version: Version | None = None
 
-        for commit in repo.iter_commits("HEAD", topo_order=True):
+        # Parse the whole history up front so that it can be spread over the
+        # configured parser workers, the loop below only reads the results
+        relevant_commits = history.relevant_commits(history.commits)
+        history.parse_many(relevant_commits)
+        relevant_shas = {commit.hexsha for commit in relevant_commits}
+
+        # All commit details are read from a single `git log` stream rather than
+        # looked up one object at a time
+        for commit in history.commits:
             # Determine if we have found another release
             logger.debug("checking if commit %s matches any tags", commit.hexsha[:7])
             t_v = tag_sha_2_version_lookup.get(commit.hexsha, None)
@@ -82,21 +104,12 @@ class ReleaseHistory:
                 # so we create a new Release entry
                 logger.debug("found commit %s for tag %s", commit.hexsha, tag.name)
 
-                # tag.object is a Commit if the tag is lightweight, otherwise
-                # it is a TagObject with additional metadata about the tag
-                if isinstance(tag.object, TagObject):
-                    tagger = tag.object.tagger
-                    committer = tag.object.tagger.committer()
-                    _tz = timezone(timedelta(seconds=-1 * tag.object.tagger_tz_offset))
-                    tagged_date = datetime.fromtimestamp(tag.object.tagged_date, tz=_tz)
-                else:
-                    # For some reason, sometimes tag.object is a Commit
-                    tagger = tag.object.author
-                    committer = tag.object.author
-                    _tz = timezone(timedelta(seconds=-1 * tag.object.author_tz_offset))
-                    tagged_date = datetime.fromtimestamp(
-                        tag.object.committed_date, tz=_tz
-                    )
+                # The tag index provides the tagger details of annotated tags,
+                # and falls back to the author of the commit for lightweight tags
+                tagger = tag.tagger
+                committer = tag.tagger.committer() if tag.is_annotated else tag.tagger
+                _tz = timezone(timedelta(seconds=-1 * tag.tagger_tz_offset))
+                tagged_date = datetime.fromtimestamp(tag.tagged_date, tz=_tz)
 
                 release = Release(
                     tagger=tagger,
@@ -108,6 +121,12 @@ class ReleaseHistory:
 
                 released.setdefault(the_version, release)
 
+            # Commits outside of the paths the history is limited to (e.g. a single
+            # package of a monorepo) are not part of its changelog
+            if commit.hexsha not in relevant_shas:
+                logger.debug("commit %s is out of scope, skipping", commit.hexsha[:7])
+                continue
+
             logger.info(
                 "parsing commit [%s] %s",
                 commit.hexsha[:8],
@@ -115,7 +134,7 @@ class ReleaseHistory:
             )
             # returns a ParseResult or list of ParseResult objects,
             # it is usually one, but we split a commit if a squashed merge is detected
-            parse_results = commit_parser.parse(commit)
+            parse_results = history.parse(commit)
 
             if not any(
                 (
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -10,6 +11,7 @@ from git import InvalidGitRepositoryError
 from pydantic import ValidationError
 
 from semantic_release.cli.config import (
+    BaseRuntimeContext,
     RawConfig,
     RuntimeContext,
 )
@@ -21,7 +23,9 @@ from semantic_release.errors import (
 )
 
 if TYPE_CHECKING:  # pragma: no cover
-    from semantic_release.cli.config import GlobalCommandLineOptions
+    from typing import Iterator
+
+    from semantic_release.cli.config import BranchConfig, GlobalCommandLineOptions
 
     class CliContext(click.Context):
         obj: CliContextObj
@@ -38,6 +42,7 @@ class CliContextObj:
         self.logger = logger
         self.global_opts = global_opts
         self._raw_config: RawConfig | None = None
+        self._base_runtime_ctx: BaseRuntimeContext | None = None
         self._runtime_ctx: RuntimeContext | None = None
 
     @property
@@ -56,6 +61,34 @@ class CliContextObj:
             self._runtime_ctx = self._init_runtime_ctx()
         return self._runtime_ctx
 
+    @property
+    def base_runtime_ctx(self) -> BaseRuntimeContext:
+        """
+        Lazy load only the part of the runtime context which is needed to determine the
+        next version, for commands that do not release anything (e.g. `version --print`).
+        The full runtime context is re-used if it has already been loaded.
+        """
+        if self._runtime_ctx is not None:
+            return self._runtime_ctx
+        if self._base_runtime_ctx is None:
+            self._base_runtime_ctx = self._init_base_runtime_ctx()
+        return self._base_runtime_ctx
+
+    def base_runtime_ctx_for(self, branch_config: BranchConfig) -> BaseRuntimeContext:
+        """
+        Load the minimal runtime context for the release group ``branch_config``,
+        regardless of the active branch
+        """
+        with self._runtime_ctx_errors():
+            runtime = BaseRuntimeContext.from_raw_config(
+                self.raw_config,
+                global_cli_options=self.global_opts,
+                branch_config=branch_config,
+            )
+
+        self._close_parse_cache_on_exit(runtime)
+        return runtime
+
     def _init_raw_config(self) -> RawConfig:
         config_path = Path(self.global_opts.config_file)
         conf_file_exists = config_path.exists()
@@ -82,7 +115,14 @@ class CliContextObj:
                     "configuration empty, falling back to default configuration"
                 )
 
-            return RawConfig.model_validate(config_obj)
+            raw_config = RawConfig.model_validate(config_obj)
+            # A package of a monorepo is released with its own tag format &
+            # version declarations
+            return (
+                raw_config.for_package(self.global_opts.package)
+                if self.global_opts.package
+                else raw_config
+            )
         except FileNotFoundError as exc:
             click.echo(str(exc), err=True)
             self.ctx.exit(2)
@@ -94,13 +134,36 @@ class CliContextObj:
             click.echo(str(exc), err=True)
             self.ctx.exit(1)
 
+    def _init_base_runtime_ctx(self) -> BaseRuntimeContext:
+        with self._runtime_ctx_errors():
+            runtime = BaseRuntimeContext.from_raw_config(
+                self.raw_config,
+                global_cli_options=self.global_opts,
+            )
+
+        self._close_parse_cache_on_exit(runtime)
+        return runtime
+
     def _init_runtime_ctx(self) -> RuntimeContext:
-        # TODO: Evaluate Exception catches
-        try:
+        with self._runtime_ctx_errors():
             runtime = RuntimeContext.from_raw_config(
                 self.raw_config,
                 global_cli_options=self.global_opts,
             )
+
+        # This allows us to mask secrets in the logging
+        # by applying it to all the configured handlers
+        for handler in logging.getLogger().handlers:
+            handler.addFilter(runtime.masker)
+
+        self._close_parse_cache_on_exit(runtime)
+        return runtime
+
+    @contextmanager
+    def _runtime_ctx_errors(self) -> Iterator[None]:
+        # TODO: Evaluate Exception catches
+        try:
+            yield
         except NotAReleaseBranch as exc:
             rprint(f"[bold {'red' if self.global_opts.strict else 'orange1'}]{exc!s}")
             # If not strict, exit 0 so other processes can continue. For example, in
@@ -116,9 +179,7 @@ class CliContextObj:
             click.echo(str(exc), err=True)
             self.ctx.exit(1)
 
-        # This allows us to mask secrets in the logging
-        # by applying it to all the configured handlers
-        for handler in logging.getLogger().handlers:
-            handler.addFilter(runtime.masker)
-
-        return runtime
+    def _close_parse_cache_on_exit(self, runtime: BaseRuntimeContext) -> None:
+        # Write out the parsed commits once the command has finished
+        if runtime.parse_cache is not None:
+            self.ctx.call_on_close(runtime.parse_cache.close)
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import json
+import sys
+from contextlib import contextmanager, suppress
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
+
+import click
+from git import Repo
+from rich.console import Console
+from rich.table import Table
+
+import semantic_release
+from semantic_release.changelog.context import make_changelog_context
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.cli.changelog_writer import (
+    generate_release_notes,
+    render_default_changelog_file,
+)
+from semantic_release.cli.const import DEFAULT_RELEASE_NOTES_TPL_FILE, JINJA2_EXTENSION
+from semantic_release.errors import InvalidVersion
+from semantic_release.globals import logger
+from semantic_release.history.snapshot import HistorySnapshot
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Callable, Iterator
+
+    from semantic_release.cli.cli_context import CliContextObj
+    from semantic_release.cli.config import RuntimeContext
+    from semantic_release.version.translator import VersionTranslator
+
+
+class PhaseResult(NamedTuple):
+    name: str
+    seconds: float
+    processed: int = 0
+    unit: str = ""
+
+    @property
+    def rate(self) -> float | None:
+        """Number of processed units per second, if the phase processes any"""
+        if not self.unit or self.seconds <= 0:
+            return None
+        return self.processed / self.seconds
+
+
+class _PhaseTimer:
+    def __init__(self) -> None:
+        self.results: list[PhaseResult] = []
+
+    @contextmanager
+    def phase(self, name: str, unit: str = "") -> Iterator[list[int]]:
+        """
+        Time the body of the ``with`` block as the phase ``name``, the body reports
+        the number of processed units by appending it to the yielded list
+        """
+        counter: list[int] = []
+        logger.info("bench: running phase %r", name)
+        start = perf_counter()
+        yield counter
+        self.results.append(
+            PhaseResult(
+                name=name,
+                seconds=perf_counter() - start,
+                processed=sum(counter),
+                unit=unit,
+            )
+        )
+
+
+def peak_rss() -> int | None:
+    """The peak resident set size of this process in bytes, if the platform reports it"""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover # windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, every other platform kilobytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _render_changelog(runtime: RuntimeContext, release_history: ReleaseHistory) -> int:
+    """
+    Render the changelog templates in memory (nothing is written to disk) &
+    return the number of rendered templates
+    """
+    changelog_context = make_changelog_context(
+        hvcs_client=runtime.hvcs_client,
+        release_history=release_history,
+        mode=runtime.changelog_mode,
+        insertion_flag=runtime.changelog_insertion_flag,
+        prev_changelog_file=runtime.changelog_file,
+        mask_initial_release=runtime.changelog_mask_initial_release,
+    )
+
+    template_dir = runtime.template_dir
+    user_templates = (
+        [
+            str(tpl_file.relative_to(template_dir))
+            for tpl_file in template_dir.rglob(f"*{JINJA2_EXTENSION}")
+            if tpl_file.is_file()
+            and tpl_file != template_dir / DEFAULT_RELEASE_NOTES_TPL_FILE
+            and not any(
+                part.startswith(".")
+                for part in tpl_file.relative_to(template_dir).parts
+            )
+        ]
+        if template_dir.is_dir()
+        else []
+    )
+
+    if not user_templates:
+        render_default_changelog_file(
+            output_format=runtime.changelog_output_format,
+            changelog_context=changelog_context,
+            changelog_style=runtime.changelog_style,
+        )
+        return 1
+
+    template_env = changelog_context.bind_to_environment(runtime.template_environment)
+    for tpl_file in user_templates:
+        template_env.get_template(tpl_file).render()
+
+    return len(user_templates)
+
+
+def _decode_tags(translator: VersionTranslator, tag_names: list[str]) -> int:
+    """
+    Decode the version of every tag name (already listed by the tag scan) & return
+    the number of decoded tags, whether or not they are valid versions
+    """
+    for tag_name in tag_names:
+        with suppress(InvalidVersion, NotImplementedError):
+            translator.from_tag(tag_name)
+    return len(tag_names)
+
+
+def run_benchmark(runtime_loader: Callable[[], RuntimeContext]) -> list[PhaseResult]:
+    """
+    Run every phase of a release against the repository without side effects and
+    return the timings of each phase.
+
+    ``runtime_loader`` is a callable which loads the runtime context, it is timed as
+    the configuration phase.
+    """
+    timer = _PhaseTimer()
+
+    with timer.phase("config load"):
+        runtime = runtime_loader()
+
+    with Repo(str(runtime.repo_dir)) as git_repo:
+        # The parse cache is deliberately not used, the parse phase measures the
+        # actual parsing cost & the cache is left untouched
+        history = HistorySnapshot(
+            repo=git_repo,
+            translator=runtime.version_translator,
+            commit_parser=runtime.commit_parser,
+            parser_workers=runtime.commit_parser_workers,
+            paths=runtime.paths,
+            exclude_paths=runtime.exclude_paths,
+            traversal=runtime.traversal,
+            merge_unit=runtime.traversal_merge_unit,
+        )
+
+        with timer.phase("tag scan", unit="tags") as counter:
+            counter.append(len(history.tags_and_versions))
+            history.historic_tags_and_versions  # noqa: B018 # resolve the merged tags
+
+        tag_names = [tag.name for tag in history.format_tag_records]
+        with timer.phase("tag decode", unit="tags") as counter:
+            counter.append(_decode_tags(runtime.version_translator, tag_names))
+
+        with timer.phase("traversal", unit="commits") as counter:
+            counter.append(len(history.commits))
+
+        with timer.phase("parse", unit="commits") as counter:
+            counter.append(len(history.parse_many(history.commits)))
+
+        with timer.phase("release history", unit="releases") as counter:
+            release_history = ReleaseHistory.from_git_history(
+                repo=git_repo,
+                translator=runtime.version_translator,
+                commit_parser=runtime.commit_parser,
+                exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+                history=history,
+            )
+            counter.append(len(release_history.released))
+
+    with timer.phase("changelog render", unit="templates") as counter:
+        counter.append(_render_changelog(runtime, release_history))
+
+    with timer.phase("release notes render", unit="releases") as counter:
+        if release_history.released:
+            generate_release_notes(
+                runtime.hvcs_client,
+                release_history.released[max(release_history.released)],
+                runtime.template_dir,
+                release_history,
+                style=runtime.changelog_style,
+                mask_initial_release=runtime.changelog_mask_initial_release,
+            )
+            counter.append(1)
+
+    return timer.results
+
+
+def benchmark_report(results: list[PhaseResult]) -> dict[str, Any]:
+    """Summarize the phase results as a JSON serializable report"""
+    by_name = {res.name: res for res in results}
+    traversal = by_name.get("traversal")
+    parse = by_name.get("parse")
+    tag_scan = by_name.get("tag scan")
+    tag_decode = by_name.get("tag decode")
+
+    return {
+        "semantic_release_version": semantic_release.__version__,
+        "python_version": sys.version.split()[0],
+        "total_seconds": sum(res.seconds for res in results),
+        "peak_rss_bytes": peak_rss(),
+        "commits": traversal.processed if traversal else 0,
+        "tags": tag_scan.processed if tag_scan else 0,
+        "commits_per_second": parse.rate if parse else None,
+        "tags_per_second": tag_scan.rate if tag_scan else None,
+        "tags_decoded_per_second": tag_decode.rate if tag_decode else None,
+        "phases": [
+            {
+                "name": res.name,
+                "seconds": res.seconds,
+                "processed": res.processed,
+                "unit": res.unit,
+                "rate": res.rate,
+            }
+            for res in results
+        ],
+    }
+
+
+def _print_table(report: dict[str, Any]) -> None:
+    table = Table(title="semantic-release bench")
+    table.add_column("Phase")
+    table.add_column("Wall time", justify="right")
+    table.add_column("Count", justify="right")
+    table.add_column("Rate", justify="right")
+
+    for phase in report["phases"]:
+        table.add_row(
+            phase["name"],
+            f"{phase['seconds'] * 1000:.1f} ms",
+            f"{phase['processed']} {phase['unit']}" if phase["unit"] else "",
+            f"{phase['rate']:.1f} {phase['unit']}/s" if phase["rate"] else "",
+        )
+
+    table.add_section()
+    table.add_row("total", f"{report['total_seconds'] * 1000:.1f} ms", "", "")
+
+    console = Console()
+    console.print(table)
+    console.print(
+        str.join(
+            ", ",
+            [
+                f"commits/sec (parse): {report['commits_per_second'] or 0:.1f}",
+                f"tags/sec: {report['tags_per_second'] or 0:.1f}",
+                f"tags/sec (decode): {report['tags_decoded_per_second'] or 0:.1f}",
+                "peak RSS: "
+                + (
+                    f"{report['peak_rss_bytes'] / (1024 * 1024):.1f} MiB"
+                    if report["peak_rss_bytes"] is not None
+                    else "unavailable"
+                ),
+            ],
+        )
+    )
+
+
+@click.command(
+    short_help="Profile semantic-release against this repository",
+    context_settings={
+        "help_option_names": ["-h", "--help"],
+    },
+)
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json"], case_sensitive=False),
+    default="table",
+    show_default=True,
+    help="Output the measurements as a table or as JSON",
+)
+@click.pass_obj
+def bench(cli_ctx: CliContextObj, output_format: str) -> None:
+    """
+    Time every phase of a release (configuration load, tag scan & decoding, commit
+    traversal, commit parsing, release history, changelog & release notes rendering)
+    against the current repository. Nothing is written, tagged, committed or pushed.
+    """
+    report = benchmark_report(run_benchmark(lambda: cli_ctx.runtime_ctx))
+
+    if output_format.lower() == "json":
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    _print_table(report)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,6 +14,8 @@ from semantic_release.cli.changelog_writer import (
 )
 from semantic_release.cli.util import noop_report
 from semantic_release.globals import logger
+from semantic_release.history.partial import is_partial_clone
+from semantic_release.history.snapshot import HistorySnapshot
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -30,15 +31,29 @@ def get_license_name_for_release(tag_name: str, project_root: Path) -> str:
         for dir_path in [curr_dir, *curr_dir.parents]
         if str(project_root) in str(dir_path)
     ]
+    with Repo(project_root) as git_repo:
+        # The files of a release tag would have to be fetched from the promisor
+        # remote of a partial clone, the checked out files are used instead
+        from_worktree = is_partial_clone(git_repo)
+
     for allowed_dir in allowed_directories:
         proj_toml = allowed_dir.joinpath("pyproject.toml")
-        with Repo(project_root) as git_repo, suppress(GitCommandError):
-            toml_contents = git_repo.git.show(
-                f"{tag_name}:{proj_toml.relative_to(project_root)}"
-            )
-            config_toml = tomlkit.parse(toml_contents)
-            project_metadata = config_toml.unwrap().get("project", project_metadata)
-            break
+        if from_worktree:
+            if not proj_toml.exists():
+                continue
+            toml_contents = proj_toml.read_text(encoding="utf-8")
+        else:
+            try:
+                with Repo(project_root) as git_repo:
+                    toml_contents = git_repo.git.show(
+                        f"{tag_name}:{proj_toml.relative_to(project_root)}"
+                    )
+            except GitCommandError:
+                continue
+
+        config_toml = tomlkit.parse(toml_contents)
+        project_metadata = config_toml.unwrap().get("project", project_metadata)
+        break
 
     license_cfg = project_metadata.get(
         "license-expression",
@@ -112,6 +127,18 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
             translator=translator,
             commit_parser=runtime.commit_parser,
             exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+            history=HistorySnapshot(
+                repo=git_repo,
+                translator=translator,
+                commit_parser=runtime.commit_parser,
+                parse_cache=runtime.parse_cache,
+                parser_workers=runtime.commit_parser_workers,
+                paths=runtime.paths,
+                exclude_paths=runtime.exclude_paths,
+                traversal=runtime.traversal,
+                merge_unit=runtime.traversal_merge_unit,
+                shallow_history=runtime.shallow_history(git_repo),
+            ),
         )
 
     write_changelog_files(
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import json
+from re import compile as regexp
+from typing import TYPE_CHECKING, NamedTuple
+
+import click
+from git import Repo
+from rich.console import Console
+from rich.table import Table
+
+from semantic_release.cli.config import BranchConfig
+from semantic_release.globals import logger
+from semantic_release.history.snapshot import HistorySnapshot
+from semantic_release.version.algorithm import next_version
+from semantic_release.version.translator import VersionTranslator
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Iterable
+
+    from semantic_release.cli.cli_context import CliContextObj
+    from semantic_release.cli.config import BaseRuntimeContext
+    from semantic_release.version.version import Version
+
+
+class BranchVersion(NamedTuple):
+    """The next version of a single branch head of a release channel"""
+
+    channel: str
+    branch: str
+    commit: str
+    version: Version
+    released: bool
+
+
+def branch_heads(repo: Repo, remote_name: str) -> dict[str, str]:
+    """
+    Map the name of every branch to its ref: the local branches and the
+    remote-tracking branches of ``remote_name`` which have no local branch
+    """
+    remote_prefix = f"refs/remotes/{remote_name}/"
+    heads: dict[str, str] = {}
+
+    # git sorts by refname, so local branches take precedence over remote ones
+    for ref in repo.git.for_each_ref(
+        "refs/heads", remote_prefix.rstrip("/"), format="%(refname)"
+    ).splitlines():
+        if ref.startswith("refs/heads/"):
+            heads[ref[len("refs/heads/") :]] = ref
+        elif (name := ref[len(remote_prefix) :]) != "HEAD":
+            heads.setdefault(name, ref)
+
+    return heads
+
+
+def assign_channels(
+    channels: dict[str, BranchConfig], branch_names: Iterable[str]
+) -> dict[str, list[str]]:
+    """
+    Map every channel to the branches it releases from. Like a release from the
+    branch itself, each branch belongs to the first channel whose pattern matches.
+    """
+    patterns = {name: regexp(config.match) for name, config in channels.items()}
+    assigned: dict[str, list[str]] = {name: [] for name in channels}
+
+    for branch in branch_names:
+        if channel := next(
+            (name for name, pattern in patterns.items() if pattern.match(branch)), None
+        ):
+            assigned[channel].append(branch)
+
+    return assigned
+
+
+def evaluate_channels(
+    repo: Repo,
+    runtime: BaseRuntimeContext,
+    channels: dict[str, BranchConfig],
+    remote_name: str,
+) -> list[BranchVersion]:
+    """
+    Determine the next version of every branch head of every channel.
+
+    The tags are resolved once and every commit is parsed at most once for all
+    branches, each channel only differs by its prerelease settings.
+    """
+    history = HistorySnapshot(
+        repo=repo,
+        translator=runtime.version_translator,
+        commit_parser=runtime.commit_parser,
+        parse_cache=runtime.parse_cache,
+        parser_workers=runtime.commit_parser_workers,
+        paths=runtime.paths,
+        exclude_paths=runtime.exclude_paths,
+        traversal=runtime.traversal,
+        merge_unit=runtime.traversal_merge_unit,
+        shallow_history=runtime.shallow_history(repo),
+    )
+    # Resolve the tags before deriving the snapshot of each branch so they share them
+    history.tags_and_versions  # noqa: B018
+
+    heads = branch_heads(repo, remote_name)
+    results: list[BranchVersion] = []
+
+    for channel, branches in assign_channels(channels, heads).items():
+        channel_config = channels[channel]
+        translator = VersionTranslator(
+            tag_format=runtime.version_translator.tag_format,
+            prerelease_token=channel_config.prerelease_token,
+        )
+
+        for branch in branches:
+            logger.info("evaluating branch %r of channel %r", branch, channel)
+            branch_history = history.derive(heads[branch], translator=translator)
+            new_version = next_version(
+                repo=repo,
+                translator=translator,
+                commit_parser=runtime.commit_parser,
+                allow_zero_version=runtime.allow_zero_version,
+                major_on_zero=runtime.major_on_zero,
+                prerelease=channel_config.prerelease,
+                history=branch_history,
+            )
+            results.append(
+                BranchVersion(
+                    channel=channel,
+                    branch=branch,
+                    commit=branch_history.head_commit.hexsha,
+                    version=new_version,
+                    released=new_version in history.released_versions,
+                )
+            )
+
+    return results
+
+
+def channels_report(
+    channels: dict[str, BranchConfig], results: list[BranchVersion]
+) -> dict[str, Any]:
+    """Summarize the results per channel as a JSON serializable report"""
+    return {
+        "channels": [
+            {
+                "name": name,
+                "match": config.match,
+                "prerelease": config.prerelease,
+                "prerelease_token": config.prerelease_token,
+                "branches": [
+                    {
+                        "branch": res.branch,
+                        "commit": res.commit,
+                        "version": str(res.version),
+                        "tag": res.version.as_tag(),
+                        "released": res.released,
+                    }
+                    for res in results
+                    if res.channel == name
+                ],
+            }
+            for name, config in channels.items()
+        ]
+    }
+
+
+def _print_table(report: dict[str, Any]) -> None:
+    table = Table(title="semantic-release channels")
+    table.add_column("Channel")
+    table.add_column("Branch")
+    table.add_column("Next version")
+    table.add_column("Released")
+
+    for channel in report["channels"]:
+        if not channel["branches"]:
+            table.add_row(channel["name"], "[dim]no matching branch[/dim]", "", "")
+
+        for branch in channel["branches"]:
+            table.add_row(
+                channel["name"],
+                branch["branch"],
+                branch["version"],
+                "yes" if branch["released"] else "no",
+            )
+
+    Console().print(table)
+
+
+@click.command(
+    short_help="Print the next version of every release channel",
+    context_settings={
+        "help_option_names": ["-h", "--help"],
+    },
+)
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json"], case_sensitive=False),
+    default="table",
+    show_default=True,
+    help="Output the next versions as a table or as JSON",
+)
+@click.pass_obj
+def channels(cli_ctx: CliContextObj, output_format: str) -> None:
+    """
+    Determine the next version of every branch which matches one of the release
+    groups configured in "branches", i.e. of every release channel, in one run.
+    The local branches and the remote-tracking branches of the configured remote
+    are evaluated, nothing needs to be checked out.
+    """
+    ctx = click.get_current_context()
+    config = cli_ctx.raw_config
+
+    # Only the part of the runtime context which does not depend on the release
+    # group is used, the prerelease settings are applied per channel
+    runtime = cli_ctx.base_runtime_ctx_for(
+        next(iter(config.branches.values()), BranchConfig())
+    )
+    git_repo = ctx.with_resource(Repo(str(runtime.repo_dir)))
+
+    report = channels_report(
+        config.branches,
+        evaluate_channels(
+            git_repo,
+            runtime,
+            channels=config.branches,
+            remote_name=config.remote.name,
+        ),
+    )
+
+    if output_format.lower() == "json":
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    _print_table(report)
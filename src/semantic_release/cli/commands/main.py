@@ -11,8 +11,6 @@ from rich.logging import RichHandler
 
 import semantic_release
 from semantic_release import globals
-from semantic_release.cli.cli_context import CliContextObj
-from semantic_release.cli.config import GlobalCommandLineOptions
 from semantic_release.cli.const import DEFAULT_CONFIG_FILE
 from semantic_release.cli.util import rprint
 from semantic_release.enums import SemanticReleaseLogLevels
@@ -37,10 +35,14 @@ class Cli(click.MultiCommand):
         """Subcommand import definitions"""
 
         # SUBCMD_FUNCTION_NAME => MODULE_WITH_FUNCTION
+        BENCH = f"{__package__}.bench"
         CHANGELOG = f"{__package__}.changelog"
+        CHANNELS = f"{__package__}.channels"
         GENERATE_CONFIG = f"{__package__}.generate_config"
         VERSION = f"{__package__}.version"
+        PACKAGES = f"{__package__}.packages"
         PUBLISH = f"{__package__}.publish"
+        SERVE = f"{__package__}.serve"
 
     def list_commands(self, _ctx: click.Context) -> list[str]:
         # Used for shell-completion
@@ -94,6 +96,34 @@ class Cli(click.MultiCommand):
     default=False,
     help="Enable strict mode",
 )
+@click.option(
+    "--cache-dir",
+    "cache_dir",
+    default=None,
+    help="Cache parsed commits in this directory between runs",
+    type=click.Path(file_okay=False),
+)
+@click.option(
+    "-j",
+    "--jobs",
+    "jobs",
+    default=None,
+    help="Number of processes used to parse commits (0 for one per CPU)",
+    type=click.IntRange(min=0),
+)
+@click.option(
+    "--first-parent",
+    "first_parent",
+    is_flag=True,
+    default=False,
+    help="Only evaluate the mainline, i.e. the first parent of every merge commit",
+)
+@click.option(
+    "--package",
+    "package",
+    default=None,
+    help="Release the given package of the configured monorepo packages",
+)
 @click.pass_context
 def main(
     ctx: click.Context,
@@ -101,6 +131,10 @@ def main(
     verbosity: int = 0,
     noop: bool = False,
     strict: bool = False,
+    cache_dir: str | None = None,
+    jobs: int | None = None,
+    package: str | None = None,
+    first_parent: bool = False,
 ) -> None:
     """
     Python Semantic Release
@@ -113,6 +147,11 @@ def main(
 
     For more information, visit https://python-semantic-release.readthedocs.io/
     """
+    # Imported here rather than at module level, so that e.g. `--help` & `--version`
+    # return without loading the configuration machinery (pydantic, GitPython, ...)
+    from semantic_release.cli.cli_context import CliContextObj
+    from semantic_release.cli.config import GlobalCommandLineOptions
+
     globals.log_level = LOG_LEVELS[verbosity]
 
     # Set up our pretty console formatter
@@ -136,7 +175,14 @@ def main(
         )
 
     cli_options = GlobalCommandLineOptions(
-        noop=noop, verbosity=verbosity, config_file=config_file, strict=strict
+        noop=noop,
+        verbosity=verbosity,
+        config_file=config_file,
+        strict=strict,
+        cache_dir=cache_dir,
+        jobs=jobs,
+        package=package,
+        first_parent=first_parent,
     )
 
     logger.debug("global cli options: %s", cli_options)
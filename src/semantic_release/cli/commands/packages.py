@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, NamedTuple
+
+import click
+from git import Repo
+from rich.console import Console
+from rich.table import Table
+
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.globals import logger
+from semantic_release.history.snapshot import HistorySnapshot
+from semantic_release.version.algorithm import next_version
+from semantic_release.version.translator import VersionTranslator
+
+if TYPE_CHECKING:  # pragma: no cover
+    from re import Pattern
+    from typing import Any, Iterable
+
+    from semantic_release.cli.cli_context import CliContextObj
+    from semantic_release.cli.config import BaseRuntimeContext, PackageConfig
+    from semantic_release.version.version import Version
+
+
+class PackageVersion(NamedTuple):
+    """The next version & release history of a single package of a monorepo"""
+
+    package: str
+    config: PackageConfig
+    version: Version
+    released: bool
+    release_history: ReleaseHistory
+
+
+def _evaluate_package(
+    repo: Repo,
+    runtime: BaseRuntimeContext,
+    package: str,
+    config: PackageConfig,
+    history: HistorySnapshot,
+    exclude_commit_patterns: Iterable[Pattern[str]],
+) -> PackageVersion:
+    logger.info("evaluating package %r", package)
+    new_version = next_version(
+        repo=repo,
+        translator=history.translator,
+        commit_parser=runtime.commit_parser,
+        allow_zero_version=runtime.allow_zero_version,
+        major_on_zero=runtime.major_on_zero,
+        prerelease=runtime.prerelease,
+        history=history,
+    )
+    return PackageVersion(
+        package=package,
+        config=config,
+        version=new_version,
+        released=new_version in history.released_versions,
+        release_history=ReleaseHistory.from_git_history(
+            repo=repo,
+            translator=history.translator,
+            commit_parser=runtime.commit_parser,
+            exclude_commit_patterns=exclude_commit_patterns,
+            history=history,
+        ),
+    )
+
+
+def evaluate_packages(
+    repo: Repo,
+    runtime: BaseRuntimeContext,
+    packages: dict[str, PackageConfig],
+    exclude_commit_patterns: Iterable[Pattern[str]] = (),
+) -> list[PackageVersion]:
+    """
+    Determine the next version & the release history of every package.
+
+    The tags are read, the history is walked, the paths changed by each commit are
+    indexed and every commit is parsed once for all packages. Each package
+    then only filters the shared results by its own path & tag format.
+
+    The packages are evaluated one after the other on the calling thread, as they
+    read & write the tag index & version checkpoints of the shared parse cache,
+    whose database connection cannot be used from other threads.
+    """
+    history = HistorySnapshot(
+        repo=repo,
+        translator=runtime.version_translator,
+        commit_parser=runtime.commit_parser,
+        parse_cache=runtime.parse_cache,
+        parser_workers=runtime.commit_parser_workers,
+        exclude_paths=runtime.exclude_paths,
+        traversal=runtime.traversal,
+        merge_unit=runtime.traversal_merge_unit,
+        shallow_history=runtime.shallow_history(repo),
+    )
+    # Resolve everything the packages share before deriving their snapshots
+    history.historic_tags_and_versions  # noqa: B018
+    history.head_commit  # noqa: B018
+    history.path_index.load(commit.hexsha for commit in history.commits)
+
+    package_histories = {
+        package: history.derive(
+            history.rev,
+            translator=VersionTranslator(
+                tag_format=config.tag_format,
+                prerelease_token=runtime.version_translator.prerelease_token,
+            ),
+            paths=[config.path],
+        )
+        for package, config in packages.items()
+    }
+    history.parse_many(
+        [
+            commit
+            for commit in history.commits
+            if any(
+                package_history.is_relevant(commit)
+                for package_history in package_histories.values()
+            )
+        ]
+    )
+
+    return [
+        _evaluate_package(
+            repo,
+            runtime,
+            package,
+            config,
+            package_histories[package],
+            exclude_commit_patterns,
+        )
+        for package, config in packages.items()
+    ]
+
+
+def packages_report(results: list[PackageVersion]) -> dict[str, Any]:
+    """Summarize the results per package as a JSON serializable report"""
+    return {
+        "packages": [
+            {
+                "name": res.package,
+                "path": res.config.path,
+                "tag_format": res.config.tag_format,
+                "version": str(res.version),
+                "tag": res.version.as_tag(),
+                "released": res.released,
+                "unreleased_changes": sum(
+                    len(changes) for changes in res.release_history.unreleased.values()
+                ),
+            }
+            for res in results
+        ]
+    }
+
+
+def _print_table(report: dict[str, Any]) -> None:
+    table = Table(title="semantic-release packages")
+    table.add_column("Package")
+    table.add_column("Path")
+    table.add_column("Next version")
+    table.add_column("Tag")
+    table.add_column("Released")
+    table.add_column("Unreleased changes", justify="right")
+
+    for package in report["packages"]:
+        table.add_row(
+            package["name"],
+            package["path"],
+            package["version"],
+            package["tag"],
+            "yes" if package["released"] else "no",
+            str(package["unreleased_changes"]),
+        )
+
+    Console().print(table)
+
+
+@click.command(
+    short_help="Print the next version of every package of a monorepo",
+    context_settings={
+        "help_option_names": ["-h", "--help"],
+    },
+)
+@click.option(
+    "-f",
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json"], case_sensitive=False),
+    default="table",
+    show_default=True,
+    help="Output the next versions as a table or as JSON",
+)
+@click.pass_obj
+def packages(cli_ctx: CliContextObj, output_format: str) -> None:
+    """
+    Determine the next version of every package configured in "packages" in one
+    run. Each package only considers the commits which change its "path" and the
+    tags which match its "tag_format".
+
+    To release a single package, select it with the global "--package" option,
+    e.g. semantic-release --package NAME version.
+    """
+    ctx = click.get_current_context()
+    config = cli_ctx.raw_config
+
+    if not config.packages:
+        click.echo("No packages are configured", err=True)
+        ctx.exit(1)
+
+    runtime = cli_ctx.runtime_ctx
+    git_repo = ctx.with_resource(Repo(str(runtime.repo_dir)))
+
+    report = packages_report(
+        evaluate_packages(
+            git_repo,
+            runtime,
+            packages=config.packages,
+            exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+        )
+    )
+
+    if output_format.lower() == "json":
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    _print_table(report)
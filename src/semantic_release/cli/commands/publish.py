@@ -7,8 +7,8 @@ from git import Repo
 
 from semantic_release.cli.util import noop_report
 from semantic_release.globals import logger
+from semantic_release.history.tags import iter_tag_records, tags_and_versions
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
-from semantic_release.version.algorithm import tags_and_versions
 
 if TYPE_CHECKING:  # pragma: no cover
     from semantic_release.cli.cli_context import CliContextObj
@@ -60,11 +60,11 @@ def publish(cli_ctx: CliContextObj, tag: str) -> None:
     dist_glob_patterns = runtime.dist_glob_patterns
 
     with Repo(str(runtime.repo_dir)) as git_repo:
-        repo_tags = git_repo.tags
+        repo_tags = list(iter_tag_records(git_repo))
 
     if tag == "latest":
         try:
-            tag = str(tags_and_versions(repo_tags, translator)[0][0])
+            tag = tags_and_versions(repo_tags, translator)[0][0].name
         except IndexError:
             click.echo(
                 str.join(
@@ -0,0 +1,425 @@
+from __future__ import annotations
+
+import json
+import socket
+import socketserver
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+from git import Repo
+
+import semantic_release
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.cli.changelog_writer import generate_release_notes
+from semantic_release.cli.commands.changelog import get_license_name_for_release
+from semantic_release.globals import logger
+from semantic_release.history.snapshot import HistorySnapshot
+from semantic_release.history.tags import iter_tag_records, tag_format_patterns
+from semantic_release.version.algorithm import next_version
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any, Callable
+
+    from semantic_release.cli.cli_context import CliContextObj
+    from semantic_release.cli.config import RuntimeContext
+    from semantic_release.history.tags import TagRecord
+    from semantic_release.version.version import Version
+
+
+DEFAULT_SOCKET_FILE = ".semantic-release.sock"
+
+# The daemon listens on a Unix socket, which is not available on every platform
+# (e.g. Windows)
+SUPPORTS_UNIX_SOCKETS = hasattr(socket, "AF_UNIX")
+
+# Snapshots of this many commits are kept warm, the least recently used is dropped
+_MAX_SNAPSHOTS = 32
+
+
+class WarmRepository:
+    """
+    The state of a repository which is kept in memory between queries: the open
+    repository, the tag index, the parsed commits and the results of previous
+    queries.
+
+    Before every query the commit of the queried ref and the tags of the tag format
+    are compared with the known state. A new commit only resolves the history of the
+    new commit, commits which have been parsed before are never parsed again. New,
+    moved or deleted tags rebuild the tag index, but only drop the results of the
+    commits whose history held a deleted or moved tag or holds a new one. Whether a
+    version has been released is checked against the current tags on every query.
+    The results of newly parsed commits are written to the parse cache after the
+    query which parsed them.
+    """
+
+    def __init__(self, repo: Repo, runtime: RuntimeContext) -> None:
+        self.repo = repo
+        self.runtime = runtime
+        self._tag_records: dict[str, TagRecord] | None = None
+        self._root = HistorySnapshot(
+            repo=repo,
+            translator=runtime.version_translator,
+            commit_parser=runtime.commit_parser,
+            parse_cache=runtime.parse_cache,
+            parser_workers=runtime.commit_parser_workers,
+            paths=runtime.paths,
+            exclude_paths=runtime.exclude_paths,
+            traversal=runtime.traversal,
+            merge_unit=runtime.traversal_merge_unit,
+            shallow_history=runtime.shallow_history(repo),
+        )
+        self._snapshots: dict[str, HistorySnapshot] = {}
+        self._results: dict[tuple[str, ...], dict[str, Any]] = {}
+
+    def snapshot(self, ref: str) -> HistorySnapshot:
+        """The history snapshot of the commit ``ref`` currently points to"""
+        commit_sha = self.repo.git.rev_parse("--verify", f"{ref}^{{commit}}")
+
+        tag_records = {
+            tag.name: tag
+            for tag in iter_tag_records(
+                self.repo,
+                *tag_format_patterns(self.runtime.version_translator.tag_format),
+            )
+        }
+        if self._tag_records is None:
+            self._tag_records = tag_records
+        elif tag_records != self._tag_records:
+            self._update_tags(tag_records)
+
+        if (snapshot := self._snapshots.pop(commit_sha, None)) is None:
+            logger.info("loading the history of %s (%s)", ref, commit_sha)
+            snapshot = self._root.derive(commit_sha)
+
+        # Re-insert to mark the snapshot as most recently used
+        self._snapshots[commit_sha] = snapshot
+        while len(self._snapshots) > _MAX_SNAPSHOTS:
+            del self._snapshots[next(iter(self._snapshots))]
+
+        return snapshot
+
+    def _update_tags(self, tag_records: dict[str, TagRecord]) -> None:
+        """
+        Rebuild the tag index & drop the snapshots (and their results) whose history
+        is affected by the tags which are new, moved or deleted since the last query
+        """
+        known_records = self._tag_records or {}
+        removed = [
+            tag for name, tag in known_records.items() if tag_records.get(name) != tag
+        ]
+        added = [
+            tag
+            for name, tag in tag_records.items()
+            if known_records.get(name) != tag
+            and tag.commit_sha
+            and self.runtime.version_translator.from_tag(name) is not None
+        ]
+        logger.info(
+            "tags have changed (%s added, %s removed), rebuilding the tag index",
+            len(added),
+            len(removed),
+        )
+
+        self._root = self._root.derive(self._root.rev, reuse_tags=False)
+        # Resolve the tag index once, every snapshot derived from the root shares it
+        self._root.tags_and_versions  # noqa: B018
+        self._tag_records = tag_records
+
+        evaluated = {key[1] for key in self._results}
+        for commit_sha, snapshot in list(self._snapshots.items()):
+            # The tags of a snapshot which answered a query are resolved, the tags
+            # which are not in its history do not change its results
+            if commit_sha in evaluated and not self._tags_changed_history(
+                snapshot, removed, added
+            ):
+                continue
+
+            logger.debug("dropping the results of %s", commit_sha)
+            del self._snapshots[commit_sha]
+
+        self._results = {
+            key: result
+            for key, result in self._results.items()
+            if key[1] in self._snapshots
+        }
+
+    def _tags_changed_history(
+        self,
+        snapshot: HistorySnapshot,
+        removed: list[TagRecord],
+        added: list[TagRecord],
+    ) -> bool:
+        historic_tags = {tag.name for tag, _ in snapshot.historic_tags_and_versions}
+        return any(tag.name in historic_tags for tag in removed) or any(
+            snapshot.is_ancestor(tag.commit_sha, snapshot.rev) for tag in added
+        )
+
+    def next_version(
+        self, ref: str = "HEAD", prerelease: bool | None = None
+    ) -> dict[str, Any]:
+        history = self.snapshot(ref)
+        prerelease = self.runtime.prerelease if prerelease is None else prerelease
+
+        key = ("next_version", history.rev, str(prerelease))
+        if (result := self._results.get(key)) is None:
+            new_version = self._next_version(history, prerelease)
+            result = self._results[key] = {
+                "commit": history.rev,
+                "version": str(new_version),
+                "tag": new_version.as_tag(),
+            }
+
+        # Whether the version is released depends on every tag rather than only on
+        # the tags in the history of the commit, it is not part of the results
+        released = (
+            self.runtime.version_translator.from_string(result["version"])
+            in self._root.released_versions
+        )
+        return {"ref": ref, **result, "released": released}
+
+    def release_notes(
+        self,
+        ref: str = "HEAD",
+        version: str | None = None,
+        prerelease: bool | None = None,
+    ) -> dict[str, Any]:
+        """
+        The release notes of the released ``version``, or of the next version of
+        ``ref`` when no version is given
+        """
+        history = self.snapshot(ref)
+        prerelease = self.runtime.prerelease if prerelease is None else prerelease
+
+        key = ("release_notes", history.rev, str(prerelease), version or "")
+        if (result := self._results.get(key)) is None:
+            result = self._results[key] = self._release_notes(
+                history, version, prerelease
+            )
+
+        return {"ref": ref, **result}
+
+    def _next_version(self, history: HistorySnapshot, prerelease: bool) -> Version:
+        return next_version(
+            repo=self.repo,
+            translator=self.runtime.version_translator,
+            commit_parser=self.runtime.commit_parser,
+            prerelease=prerelease,
+            major_on_zero=self.runtime.major_on_zero,
+            allow_zero_version=self.runtime.allow_zero_version,
+            history=history,
+        )
+
+    def _release_notes(
+        self, history: HistorySnapshot, version: str | None, prerelease: bool
+    ) -> dict[str, Any]:
+        runtime = self.runtime
+        release_history = ReleaseHistory.from_git_history(
+            repo=self.repo,
+            translator=runtime.version_translator,
+            commit_parser=runtime.commit_parser,
+            exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+            history=history,
+        )
+
+        if version is not None:
+            release_version = runtime.version_translator.from_string(version)
+            if release_version not in release_history.released:
+                raise ValueError(f"{version} has not been released from {history.rev}")
+            license_name = get_license_name_for_release(
+                tag_name=release_version.as_tag(),
+                project_root=runtime.repo_dir,
+            )
+        else:
+            release_version = self._next_version(history, prerelease)
+            if release_version not in release_history.released:
+                release_history = release_history.release(
+                    release_version,
+                    tagger=runtime.commit_author,
+                    committer=runtime.commit_author,
+                    tagged_date=datetime.now(timezone.utc).astimezone(),
+                )
+            license_name = get_license_name_for_release(
+                tag_name=history.rev,
+                project_root=runtime.repo_dir,
+            )
+
+        return {
+            "commit": history.rev,
+            "version": str(release_version),
+            "tag": release_version.as_tag(),
+            "release_notes": generate_release_notes(
+                runtime.hvcs_client,
+                release=release_history.released[release_version],
+                template_dir=runtime.template_dir,
+                history=release_history,
+                style=runtime.changelog_style,
+                mask_initial_release=runtime.changelog_mask_initial_release,
+                license_name=license_name,
+            ),
+        }
+
+    def _dispatch(self, method: Any, params: Any) -> dict[str, Any]:
+        handlers: dict[str, Callable[..., dict[str, Any]]] = {
+            "ping": lambda: {"semantic_release_version": semantic_release.__version__},
+            "next_version": self.next_version,
+            "release_notes": self.release_notes,
+        }
+
+        if method not in handlers:
+            raise ValueError(f"Unknown method {method!r}")
+
+        if not isinstance(params, dict):
+            raise TypeError("params must be a JSON object")
+
+        return handlers[method](**params)
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer a single request of the JSON protocol"""
+        method = request.get("method")
+        params = request.get("params") or {}
+        response: dict[str, Any] = {"id": request.get("id")}
+        parse_cache = self.runtime.parse_cache
+        misses = parse_cache.stats.misses if parse_cache is not None else 0
+
+        try:
+            response["result"] = self._dispatch(method, params)
+        except Exception as err:  # noqa: BLE001 # reported to the client
+            logger.warning("%s request failed: %s", method, err)
+            response["error"] = {"type": type(err).__name__, "message": str(err)}
+
+        # Write out the results of newly parsed commits right away, the daemon may
+        # run for a long time & is not guaranteed to shut down cleanly
+        if parse_cache is not None and parse_cache.stats.misses > misses:
+            parse_cache.flush()
+
+        return response
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: QueryServer
+
+    def handle(self) -> None:
+        # One JSON request per line, each answered with one JSON response line
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            try:
+                request = json.loads(line)
+            except ValueError as err:
+                request = None
+                response = {
+                    "id": None,
+                    "error": {"type": type(err).__name__, "message": str(err)},
+                }
+
+            if isinstance(request, dict):
+                if request.get("method") == "shutdown":
+                    response = {"id": request.get("id"), "result": {}}
+                    self.server.shutdown_requested = True
+                else:
+                    response = self.server.warm_repo.handle(request)
+            elif request is not None:
+                response = {
+                    "id": None,
+                    "error": {
+                        "type": "TypeError",
+                        "message": "request must be a JSON object",
+                    },
+                }
+
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+            if self.server.shutdown_requested:
+                # shutdown() blocks until serve_forever() returns, so it cannot be
+                # called from the thread which is serving this request
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+if SUPPORTS_UNIX_SOCKETS or TYPE_CHECKING:
+
+    class QueryServer(socketserver.UnixStreamServer):
+        """
+        Answers queries about a warm repository over a local Unix socket.
+
+        Connections are served one after another, so the repository state is never
+        accessed concurrently.
+        """
+
+        def __init__(self, socket_file: Path, warm_repo: WarmRepository) -> None:
+            self.warm_repo = warm_repo
+            self.shutdown_requested = False
+            super().__init__(str(socket_file), _RequestHandler)
+
+
+def _remove_stale_socket(socket_file: Path) -> None:
+    """Remove a socket file left behind by a daemon which did not shut down"""
+    if not socket_file.exists():
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_file))
+        except OSError:
+            logger.info("removing stale socket file %s", socket_file)
+            socket_file.unlink()
+            return
+
+    raise click.UsageError(f"Another daemon is already listening on {socket_file}")
+
+
+@click.command(
+    short_help="Answer version queries from a long-running daemon",
+    context_settings={
+        "help_option_names": ["-h", "--help"],
+    },
+    hidden=not SUPPORTS_UNIX_SOCKETS,
+)
+@click.option(
+    "--socket",
+    "socket_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_SOCKET_FILE,
+    show_default=True,
+    help="Path of the Unix socket to listen on",
+)
+@click.pass_obj
+def serve(cli_ctx: CliContextObj, socket_file: Path) -> None:
+    """
+    Keep the repository, its tags & parsed commits in memory and answer next version
+    and release notes queries over a local Unix socket.
+
+    Each request is a JSON object on a single line, e.g.
+    {"id": 1, "method": "next_version", "params": {"ref": "main"}}, which is
+    answered with a single line JSON object holding either a "result" or an
+    "error". The methods are "ping", "next_version" (params: ref, prerelease),
+    "release_notes" (params: ref, version, prerelease) and "shutdown".
+
+    New commits and tags are picked up on the next query, changes to the
+    configuration require a restart.
+    """
+    ctx = click.get_current_context()
+
+    if not SUPPORTS_UNIX_SOCKETS:
+        click.echo("Unix sockets are not supported on this platform", err=True)
+        ctx.exit(1)
+
+    runtime = cli_ctx.runtime_ctx
+    git_repo = ctx.with_resource(Repo(str(runtime.repo_dir)))
+
+    _remove_stale_socket(socket_file)
+    server = ctx.with_resource(
+        QueryServer(socket_file, WarmRepository(git_repo, runtime))
+    )
+    ctx.call_on_close(lambda: socket_file.unlink(missing_ok=True))
+
+    click.echo(f"Listening on {socket_file}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("interrupted, shutting down")
@@ -4,13 +4,15 @@ import os
 import subprocess
 import sys
 from collections import defaultdict
+from copy import copy
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import click
 import shellingham  # type: ignore[import]
 from click_option_group import MutuallyExclusiveOptionGroup, optgroup
-from git import Repo
+from git import GitCommandError, Repo
 from requests import HTTPError
 
 from semantic_release.changelog.release_history import ReleaseHistory
@@ -18,6 +20,7 @@ from semantic_release.cli.changelog_writer import (
     generate_release_notes,
     write_changelog_files,
 )
+from semantic_release.cli.config import load_parse_cache
 from semantic_release.cli.github_actions_output import VersionGitHubActionsOutput
 from semantic_release.cli.util import noop_report, rprint
 from semantic_release.const import DEFAULT_SHELL, DEFAULT_VERSION
@@ -30,20 +33,23 @@ from semantic_release.errors import (
 )
 from semantic_release.gitproject import GitProject
 from semantic_release.globals import logger
-from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
-from semantic_release.version.algorithm import (
-    next_version,
+from semantic_release.history.snapshot import HistorySnapshot
+from semantic_release.history.tags import (
+    indexed_tags_and_versions,
+    iter_tag_records,
+    tag_format_patterns,
     tags_and_versions,
 )
+from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+from semantic_release.version.algorithm import next_version, next_versions
 from semantic_release.version.translator import VersionTranslator
 
 if TYPE_CHECKING:  # pragma: no cover
-    from pathlib import Path
     from typing import Mapping, Sequence
 
-    from git.refs.tag import Tag
-
     from semantic_release.cli.cli_context import CliContextObj
+    from semantic_release.history.parse_cache import ParseCache
+    from semantic_release.history.tags import TagRecord
     from semantic_release.version.declaration import IVersionReplacer
     from semantic_release.version.version import Version
 
@@ -71,20 +77,44 @@ def is_forced_prerelease(
     )
 
 
-def last_released(repo_dir: Path, tag_format: str) -> tuple[Tag, Version] | None:
+def last_released(
+    repo_dir: Path,
+    tag_format: str,
+    parse_cache: ParseCache | None = None,
+) -> tuple[TagRecord, Version] | None:
     with Repo(str(repo_dir)) as git_repo:
-        ts_and_vs = tags_and_versions(
-            git_repo.tags, VersionTranslator(tag_format=tag_format)
+        ts_and_vs = indexed_tags_and_versions(
+            list(iter_tag_records(git_repo, *tag_format_patterns(tag_format))),
+            VersionTranslator(tag_format=tag_format),
+            parse_cache,
         )
 
     return ts_and_vs[0] if ts_and_vs else None
 
 
+def is_commit_ish(repo: Repo, ref: str) -> bool:
+    """Whether ``ref`` resolves to a commit in ``repo``"""
+    try:
+        repo.git.rev_parse("--verify", "--quiet", f"{ref}^{{commit}}")
+    except GitCommandError:
+        return False
+    return True
+
+
 def version_from_forced_level(
-    repo_dir: Path, forced_level_bump: LevelBump, translator: VersionTranslator
+    repo_dir: Path,
+    forced_level_bump: LevelBump,
+    translator: VersionTranslator,
+    history: HistorySnapshot | None = None,
 ) -> Version:
-    with Repo(str(repo_dir)) as git_repo:
-        ts_and_vs = tags_and_versions(git_repo.tags, translator)
+    if history is not None:
+        ts_and_vs = history.tags_and_versions
+    else:
+        with Repo(str(repo_dir)) as git_repo:
+            ts_and_vs = tags_and_versions(
+                iter_tag_records(git_repo, *tag_format_patterns(translator.tag_format)),
+                translator,
+            )
 
     # If we have no tags, return the default version
     if not ts_and_vs:
@@ -320,6 +350,18 @@ def build_distributions(
     is_flag=True,
     help="Print the last released version tag and exit",
 )
+@click.option(
+    "--ref",
+    "refs",
+    multiple=True,
+    help=str.join(
+        " ",
+        [
+            "Print the next version of this git ref instead of the checked out branch,",
+            "may be given multiple times (requires --print or --print-tag)",
+        ],
+    ),
+)
 @click.option(
     "--as-prerelease",
     "as_prerelease",
@@ -406,6 +448,7 @@ def version(  # noqa: C901
     print_only_tag: bool,
     print_last_released: bool,
     print_last_released_tag: bool,
+    refs: tuple[str, ...],
     as_prerelease: bool,
     prerelease_token: str | None,
     commit_changes: bool,
@@ -441,11 +484,26 @@ def version(  # noqa: C901
     # Enable any cli overrides of configuration before asking for the runtime context
     config = cli_ctx.raw_config
 
+    if refs and (print_last_released or print_last_released_tag):
+        raise click.UsageError(
+            "--ref cannot be used with --print-last-released or --print-last-released-tag"
+        )
+
     # We can short circuit updating the release if we are only printing the last released version
     if print_last_released or print_last_released_tag:
+        # The tag versions are looked up in the index of the parse cache, if enabled
+        with Repo(str(config.repo_dir)) as git_repo:
+            parse_cache = load_parse_cache(
+                config, cli_ctx.global_opts, Path(git_repo.common_dir)
+            )
+        if parse_cache is not None:
+            ctx.call_on_close(parse_cache.close)
+
         # TODO: get tag format a better way
         if not (
-            last_release := last_released(config.repo_dir, tag_format=config.tag_format)
+            last_release := last_released(
+                config.repo_dir, tag_format=config.tag_format, parse_cache=parse_cache
+            )
         ):
             logger.warning("No release tags found.")
             return
@@ -455,24 +513,29 @@ def version(  # noqa: C901
 
     # TODO: figure out --print of next version with & without branch validation
     # do you always need a prerelease token if its not --as-prerelease?
-    runtime = cli_ctx.runtime_ctx
-    translator = runtime.version_translator
+    print_only_mode = print_only or print_only_tag
 
-    parser = runtime.commit_parser
-    hvcs_client = runtime.hvcs_client
-    assets = runtime.assets
-    commit_author = runtime.commit_author
-    commit_message = runtime.commit_message
-    major_on_zero = runtime.major_on_zero
-    no_verify = runtime.no_git_verify
-    opts = runtime.global_cli_options
+    if refs and not print_only_mode:
+        raise click.UsageError("--ref can only be used with --print or --print-tag")
+
+    if refs and force_level:
+        raise click.UsageError(f"--ref cannot be used with --{force_level}")
+
+    # Printing the next version only needs the repository, the commit parser & the
+    # version settings, so the remote, the VCS client & the templates are not loaded
+    version_ctx = cli_ctx.base_runtime_ctx if print_only_mode else cli_ctx.runtime_ctx
+    translator = version_ctx.version_translator
+
+    parser = version_ctx.commit_parser
+    major_on_zero = version_ctx.major_on_zero
+    opts = version_ctx.global_cli_options
     gha_output = VersionGitHubActionsOutput(released=False)
 
     forced_level_bump = None if not force_level else LevelBump.from_string(force_level)
     prerelease = is_forced_prerelease(
         as_prerelease=as_prerelease,
         forced_level_bump=forced_level_bump,
-        prerelease=runtime.prerelease,
+        prerelease=version_ctx.prerelease,
     )
 
     if prerelease_token:
@@ -496,16 +559,70 @@ def version(  # noqa: C901
         )
         make_vcs_release &= push_changes
 
-    if not forced_level_bump:
-        with Repo(str(runtime.repo_dir)) as git_repo:
-            new_version = next_version(
-                repo=git_repo,
-                translator=translator,
-                commit_parser=parser,
-                prerelease=prerelease,
-                major_on_zero=major_on_zero,
-                allow_zero_version=runtime.allow_zero_version,
+    # The repository stays open for the lifetime of the command so that the tags,
+    # the commit history and the parsed commits are resolved only once and shared
+    # by every step below (next version, already released check & changelog)
+    git_repo = ctx.with_resource(Repo(str(version_ctx.repo_dir)))
+    history = HistorySnapshot(
+        repo=git_repo,
+        translator=translator,
+        commit_parser=parser,
+        parse_cache=version_ctx.parse_cache,
+        parser_workers=version_ctx.commit_parser_workers,
+        paths=version_ctx.paths,
+        exclude_paths=version_ctx.exclude_paths,
+        traversal=version_ctx.traversal,
+        merge_unit=version_ctx.traversal_merge_unit,
+        shallow_history=version_ctx.shallow_history(git_repo),
+        # A release builds the release history from the full parse results, which
+        # then also determine the next version rather than a bump-only parse of the
+        # same commits
+        bump_parsing=print_only_mode,
+    )
+
+    if refs:
+        # Preview the next version of each ref without checking any of them out
+        if unknown_refs := [ref for ref in refs if not is_commit_ish(git_repo, ref)]:
+            click.echo(f"Unknown git ref(s): {str.join(', ', unknown_refs)}", err=True)
+            ctx.exit(1)
+
+        ref_versions = next_versions(
+            repo=git_repo,
+            refs=refs,
+            translator=translator,
+            commit_parser=parser,
+            prerelease=prerelease,
+            major_on_zero=major_on_zero,
+            allow_zero_version=version_ctx.allow_zero_version,
+            history=history,
+        )
+
+        for ref, ref_version in ref_versions.items():
+            if build_metadata:
+                ref_version = copy(ref_version)  # noqa: PLW2901
+                ref_version.build_metadata = build_metadata
+
+            ref_version_str = (
+                str(ref_version) if not print_only_tag else ref_version.as_tag()
             )
+            click.echo(
+                ref_version_str
+                if len(ref_versions) == 1
+                else f"{ref} {ref_version_str}"
+            )
+
+        return
+
+    if not forced_level_bump:
+        new_version = next_version(
+            repo=git_repo,
+            translator=translator,
+            commit_parser=parser,
+            prerelease=prerelease,
+            major_on_zero=major_on_zero,
+            allow_zero_version=version_ctx.allow_zero_version,
+            history=history,
+        )
     else:
         logger.warning(
             "Forcing a '%s' release due to '--%s' command-line flag",
@@ -518,9 +635,10 @@ def version(  # noqa: C901
         )
 
         new_version = version_from_forced_level(
-            repo_dir=runtime.repo_dir,
+            repo_dir=version_ctx.repo_dir,
             forced_level_bump=forced_level_bump,
             translator=translator,
+            history=history,
         )
 
         # We only turn the forced version into a prerelease if the user has specified
@@ -533,6 +651,8 @@ def version(  # noqa: C901
         )
 
     if build_metadata:
+        # The version may be owned by the history snapshot, never modify it in place
+        new_version = copy(new_version)
         new_version.build_metadata = build_metadata
 
     # Update GitHub Actions output value with new version & set delayed write
@@ -545,11 +665,7 @@ def version(  # noqa: C901
     # Print the new version so that command-line output capture will work
     click.echo(version_to_print)
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        # TODO: performance improvement - cache the result of tags_and_versions (previously done in next_version())
-        previously_released_versions = {
-            v for _, v in tags_and_versions(git_repo.tags, translator)
-        }
+    previously_released_versions = history.released_versions
 
     # If the new version has already been released, we fail and abort if strict;
     # otherwise we exit with 0.
@@ -569,16 +685,23 @@ def version(  # noqa: C901
         rprint(err_msg)
         return
 
-    if print_only or print_only_tag:
+    if print_only_mode:
         return
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        release_history = ReleaseHistory.from_git_history(
-            repo=git_repo,
-            translator=translator,
-            commit_parser=parser,
-            exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
-        )
+    runtime = cli_ctx.runtime_ctx
+    hvcs_client = runtime.hvcs_client
+    assets = runtime.assets
+    commit_author = runtime.commit_author
+    commit_message = runtime.commit_message
+    no_verify = runtime.no_git_verify
+
+    release_history = ReleaseHistory.from_git_history(
+        repo=git_repo,
+        translator=translator,
+        commit_parser=parser,
+        exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+        history=history,
+    )
 
     rprint(f"[bold green]The next version is: [white]{new_version!s}[/white]! :rocket:")
 
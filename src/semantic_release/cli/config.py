@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import os
 from collections.abc import Mapping
-from dataclasses import dataclass, is_dataclass
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
 from functools import reduce
 from pathlib import Path
@@ -37,14 +37,9 @@ from semantic_release.changelog.template import environment
 from semantic_release.cli.const import DEFAULT_CONFIG_FILE
 from semantic_release.cli.masking_filter import MaskingFilter
 from semantic_release.commit_parser import (
-    AngularCommitParser,
     CommitParser,
-    ConventionalCommitParser,
-    EmojiCommitParser,
     ParseResult,
     ParserOptions,
-    ScipyCommitParser,
-    TagCommitParser,
 )
 from semantic_release.const import COMMIT_MESSAGE, DEFAULT_COMMIT_AUTHOR
 from semantic_release.errors import (
@@ -55,7 +50,16 @@ from semantic_release.errors import (
     ParserLoadError,
 )
 from semantic_release.globals import logger
-from semantic_release.helpers import dynamic_import
+from semantic_release.helpers import check_tag_format, dynamic_import
+from semantic_release.history.commits import MergeUnit, TraversalMode
+from semantic_release.history.notes_cache import GitNotesParseCache
+from semantic_release.history.parse_cache import (
+    CACHE_FILE_NAME,
+    DEFAULT_CACHE_DIR,
+    ParseCache,
+    ParseCacheBackend,
+)
+from semantic_release.history.shallow import ShallowHistory
 from semantic_release.version.declarations.i_version_replacer import IVersionReplacer
 from semantic_release.version.declarations.pattern import PatternVersionDeclaration
 from semantic_release.version.declarations.toml import TomlVersionDeclaration
@@ -71,20 +75,22 @@ class HvcsClient(str, Enum):
     GITEA = "gitea"
 
 
-_known_commit_parsers: Dict[str, type[CommitParser]] = {
-    "conventional": ConventionalCommitParser,
-    "angular": AngularCommitParser,
-    "emoji": EmojiCommitParser,
-    "scipy": ScipyCommitParser,
-    "tag": TagCommitParser,
+# Import paths rather than classes, so that only the selected parser & client are
+# imported (e.g. python-gitlab is only loaded for GitLab projects)
+_known_commit_parsers: Dict[str, str] = {
+    "conventional": "semantic_release.commit_parser.conventional:ConventionalCommitParser",
+    "angular": "semantic_release.commit_parser.angular:AngularCommitParser",
+    "emoji": "semantic_release.commit_parser.emoji:EmojiCommitParser",
+    "scipy": "semantic_release.commit_parser.scipy:ScipyCommitParser",
+    "tag": "semantic_release.commit_parser.tag:TagCommitParser",
 }
 
 
-_known_hvcs: Dict[HvcsClient, Type[hvcs.HvcsBase]] = {
-    HvcsClient.BITBUCKET: hvcs.Bitbucket,
-    HvcsClient.GITHUB: hvcs.Github,
-    HvcsClient.GITLAB: hvcs.Gitlab,
-    HvcsClient.GITEA: hvcs.Gitea,
+_known_hvcs: Dict[HvcsClient, str] = {
+    HvcsClient.BITBUCKET: "semantic_release.hvcs.bitbucket:Bitbucket",
+    HvcsClient.GITHUB: "semantic_release.hvcs.github:Github",
+    HvcsClient.GITLAB: "semantic_release.hvcs.gitlab:Gitlab",
+    HvcsClient.GITEA: "semantic_release.hvcs.gitea:Gitea",
 }
 
 
@@ -284,7 +290,7 @@ class RemoteConfig(BaseModel):
         return self
 
     def _get_default_token(self) -> str | None:
-        hvcs_client_class = _known_hvcs[self.type]
+        hvcs_client_class = dynamic_import(_known_hvcs[self.type])
 
         default_token_name = (
             getattr(hvcs_client_class, "DEFAULT_ENV_TOKEN_NAME")  # noqa: B009
@@ -344,6 +350,29 @@ class PublishConfig(BaseModel):
     upload_to_vcs_release: bool = True
 
 
+class ParseCacheConfig(BaseModel):
+    enabled: bool = False
+    backend: ParseCacheBackend = ParseCacheBackend.SQLITE
+    cache_dir: Optional[str] = None
+    max_size_mb: Annotated[int, Field(gt=0)] = 64
+
+
+class PackageConfig(BaseModel):
+    """A package of a monorepo, released independently of the other packages"""
+
+    path: str = "."
+    tag_format: str
+    version_toml: Optional[Tuple[str, ...]] = None
+    version_variables: Optional[Tuple[str, ...]] = None
+    changelog_file: Optional[str] = None
+
+    @field_validator("tag_format", mode="after")
+    @classmethod
+    def validate_tag_format(cls, tag_format: str) -> str:
+        check_tag_format(tag_format)
+        return tag_format
+
+
 class RawConfig(BaseModel):
     assets: List[str] = []
     branches: Dict[str, BranchConfig] = {"main": BranchConfig()}
@@ -357,17 +386,34 @@ class RawConfig(BaseModel):
     commit_parser: NonEmptyString = "conventional"
     # It's up to the parser_options() method to validate these
     commit_parser_options: Dict[str, Any] = {}
+    commit_parser_workers: Annotated[int, Field(ge=0)] = 1
+    deepen_shallow_clone: bool = False
+    exclude_paths: Tuple[str, ...] = ()
     logging_use_named_masks: bool = False
     major_on_zero: bool = True
+    parse_cache: ParseCacheConfig = ParseCacheConfig()
     allow_zero_version: bool = False
     repo_dir: Annotated[Path, Field(validate_default=True)] = Path(".")
     remote: RemoteConfig = RemoteConfig()
     no_git_verify: bool = False
+    packages: Dict[str, PackageConfig] = {}
     tag_format: str = "v{version}"
+    traversal: TraversalMode = TraversalMode.FULL
+    traversal_merge_unit: MergeUnit = MergeUnit.MERGE_COMMIT
     publish: PublishConfig = PublishConfig()
     version_toml: Optional[Tuple[str, ...]] = None
     version_variables: Optional[Tuple[str, ...]] = None
 
+    @field_validator("packages", mode="after")
+    @classmethod
+    def unique_package_tag_formats(
+        cls, packages: Dict[str, PackageConfig]
+    ) -> Dict[str, PackageConfig]:
+        tag_formats = [package.tag_format for package in packages.values()]
+        if len(set(tag_formats)) != len(tag_formats):
+            raise ValueError("Every package must have its own 'tag_format'")
+        return packages
+
     @field_validator("repo_dir", mode="before")
     @classmethod
     def convert_str_to_path(cls, value: Any) -> Path:
@@ -447,9 +493,9 @@ class RawConfig(BaseModel):
                 #     .get_default_options()
                 #     .__class__
                 # )
-                parser_opts_type = _known_commit_parsers[
-                    self.commit_parser
-                ].parser_options
+                parser_opts_type = dynamic_import(
+                    _known_commit_parsers[self.commit_parser]
+                ).parser_options
             else:
                 try:
                     # if its a custom parser, try to import it and pull the default options object type
@@ -502,6 +548,39 @@ class RawConfig(BaseModel):
 
         return self
 
+    def get_package(self, name: str) -> PackageConfig:
+        if name not in self.packages:
+            raise InvalidConfiguration(
+                f"Unknown package {name!r}, the configured packages are: "
+                + str.join(", ", map(repr, self.packages))
+            )
+        return self.packages[name]
+
+    def for_package(self, name: str) -> RawConfig:
+        """
+        The configuration of a single package: its tag format & version declarations
+        (and changelog file, if given) replace the top-level ones
+        """
+        package = self.get_package(name)
+        changelog = self.changelog
+        if package.changelog_file is not None:
+            changelog = changelog.model_copy(
+                update={
+                    "default_templates": changelog.default_templates.model_copy(
+                        update={"changelog_file": package.changelog_file}
+                    )
+                }
+            )
+
+        return self.model_copy(
+            update={
+                "tag_format": package.tag_format,
+                "version_toml": package.version_toml,
+                "version_variables": package.version_variables,
+                "changelog": changelog,
+            }
+        )
+
 
 @dataclass
 class GlobalCommandLineOptions:
@@ -514,6 +593,10 @@ class GlobalCommandLineOptions:
     verbosity: int = 0
     config_file: str = DEFAULT_CONFIG_FILE
     strict: bool = False
+    cache_dir: Optional[str] = None
+    jobs: Optional[int] = None
+    package: Optional[str] = None
+    first_parent: bool = False
 
 
 ######
@@ -536,47 +619,66 @@ def _recursive_getattr(obj: Any, path: str) -> Any:
     return out
 
 
+def load_parse_cache(
+    raw: RawConfig,
+    global_cli_options: GlobalCommandLineOptions,
+    git_common_dir: Path,
+) -> ParseCache | None:
+    """The parse cache, enabled either by configuration or the --cache-dir option"""
+    if not (global_cli_options.cache_dir or raw.parse_cache.enabled):
+        return None
+
+    cache_dir = (
+        Path(global_cli_options.cache_dir).absolute()
+        if global_cli_options.cache_dir
+        # relative paths in the configuration are relative to the repository
+        else raw.repo_dir / raw.parse_cache.cache_dir
+        if raw.parse_cache.cache_dir
+        else git_common_dir / DEFAULT_CACHE_DIR
+    )
+    if raw.parse_cache.backend == ParseCacheBackend.GIT_NOTES:
+        return GitNotesParseCache(
+            repo_dir=raw.repo_dir, path=cache_dir / CACHE_FILE_NAME
+        )
+
+    return ParseCache(
+        path=cache_dir / CACHE_FILE_NAME,
+        max_size=raw.parse_cache.max_size_mb * 1024 * 1024,
+    )
+
+
 @dataclass
-class RuntimeContext:
-    _mask_attrs_: ClassVar[List[str]] = ["hvcs_client.token"]
+class BaseRuntimeContext:
+    """
+    The part of the runtime context which is needed to determine the next version.
+
+    Building it does not touch the remote, the HVCS client, the project metadata or
+    the changelog templates, so that commands which only print a version (e.g.
+    ``version --print``) can skip setting those up. :py:class:`RuntimeContext`
+    extends it with everything else a release needs.
+    """
 
-    project_metadata: dict[str, Any]
     repo_dir: Path
     commit_parser: CommitParser[ParseResult, ParserOptions]
+    commit_parser_workers: int
     version_translator: VersionTranslator
     major_on_zero: bool
     allow_zero_version: bool
     prerelease: bool
-    no_git_verify: bool
-    assets: List[str]
-    commit_author: Actor
-    commit_message: str
-    changelog_excluded_commit_patterns: Tuple[Pattern[str], ...]
-    version_declarations: Tuple[IVersionReplacer, ...]
-    hvcs_client: hvcs.HvcsBase
-    changelog_insertion_flag: str
-    changelog_mask_initial_release: bool
-    changelog_mode: ChangelogMode
-    changelog_file: Path
-    changelog_style: str
-    changelog_output_format: ChangelogOutputFormat
-    ignore_token_for_push: bool
-    template_environment: Environment
-    template_dir: Path
-    build_command: Optional[str]
-    build_command_env: dict[str, str]
-    dist_glob_patterns: Tuple[str, ...]
-    upload_to_vcs_release: bool
     global_cli_options: GlobalCommandLineOptions
-    # This way the filter can be passed around if needed, so that another function
-    # can accept the filter as an argument and call
-    masker: MaskingFilter
-
-    @staticmethod
-    def resolve_from_env(param: Optional[MaybeFromEnv]) -> Optional[str]:
-        if isinstance(param, EnvConfigVar):
-            return param.getvalue()
-        return param
+    parse_cache: Optional[ParseCache]
+    # The commits are limited to those changing these paths (of the selected package)
+    paths: Tuple[str, ...]
+    # Commits which only change these paths are ignored
+    exclude_paths: Tuple[str, ...]
+    traversal: TraversalMode
+    traversal_merge_unit: MergeUnit
+    # Shallow clones are deepened from this remote as far as needed
+    deepen_remote: Optional[str]
+
+    def shallow_history(self, repo: Repo) -> ShallowHistory | None:
+        """Completes a shallow clone of ``repo`` on demand, if enabled"""
+        return ShallowHistory(repo, self.deepen_remote) if self.deepen_remote else None
 
     @staticmethod
     def select_branch_options(
@@ -603,64 +705,38 @@ class RuntimeContext:
             "no release will be made"
         )
 
-    def apply_log_masking(self, masker: MaskingFilter) -> MaskingFilter:
-        for attr in self._mask_attrs_:
-            masker.add_mask_for(str(_recursive_getattr(self, attr)), f"context.{attr}")
-            masker.add_mask_for(repr(_recursive_getattr(self, attr)), f"context.{attr}")
-        return masker
-
     @classmethod
-    def from_raw_config(  # noqa: C901
-        cls, raw: RawConfig, global_cli_options: GlobalCommandLineOptions
-    ) -> RuntimeContext:
-        ##
-        # credentials masking for logging
-        masker = MaskingFilter(_use_named_masks=raw.logging_use_named_masks)
-
-        # TODO: move to config if we change how the generated config is constructed
-        # Retrieve project metadata from pyproject.toml
-        project_metadata: dict[str, str] = {}
-        curr_dir = Path.cwd().resolve()
-        allowed_directories = [
-            dir_path
-            for dir_path in [curr_dir, *curr_dir.parents]
-            if str(raw.repo_dir) in str(dir_path)
-        ]
-        for allowed_dir in allowed_directories:
-            if (proj_toml := allowed_dir.joinpath("pyproject.toml")).exists():
-                config_toml = tomlkit.parse(proj_toml.read_text())
-                project_metadata = config_toml.unwrap().get("project", project_metadata)
-                break
-
+    def from_raw_config(
+        cls,
+        raw: RawConfig,
+        global_cli_options: GlobalCommandLineOptions,
+        branch_config: BranchConfig | None = None,
+    ) -> BaseRuntimeContext:
+        """
+        Build the context for the release group of the active branch, or for the
+        given ``branch_config`` regardless of the active branch
+        """
         # Retrieve details from repository
         with Repo(str(raw.repo_dir)) as git_repo:
-            try:
-                # Get the remote url by calling out to `git remote get-url`. This returns
-                # the expanded url, taking into account any insteadOf directives
-                # in the git configuration.
-                remote_url = raw.remote.url or git_repo.git.remote(
-                    "get-url", raw.remote.name
-                )
-                active_branch = git_repo.active_branch.name
-            except ValueError as err:
-                raise MissingGitRemote(
-                    f"Unable to locate remote named '{raw.remote.name}'."
-                ) from err
-            except TypeError as err:
-                raise DetachedHeadGitError(
-                    "Detached HEAD state cannot match any release groups; "
-                    "no release will be made"
-                ) from err
+            if branch_config is None:
+                try:
+                    active_branch = git_repo.active_branch.name
+                except TypeError as err:
+                    raise DetachedHeadGitError(
+                        "Detached HEAD state cannot match any release groups; "
+                        "no release will be made"
+                    ) from err
+
+                # branch-specific configuration
+                branch_config = cls.select_branch_options(raw.branches, active_branch)
 
-        # branch-specific configuration
-        branch_config = cls.select_branch_options(raw.branches, active_branch)
+            # shared by all worktrees of the repository
+            git_common_dir = Path(git_repo.common_dir)
 
         # commit_parser
         try:
-            commit_parser_cls = (
-                _known_commit_parsers[raw.commit_parser]
-                if raw.commit_parser in _known_commit_parsers
-                else dynamic_import(raw.commit_parser)
+            commit_parser_cls = dynamic_import(
+                _known_commit_parsers.get(raw.commit_parser, raw.commit_parser)
             )
         except ValueError as err:
             raise ParserLoadError(
@@ -706,6 +782,129 @@ class RuntimeContext:
                 str.join("\n", [str(err), f"Failed to initialize {raw.commit_parser}"])
             ) from err
 
+        # version_translator
+        version_translator = VersionTranslator(
+            tag_format=raw.tag_format, prerelease_token=branch_config.prerelease_token
+        )
+
+        parse_cache = load_parse_cache(raw, global_cli_options, git_common_dir)
+
+        return BaseRuntimeContext(
+            repo_dir=raw.repo_dir,
+            commit_parser=commit_parser,
+            commit_parser_workers=(
+                global_cli_options.jobs
+                if global_cli_options.jobs is not None
+                else raw.commit_parser_workers
+            ),
+            version_translator=version_translator,
+            major_on_zero=raw.major_on_zero,
+            allow_zero_version=raw.allow_zero_version,
+            prerelease=branch_config.prerelease,
+            global_cli_options=global_cli_options,
+            parse_cache=parse_cache,
+            paths=(
+                (raw.get_package(global_cli_options.package).path,)
+                if global_cli_options.package
+                else ()
+            ),
+            exclude_paths=raw.exclude_paths,
+            traversal=(
+                TraversalMode.FIRST_PARENT
+                if global_cli_options.first_parent
+                else raw.traversal
+            ),
+            traversal_merge_unit=raw.traversal_merge_unit,
+            deepen_remote=raw.remote.name if raw.deepen_shallow_clone else None,
+        )
+
+
+@dataclass
+class RuntimeContext(BaseRuntimeContext):
+    _mask_attrs_: ClassVar[List[str]] = ["hvcs_client.token"]
+
+    project_metadata: dict[str, Any]
+    no_git_verify: bool
+    assets: List[str]
+    commit_author: Actor
+    commit_message: str
+    changelog_excluded_commit_patterns: Tuple[Pattern[str], ...]
+    version_declarations: Tuple[IVersionReplacer, ...]
+    hvcs_client: hvcs.HvcsBase
+    changelog_insertion_flag: str
+    changelog_mask_initial_release: bool
+    changelog_mode: ChangelogMode
+    changelog_file: Path
+    changelog_style: str
+    changelog_output_format: ChangelogOutputFormat
+    ignore_token_for_push: bool
+    template_environment: Environment
+    template_dir: Path
+    build_command: Optional[str]
+    build_command_env: dict[str, str]
+    dist_glob_patterns: Tuple[str, ...]
+    upload_to_vcs_release: bool
+    # This way the filter can be passed around if needed, so that another function
+    # can accept the filter as an argument and call
+    masker: MaskingFilter
+
+    @staticmethod
+    def resolve_from_env(param: Optional[MaybeFromEnv]) -> Optional[str]:
+        if isinstance(param, EnvConfigVar):
+            return param.getvalue()
+        return param
+
+    def apply_log_masking(self, masker: MaskingFilter) -> MaskingFilter:
+        for attr in self._mask_attrs_:
+            masker.add_mask_for(str(_recursive_getattr(self, attr)), f"context.{attr}")
+            masker.add_mask_for(repr(_recursive_getattr(self, attr)), f"context.{attr}")
+        return masker
+
+    @classmethod
+    def from_raw_config(  # noqa: C901
+        cls,
+        raw: RawConfig,
+        global_cli_options: GlobalCommandLineOptions,
+        branch_config: BranchConfig | None = None,
+    ) -> RuntimeContext:
+        ##
+        # credentials masking for logging
+        masker = MaskingFilter(_use_named_masks=raw.logging_use_named_masks)
+
+        # TODO: move to config if we change how the generated config is constructed
+        # Retrieve project metadata from pyproject.toml
+        project_metadata: dict[str, str] = {}
+        curr_dir = Path.cwd().resolve()
+        allowed_directories = [
+            dir_path
+            for dir_path in [curr_dir, *curr_dir.parents]
+            if str(raw.repo_dir) in str(dir_path)
+        ]
+        for allowed_dir in allowed_directories:
+            if (proj_toml := allowed_dir.joinpath("pyproject.toml")).exists():
+                config_toml = tomlkit.parse(proj_toml.read_text())
+                project_metadata = config_toml.unwrap().get("project", project_metadata)
+                break
+
+        # Retrieve details from repository
+        with Repo(str(raw.repo_dir)) as git_repo:
+            try:
+                # Get the remote url by calling out to `git remote get-url`. This returns
+                # the expanded url, taking into account any insteadOf directives
+                # in the git configuration.
+                remote_url = raw.remote.url or git_repo.git.remote(
+                    "get-url", raw.remote.name
+                )
+            except ValueError as err:
+                raise MissingGitRemote(
+                    f"Unable to locate remote named '{raw.remote.name}'."
+                ) from err
+
+        # Everything needed to determine the next version
+        base = BaseRuntimeContext.from_raw_config(
+            raw, global_cli_options, branch_config=branch_config
+        )
+
         # We always exclude PSR's own release commits from the Changelog
         # when parsing commits
         psr_release_commit_regex = regexp(
@@ -779,7 +978,9 @@ class RuntimeContext:
                 logger.warning("Token value is missing!")
 
         # hvcs_client
-        hvcs_client_cls = _known_hvcs[raw.remote.type]
+        hvcs_client_cls: Type[hvcs.HvcsBase] = dynamic_import(
+            _known_hvcs[raw.remote.type]
+        )
         hvcs_client = hvcs_client_cls(
             remote_url=remote_url,
             hvcs_domain=raw.remote.domain,
@@ -823,11 +1024,6 @@ class RuntimeContext:
             **raw.changelog.environment.model_dump(),
         )
 
-        # version_translator
-        version_translator = VersionTranslator(
-            tag_format=raw.tag_format, prerelease_token=branch_config.prerelease_token
-        )
-
         build_cmd_env = {}
 
         for i, env_var_def in enumerate(raw.build_command_env):
@@ -866,12 +1062,8 @@ class RuntimeContext:
         # )
 
         self = cls(
+            **{field.name: getattr(base, field.name) for field in fields(base)},
             project_metadata=project_metadata,
-            repo_dir=raw.repo_dir,
-            commit_parser=commit_parser,
-            version_translator=version_translator,
-            major_on_zero=raw.major_on_zero,
-            allow_zero_version=raw.allow_zero_version,
             build_command=raw.build_command,
             build_command_env=build_cmd_env,
             version_declarations=tuple(version_declarations),
@@ -888,13 +1080,11 @@ class RuntimeContext:
             # changelog_style=changelog_style,
             changelog_style="conventional",
             changelog_output_format=raw.changelog.default_templates.output_format,
-            prerelease=branch_config.prerelease,
             ignore_token_for_push=raw.remote.ignore_token_for_push,
             template_dir=template_dir,
             template_environment=template_environment,
             dist_glob_patterns=raw.publish.dist_glob_patterns,
             upload_to_vcs_release=raw.publish.upload_to_vcs_release,
-            global_cli_options=global_cli_options,
             masker=masker,
             no_git_verify=raw.no_git_verify,
         )
@@ -1,30 +1,79 @@
-from semantic_release.commit_parser._base import (
-    CommitParser,
-    ParserOptions,
-)
-from semantic_release.commit_parser.angular import (
-    AngularCommitParser,
-    AngularParserOptions,
-)
-from semantic_release.commit_parser.conventional import (
-    ConventionalCommitParser,
-    ConventionalCommitParserOptions,
-)
-from semantic_release.commit_parser.emoji import (
-    EmojiCommitParser,
-    EmojiParserOptions,
-)
-from semantic_release.commit_parser.scipy import (
-    ScipyCommitParser,
-    ScipyParserOptions,
-)
-from semantic_release.commit_parser.tag import (
-    TagCommitParser,
-    TagParserOptions,
-)
-from semantic_release.commit_parser.token import (
-    ParsedCommit,
-    ParseError,
-    ParseResult,
-    ParseResultType,
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from semantic_release.helpers import lazy_module_attributes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from semantic_release.commit_parser._base import (
+        CommitParser,
+        ParserOptions,
+    )
+    from semantic_release.commit_parser.angular import (
+        AngularCommitParser,
+        AngularParserOptions,
+    )
+    from semantic_release.commit_parser.conventional import (
+        ConventionalCommitParser,
+        ConventionalCommitParserOptions,
+    )
+    from semantic_release.commit_parser.emoji import (
+        EmojiCommitParser,
+        EmojiParserOptions,
+    )
+    from semantic_release.commit_parser.scipy import (
+        ScipyCommitParser,
+        ScipyParserOptions,
+    )
+    from semantic_release.commit_parser.tag import (
+        TagCommitParser,
+        TagParserOptions,
+    )
+    from semantic_release.commit_parser.token import (
+        ParsedCommit,
+        ParseError,
+        ParseResult,
+        ParseResultType,
+    )
+
+__all__ = [
+    "AngularCommitParser",
+    "AngularParserOptions",
+    "CommitParser",
+    "ConventionalCommitParser",
+    "ConventionalCommitParserOptions",
+    "EmojiCommitParser",
+    "EmojiParserOptions",
+    "ParseError",
+    "ParseResult",
+    "ParseResultType",
+    "ParsedCommit",
+    "ParserOptions",
+    "ScipyCommitParser",
+    "ScipyParserOptions",
+    "TagCommitParser",
+    "TagParserOptions",
+]
+
+# Each parser is only imported once it is used, most runs need a single one
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "CommitParser": f"{__name__}._base",
+        "ParserOptions": f"{__name__}._base",
+        "AngularCommitParser": f"{__name__}.angular",
+        "AngularParserOptions": f"{__name__}.angular",
+        "ConventionalCommitParser": f"{__name__}.conventional",
+        "ConventionalCommitParserOptions": f"{__name__}.conventional",
+        "EmojiCommitParser": f"{__name__}.emoji",
+        "EmojiParserOptions": f"{__name__}.emoji",
+        "ScipyCommitParser": f"{__name__}.scipy",
+        "ScipyParserOptions": f"{__name__}.scipy",
+        "TagCommitParser": f"{__name__}.tag",
+        "TagParserOptions": f"{__name__}.tag",
+        "ParsedCommit": f"{__name__}.token",
+        "ParseError": f"{__name__}.token",
+        "ParseResult": f"{__name__}.token",
+        "ParseResultType": f"{__name__}.token",
+    },
 )
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from semantic_release.commit_parser.token import ParseResultType
+from semantic_release.commit_parser.util import force_str
+from semantic_release.enums import LevelBump
 
 if TYPE_CHECKING:  # pragma: no cover
+    from re import Pattern
+    from typing import Iterable
+
     from git.objects.commit import Commit
 
 
@@ -82,3 +88,115 @@ class CommitParser(ABC, Generic[_TT, _OPTS]):
 
     @abstractmethod
     def parse(self, commit: Commit) -> _TT | list[_TT]: ...
+
+
+# Methods which determine the results of a parser, a subclass that overrides any of
+# these below the class which provides `parse_bump()` would get diverging bumps
+_PARSE_METHODS = (
+    "parse",
+    "parse_commit",
+    "parse_message",
+    "unsquash_commit",
+    "unsquash_commit_message",
+    "is_merge_commit",
+)
+
+
+def supports_bump_parsing(commit_parser: CommitParser[Any, Any]) -> bool:
+    """
+    Whether the given parser provides a ``parse_bump(commit) -> LevelBump`` method
+    which determines the same level bump as :py:meth:`CommitParser.parse` without
+    building the full parse results.
+    """
+
+    def defining_class(name: str) -> type | None:
+        return next(
+            (cls for cls in type(commit_parser).__mro__ if name in vars(cls)), None
+        )
+
+    if defining_class("parse_bump") is None:
+        return False
+
+    # A parser which gets parse_bump() from BumpParserMixin provides it by
+    # implementing parse_message_bump()
+    bump_parser_cls = min(
+        filter(None, map(defining_class, ("parse_bump", "parse_message_bump"))),
+        key=type(commit_parser).__mro__.index,
+    )
+
+    return all(
+        cls is None or cls in bump_parser_cls.__mro__
+        for cls in map(defining_class, _PARSE_METHODS)
+    )
+
+
+def bump_fallback_hint_pattern(tags: Iterable[str], *patterns: str) -> Pattern[str]:
+    """
+    A cheap check for the messages which could be split into multiple commits by
+    unsquashing: the headers of squashed commits and the lines which start with one
+    of the ``tags``, or any of the additional ``patterns``
+    """
+    tags_pattern = str.join("|", map(re.escape, tags))
+    return re.compile(
+        str.join(
+            "|",
+            [
+                *patterns,
+                r"^[\t ]*(?:commit [0-9a-f]+$|Author: |Date: |Squashed commit)",
+                r"^(?:[\t ]*[*-][\t ]+|[\t ]+)(?:%s)" % tags_pattern,
+                r"\n(?:%s)" % tags_pattern,
+            ],
+        ),
+        flags=re.MULTILINE,
+    )
+
+
+class BumpParserMixin:
+    """
+    Provides ``parse_bump()`` (see :py:func:`supports_bump_parsing`) to a parser
+    which unsquashes commits. The parser only determines the level bump of a single
+    message in ``parse_message_bump()`` and sets ``bump_fallback_hint`` (see
+    :py:func:`bump_fallback_hint_pattern`), only the messages it matches are
+    unsquashed.
+    """
+
+    options: Any
+    bump_fallback_hint: Pattern[str]
+
+    @abstractmethod
+    def parse_message_bump(self, message: str) -> LevelBump: ...
+
+    @abstractmethod
+    def unsquash_commit_message(self, message: str) -> list[str]: ...
+
+    @staticmethod
+    @abstractmethod
+    def is_merge_commit(commit: Commit) -> bool: ...
+
+    def parse_bump(self, commit: Commit) -> LevelBump:
+        """
+        Determine only the level bump of a commit.
+
+        The result is the same as the highest bump of the results of
+        ``parse()``, but the results themselves (descriptions, linked issues,
+        artificial commits of squashed merges, etc.) are never built.
+        """
+        if self.options.ignore_merge_commits and self.is_merge_commit(commit):
+            return LevelBump.NO_RELEASE
+
+        message = force_str(commit.message)
+        if not self.options.parse_squash_commits:
+            return self.parse_message_bump(message)
+
+        normalized_message = message.replace("\r", "").strip()
+        if not self.bump_fallback_hint.search(normalized_message):
+            # unsquashing would result in a single commit with the same subject
+            return self.parse_message_bump(normalized_message)
+
+        return max(
+            map(
+                self.parse_message_bump,
+                self.unsquash_commit_message(normalized_message) or [message],
+            ),
+            default=LevelBump.NO_RELEASE,
+        )
@@ -329,10 +329,8 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
 
         return ParsedCommit.from_parsed_message_result(commit, parsed_msg_result)
 
-    # Maybe this can be cached as an optimization, similar to how
-    # mypy/pytest use their own caching directories, for very large commit
-    # histories?
-    # The problem is the cache likely won't be present in CI environments
+    # Results are cached between runs when the (opt-in) parse cache is enabled,
+    # see semantic_release.history.parse_cache
     def parse(self, commit: Commit) -> ParseResult | list[ParseResult]:
         """
         Parse a commit message
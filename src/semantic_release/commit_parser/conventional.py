@@ -10,7 +10,12 @@ from typing import TYPE_CHECKING, Tuple
 from git.objects.commit import Commit
 from pydantic.dataclasses import dataclass
 
-from semantic_release.commit_parser._base import CommitParser, ParserOptions
+from semantic_release.commit_parser._base import (
+    BumpParserMixin,
+    CommitParser,
+    ParserOptions,
+    bump_fallback_hint_pattern,
+)
 from semantic_release.commit_parser.token import (
     ParsedCommit,
     ParsedMessageResult,
@@ -117,7 +122,7 @@ class ConventionalCommitParserOptions(ParserOptions):
 
 
 class ConventionalCommitParser(
-    CommitParser[ParseResult, ConventionalCommitParserOptions]
+    BumpParserMixin, CommitParser[ParseResult, ConventionalCommitParserOptions]
 ):
     """
     A commit parser for projects conforming to the conventional commits specification.
@@ -222,6 +227,11 @@ class ConventionalCommitParser(
             ),
         }
 
+        # Breaking change footers require the full unsquash in parse_bump() as well
+        self.bump_fallback_hint = bump_fallback_hint_pattern(
+            self.options.allowed_tags, r"BREAKING"
+        )
+
     @staticmethod
     def get_default_options() -> ConventionalCommitParserOptions:
         return ConventionalCommitParserOptions()
@@ -316,6 +326,23 @@ class ConventionalCommitParser(
             linked_merge_request=linked_merge_request,
         )
 
+    def parse_message_bump(self, message: str) -> LevelBump:
+        """Determine only the level bump of a single commit message"""
+        if "BREAKING" in message:
+            # Breaking change footers require the paragraphs of the body
+            parsed_msg_result = self.parse_message(message)
+            return parsed_msg_result.bump if parsed_msg_result else LevelBump.NO_RELEASE
+
+        if not (parsed := self.commit_msg_pattern.match(message)):
+            return LevelBump.NO_RELEASE
+
+        if parsed.group("break"):
+            return LevelBump.MAJOR
+
+        return self.options.tag_to_level.get(
+            parsed.group("type"), self.options.default_bump_level
+        )
+
     @staticmethod
     def is_merge_commit(commit: Commit) -> bool:
         return len(commit.parents) > 1
@@ -329,10 +356,8 @@ class ConventionalCommitParser(
 
         return ParsedCommit.from_parsed_message_result(commit, parsed_msg_result)
 
-    # Maybe this can be cached as an optimization, similar to how
-    # mypy/pytest use their own caching directories, for very large commit
-    # histories?
-    # The problem is the cache likely won't be present in CI environments
+    # Results are cached between runs when the (opt-in) parse cache is enabled,
+    # see semantic_release.history.parse_cache
     def parse(self, commit: Commit) -> ParseResult | list[ParseResult]:
         """
         Parse a commit message
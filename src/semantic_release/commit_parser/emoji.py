@@ -12,7 +12,12 @@ from typing import Tuple
 from git.objects.commit import Commit
 from pydantic.dataclasses import dataclass
 
-from semantic_release.commit_parser._base import CommitParser, ParserOptions
+from semantic_release.commit_parser._base import (
+    BumpParserMixin,
+    CommitParser,
+    ParserOptions,
+    bump_fallback_hint_pattern,
+)
 from semantic_release.commit_parser.token import (
     ParsedCommit,
     ParsedMessageResult,
@@ -120,7 +125,7 @@ class EmojiParserOptions(ParserOptions):
         }
 
 
-class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
+class EmojiCommitParser(BumpParserMixin, CommitParser[ParseResult, EmojiParserOptions]):
     """
     Parse a commit using an emoji in the subject line.
     When multiple emojis are encountered, the one with the highest bump
@@ -224,6 +229,8 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
             ),
         }
 
+        self.bump_fallback_hint = bump_fallback_hint_pattern(emojis_in_precedence_order)
+
     @staticmethod
     def get_default_options() -> EmojiParserOptions:
         return EmojiParserOptions()
@@ -316,6 +323,19 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
             linked_merge_request=linked_merge_request,
         )
 
+    def parse_message_bump(self, message: str) -> LevelBump:
+        """Determine only the level bump of a single commit message"""
+        subject = message.split("\n", maxsplit=1)[0]
+        if self.mr_selector.search(subject):
+            subject = self.mr_selector.sub("", subject).strip()
+
+        match = self.emoji_selector.search(subject)
+
+        return self.options.tag_to_level.get(
+            match.group("type") if match else "Other",
+            self.options.default_bump_level,
+        )
+
     @staticmethod
     def is_merge_commit(commit: Commit) -> bool:
         return len(commit.parents) > 1
@@ -56,7 +56,12 @@ from typing import TYPE_CHECKING, Tuple
 from git.objects.commit import Commit
 from pydantic.dataclasses import dataclass
 
-from semantic_release.commit_parser._base import CommitParser, ParserOptions
+from semantic_release.commit_parser._base import (
+    BumpParserMixin,
+    CommitParser,
+    ParserOptions,
+    bump_fallback_hint_pattern,
+)
 from semantic_release.commit_parser.token import (
     ParsedCommit,
     ParsedMessageResult,
@@ -179,7 +184,7 @@ class ScipyParserOptions(ParserOptions):
         }
 
 
-class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
+class ScipyCommitParser(BumpParserMixin, CommitParser[ParseResult, ScipyParserOptions]):
     """Parser for scipy-style commit messages"""
 
     # TODO: Deprecate in lieu of get_default_options()
@@ -279,6 +284,8 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
             ),
         }
 
+        self.bump_fallback_hint = bump_fallback_hint_pattern(self.options.allowed_tags)
+
     @staticmethod
     def get_default_options() -> ScipyParserOptions:
         return ScipyParserOptions()
@@ -371,6 +378,15 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
             linked_merge_request=linked_merge_request,
         )
 
+    def parse_message_bump(self, message: str) -> LevelBump:
+        """Determine only the level bump of a single commit message"""
+        if not (parsed := self.commit_msg_pattern.match(message)):
+            return LevelBump.NO_RELEASE
+
+        return self.options.tag_to_level.get(
+            parsed.group("type"), self.options.default_bump_level
+        )
+
     @staticmethod
     def is_merge_commit(commit: Commit) -> bool:
         return len(commit.parents) > 1
@@ -120,7 +120,9 @@ def deep_copy_commit(commit: Commit) -> dict[str, Any]:
         with suppress(ValueError):
             if hasattr(commit, key) and (value := getattr(commit, key)) is not None:
                 if key in ["parents", "repo", "tree"]:
-                    # These tend to have circular references so don't deepcopy them
+                    # These tend to have circular references so don't deepcopy them,
+                    # the tree is only referenced & never read (it may be missing
+                    # from a partial clone)
                     kwargs[key] = value
                     continue
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 import importlib.util
 import os
 import re
@@ -206,6 +207,34 @@ def dynamic_import(import_path: str) -> Any:
         ) from err
 
 
+def lazy_module_attributes(
+    module_name: str, attr_modules: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Create the module level ``__getattr__`` & ``__dir__`` functions (PEP 562) for the
+    module ``module_name`` which import each attribute of ``attr_modules`` (a mapping
+    of attribute name to the module that defines it, or of a submodule name to the
+    submodule itself) on first access only.
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        if (attr_module := attr_modules.get(name)) is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        module = importlib.import_module(attr_module)
+        value = (
+            module if attr_module == f"{module_name}.{name}" else getattr(module, name)
+        )
+        # Cache on the module so that later accesses skip __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[module_name]), *attr_modules})
+
+    return __getattr__, __dir__
+
+
 class ParsedGitUrl(NamedTuple):
     """Container for the elements parsed from a git URL"""
 
@@ -0,0 +1,20 @@
+from semantic_release.history.commits import (
+    CommitRecord,
+    iter_commit_records,
+    iter_commits,
+)
+from semantic_release.history.notes_cache import GitNotesParseCache
+from semantic_release.history.parallel import parse_commits
+from semantic_release.history.parse_cache import (
+    ParseCache,
+    ParseCacheBackend,
+    ParseCacheStats,
+    parser_fingerprint,
+)
+from semantic_release.history.snapshot import HistorySnapshot
+from semantic_release.history.tags import (
+    TagRecord,
+    iter_tag_records,
+    merged_tag_names,
+    tags_and_versions,
+)
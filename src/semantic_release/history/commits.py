@@ -0,0 +1,288 @@
+"""Streaming access to commit history through a single ``git log`` process."""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import TYPE_CHECKING, NamedTuple
+
+from git.objects.commit import Commit
+from git.objects.tree import Tree
+from git.objects.util import utctz_to_altz
+from git.util import Actor, hex_to_bin
+
+from semantic_release.commit_parser.util import deep_copy_commit, force_str
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterator
+
+    from git.repo.base import Repo
+
+
+# Fields are separated by the ASCII unit separator and each record is terminated
+# by a NUL byte (``git log -z``). The raw message is always the last field so that
+# it may contain anything (including the field separator) except a NUL byte.
+FIELD_SEPARATOR = "\x1f"
+
+GIT_LOG_FORMAT = str.join(
+    "%x1f",
+    [
+        "%H",  # commit sha
+        "%P",  # parent shas (space separated)
+        "%T",  # tree sha
+        "%an",  # author name
+        "%ae",  # author email
+        "%ad",  # author date (raw: "<epoch> <+/-hhmm>")
+        "%cn",  # committer name
+        "%ce",  # committer email
+        "%cd",  # committer date (raw: "<epoch> <+/-hhmm>")
+        "%B",  # raw commit message
+    ],
+)
+
+_NUM_FIELDS = GIT_LOG_FORMAT.count("%x1f") + 1
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+class TraversalMode(str, Enum):
+    """Which commits of the history of a release are evaluated"""
+
+    FULL = "full"
+    # Only the mainline, i.e. the first parent of every merge commit
+    FIRST_PARENT = "first-parent"
+
+
+class MergeUnit(str, Enum):
+    """What a merge commit stands for when only the first parents are traversed"""
+
+    # The message of the merge commit itself, including its body
+    MERGE_COMMIT = "merge-commit"
+    # A squash-style summary of every commit the merge brought in
+    MERGED_COMMITS = "merged-commits"
+
+
+class CommitRecord(NamedTuple):
+    """
+    A lightweight, picklable representation of a single commit as read from the
+    ``git log`` stream.
+    """
+
+    hexsha: str
+    parent_shas: tuple[str, ...]
+    tree_sha: str
+    author_name: str
+    author_email: str
+    authored_date: int
+    author_tz_offset: int
+    committer_name: str
+    committer_email: str
+    committed_date: int
+    committer_tz_offset: int
+    message: str
+
+    @staticmethod
+    def from_log_entry(entry: str) -> CommitRecord:
+        """Create a record from a single (NUL-stripped) entry of the log stream"""
+        fields = entry.split(FIELD_SEPARATOR, _NUM_FIELDS - 1)
+        if len(fields) != _NUM_FIELDS:
+            raise ValueError(f"Unexpected git log entry: {entry[:80]!r}")
+
+        (
+            hexsha,
+            parents,
+            tree_sha,
+            author_name,
+            author_email,
+            author_date,
+            committer_name,
+            committer_email,
+            committer_date,
+            message,
+        ) = fields
+
+        authored_date, author_tz_offset = _parse_raw_date(author_date)
+        committed_date, committer_tz_offset = _parse_raw_date(committer_date)
+
+        return CommitRecord(
+            hexsha=hexsha,
+            parent_shas=tuple(parents.split()),
+            tree_sha=tree_sha,
+            author_name=author_name,
+            author_email=author_email,
+            authored_date=authored_date,
+            author_tz_offset=author_tz_offset,
+            committer_name=committer_name,
+            committer_email=committer_email,
+            committed_date=committed_date,
+            committer_tz_offset=committer_tz_offset,
+            message=message,
+        )
+
+    @staticmethod
+    def from_commit(commit: Commit) -> CommitRecord:
+        """Create a record from an existing GitPython commit"""
+        return CommitRecord(
+            hexsha=commit.hexsha,
+            parent_shas=tuple(parent.hexsha for parent in commit.parents),
+            tree_sha=commit.tree.hexsha,
+            author_name=commit.author.name or "",
+            author_email=commit.author.email or "",
+            authored_date=commit.authored_date,
+            author_tz_offset=int(commit.author_tz_offset),
+            committer_name=commit.committer.name or "",
+            committer_email=commit.committer.email or "",
+            committed_date=commit.committed_date,
+            committer_tz_offset=int(commit.committer_tz_offset),
+            message=force_str(commit.message),
+        )
+
+    def populate(self, commit: Commit) -> Commit:
+        """
+        Fill in every lazily-loaded attribute of the given GitPython commit so that
+        accessing it never requires a read from the object database.
+        """
+        commit.tree = Tree(commit.repo, hex_to_bin(self.tree_sha))
+        commit.author = Actor(self.author_name, self.author_email)
+        commit.authored_date = self.authored_date
+        commit.author_tz_offset = self.author_tz_offset
+        commit.committer = Actor(self.committer_name, self.committer_email)
+        commit.committed_date = self.committed_date
+        commit.committer_tz_offset = self.committer_tz_offset
+        commit.message = self.message
+        commit.encoding = Commit.default_encoding
+        # signatures are not part of the stream, mark them as loaded but absent
+        commit.gpgsig = None  # type: ignore[assignment]
+        return commit
+
+
+def _parse_raw_date(raw_date: str) -> tuple[int, int]:
+    # Output of --date=raw is "<seconds since epoch> <+/-hhmm>"
+    timestamp, _, utc_offset = raw_date.partition(" ")
+    return int(timestamp), utctz_to_altz(utc_offset or "+0000")
+
+
+def iter_commit_records(
+    repo: Repo,
+    *rev_args: str,
+    topo_order: bool = False,
+    first_parent: bool = False,
+) -> Iterator[CommitRecord]:
+    """
+    Stream every commit selected by ``rev_args`` (any ``git rev-list`` syntax,
+    e.g. ``"HEAD"`` or ``"HEAD", "^v1.0.0"``) from a single ``git log -z`` process.
+    Only the first parent of merge commits is followed when ``first_parent`` is set.
+
+    The records are yielded as soon as they are read, so consumers that stop early
+    also stop the underlying process.
+    """
+    proc = repo.git.log(
+        *(rev_args or ("HEAD",)),
+        "--",
+        z=True,
+        format=GIT_LOG_FORMAT,
+        date="raw",
+        encoding="UTF-8",
+        no_show_signature=True,
+        no_color=True,
+        topo_order=topo_order,
+        first_parent=first_parent,
+        as_process=True,
+    )
+
+    stream = proc.proc.stdout if proc.proc is not None else None
+    if stream is None:
+        raise ValueError("git log process has no stdout stream")
+
+    buffer = b""
+    exhausted = False
+    try:
+        while chunk := stream.read(_READ_CHUNK_SIZE):
+            buffer += chunk
+            *entries, buffer = buffer.split(b"\0")
+            for entry in entries:
+                yield CommitRecord.from_log_entry(entry.decode("utf-8", "replace"))
+
+        if buffer.strip():
+            yield CommitRecord.from_log_entry(buffer.decode("utf-8", "replace"))
+
+        exhausted = True
+    finally:
+        if exhausted:
+            # raises a GitCommandError if git log exited with a failure
+            proc.wait()
+        else:
+            # consumer stopped early, terminate the process rather than reading
+            # the remainder of the history
+            del proc
+
+
+def iter_commits(
+    repo: Repo,
+    *rev_args: str,
+    topo_order: bool = False,
+    first_parent: bool = False,
+) -> Iterator[Commit]:
+    """
+    Stream every commit selected by ``rev_args`` as fully populated GitPython
+    ``Commit`` objects.
+
+    Unlike ``Repo.iter_commits()``, reading the message, author, dates or parents
+    of the yielded commits does not cost a separate object lookup. Parents are
+    linked to the same in-memory objects that are (or will be) yielded by this
+    iterator, so walking the graph through ``commit.parents`` stays in memory
+    once the stream has been consumed.
+    """
+    known_commits: dict[str, Commit] = {}
+
+    def get_commit(hexsha: str) -> Commit:
+        if (commit := known_commits.get(hexsha)) is None:
+            commit = known_commits[hexsha] = Commit(repo, hex_to_bin(hexsha))
+        return commit
+
+    for record in iter_commit_records(
+        repo, *rev_args, topo_order=topo_order, first_parent=first_parent
+    ):
+        commit = record.populate(get_commit(record.hexsha))
+        commit.parents = tuple(get_commit(sha) for sha in record.parent_shas)
+        yield commit
+
+
+def merged_commits_summary(merge_commit: Commit) -> str:
+    """
+    A summary of every (non-merge) commit which ``merge_commit`` brought into its
+    first parent, in the format of ``git merge --squash``
+    """
+    log = merge_commit.repo.git.log(
+        f"{merge_commit.hexsha}^1..{merge_commit.hexsha}",
+        "--",
+        no_merges=True,
+        format="medium",
+        encoding="UTF-8",
+        no_show_signature=True,
+        no_color=True,
+    )
+    return f"Squashed commit of the following:\n\n{log}"
+
+
+def merge_unit(merge_commit: Commit, unit: MergeUnit) -> Commit:
+    """
+    A copy of ``merge_commit`` with its first parent as the only parent, which
+    stands for the whole merge when only the first parents are traversed. Its
+    message is either the message of the merge commit or a summary of the merged
+    commits, depending on ``unit``.
+    """
+    stand_in = Commit(
+        **{
+            **deep_copy_commit(merge_commit),
+            "parents": merge_commit.parents[:1],
+            "message": (
+                merged_commits_summary(merge_commit)
+                if unit is MergeUnit.MERGED_COMMITS
+                else merge_commit.message
+            ),
+        }
+    )
+    # An unset attribute makes GitPython read the commit object again, which would
+    # restore both parents (e.g. on the copies made when unsquashing the message)
+    stand_in.gpgsig = merge_commit.gpgsig
+    return stand_in
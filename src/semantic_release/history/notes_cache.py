@@ -0,0 +1,245 @@
+"""Cache of commit parse results stored in git notes, so it travels with the repo."""
+
+from __future__ import annotations
+
+import subprocess
+import time
+from typing import TYPE_CHECKING
+
+from git.cmd import Git
+from git.exc import GitCommandError
+
+from semantic_release.globals import logger
+from semantic_release.history.parse_cache import (
+    ParseCache,
+    dump_parse_result,
+    load_parse_result,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+    from git.objects.commit import Commit
+
+    from semantic_release.commit_parser import ParseResult
+
+
+NOTES_REF = "refs/notes/semantic-release"
+
+# Identity of the commits of the notes ref, which never end up in the project history
+NOTES_COMMITTER = "semantic-release <semantic-release>"
+
+# Number of parser fingerprints whose results are kept in the note of a commit, the
+# most recently written first. Older fingerprints (e.g. of a previous release of
+# semantic-release) are dropped when a note is rewritten.
+MAX_FINGERPRINTS_PER_NOTE = 3
+
+
+def read_notes(git: Git, ref: str = NOTES_REF) -> dict[str, dict[str, str]]:
+    """
+    Read every note of ``ref`` with a single ``git cat-file --batch`` process.
+
+    Returns the payloads of each annotated commit by parser fingerprint, in the
+    order they are stored. A missing ref has no notes. Commits whose notes have the
+    same content share a single blob, which is read once.
+    """
+    if not git.for_each_ref(ref):
+        return {}
+
+    note_shas: dict[str, list[str]] = {}
+    for line in git.notes("--ref", ref, "list").splitlines():
+        note_sha, _, commit_sha = line.partition(" ")
+        note_shas.setdefault(note_sha, []).append(commit_sha)
+
+    if not note_shas:
+        return {}
+
+    proc = git.cat_file("--batch", istream=subprocess.PIPE, as_process=True)
+    output: bytes = proc.communicate(
+        str.join("", (f"{sha}\n" for sha in note_shas)).encode()
+    )[0]
+    # raises a GitCommandError if git cat-file exited with a failure
+    proc.wait()
+
+    notes: dict[str, dict[str, str]] = {}
+    offset = 0
+    while offset < len(output):
+        header_end = output.index(b"\n", offset)
+        note_sha, _, size = output[offset:header_end].decode().split(" ")
+        content_end = header_end + 1 + int(size)
+        payloads = parse_note(
+            output[header_end + 1 : content_end].decode("utf-8", "replace")
+        )
+        for commit_sha in note_shas[note_sha]:
+            notes[commit_sha] = payloads
+        # every object is followed by a newline
+        offset = content_end + 1
+
+    return notes
+
+
+def parse_note(content: str) -> dict[str, str]:
+    """The payloads of a note by fingerprint, one ``<fingerprint> <payload>`` line each"""
+    payloads: dict[str, str] = {}
+    for line in content.splitlines():
+        fingerprint, _, payload = line.partition(" ")
+        if payload:
+            payloads.setdefault(fingerprint, payload)
+    return payloads
+
+
+def format_note(payloads: dict[str, str]) -> str:
+    return str.join(
+        "",
+        (
+            f"{fingerprint} {payload}\n"
+            for fingerprint, payload in list(payloads.items())[
+                :MAX_FINGERPRINTS_PER_NOTE
+            ]
+        ),
+    )
+
+
+def write_notes(
+    git: Git, notes: dict[str, dict[str, str]], ref: str = NOTES_REF
+) -> None:
+    """
+    Replace the notes of the given commits in a single commit on top of ``ref``,
+    written by one ``git fast-import`` process.
+
+    Raises a :py:class:`git.exc.GitCommandError` if the ref could not be updated,
+    e.g. because it was updated concurrently.
+    """
+    parent = git.for_each_ref(ref, format="%(objectname)")
+    message = f"Store the parse results of {len(notes)} commits\n".encode()
+
+    stream = [
+        f"commit {ref}\n".encode(),
+        f"committer {NOTES_COMMITTER} {int(time.time())} +0000\n".encode(),
+        f"data {len(message)}\n".encode(),
+        message,
+    ]
+    if parent:
+        stream.append(f"from {parent}\n".encode())
+
+    for commit_sha, payloads in notes.items():
+        content = format_note(payloads).encode("utf-8")
+        stream.extend(
+            (
+                f"N inline {commit_sha}\n".encode(),
+                f"data {len(content)}\n".encode(),
+                content,
+            )
+        )
+
+    proc = git.fast_import("--quiet", istream=subprocess.PIPE, as_process=True)
+    proc.communicate(b"".join(stream))
+    # raises a GitCommandError if git fast-import exited with a failure
+    proc.wait()
+
+
+class GitNotesParseCache(ParseCache):
+    """
+    A cache of commit parse results stored as git notes under ``ref``, one note per
+    commit, rather than in a local database.
+
+    As the notes are part of the repository, they can be pushed & fetched like any
+    other ref (``git fetch origin 'refs/notes/*:refs/notes/*'``), so that a fresh
+    clone on a CI runner does not have to parse the commits of earlier runs again.
+
+    All notes are read at once on first use & the new results are written in bulk
+    when the cache is flushed. Notes are never evicted, each holds the results of
+    at most :py:data:`MAX_FINGERPRINTS_PER_NOTE` parser fingerprints.
+
+    :py:class:`~semantic_release.history.parse_cache.VersionCheckpoint` s are local
+    to the checkout, they are still stored in the database at ``path``.
+    """
+
+    def __init__(self, repo_dir: Path, path: Path, ref: str = NOTES_REF) -> None:
+        super().__init__(path)
+        self.git = Git(str(repo_dir))
+        self.ref = ref
+        self._notes: dict[str, dict[str, str]] | None = None
+        self._pending_notes: dict[str, dict[str, str]] = {}
+        self._notes_disabled = False
+
+    @property
+    def notes(self) -> dict[str, dict[str, str]]:
+        """The payloads of every note by commit & fingerprint, read on first use"""
+        if self._notes is None:
+            self._notes = {}
+            if not self._notes_disabled:
+                try:
+                    self._notes = read_notes(self.git, self.ref)
+                    logger.debug("read %s notes from %s", len(self._notes), self.ref)
+                except (GitCommandError, ValueError) as err:
+                    self._disable_notes(err)
+        return self._notes
+
+    def get(
+        self, commit: Commit, fingerprint: str
+    ) -> ParseResult | list[ParseResult] | None:
+        """Return the parse result of the given commit stored in its note, if any"""
+        if (payload := self.notes.get(commit.hexsha, {}).get(fingerprint)) is None:
+            self.misses += 1
+            return None
+
+        try:
+            result = load_parse_result(commit, payload)
+        except (ValueError, KeyError, TypeError) as err:
+            logger.debug("ignoring unreadable parse result note: %s", err)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return result
+
+    def put(
+        self,
+        commit: Commit,
+        fingerprint: str,
+        result: ParseResult | list[ParseResult],
+    ) -> None:
+        """Add the parse result to the note of the given commit, written on flush"""
+        if (
+            self._notes_disabled
+            or (payload := dump_parse_result(commit, result)) is None
+        ):
+            return
+
+        existing = self._pending_notes.get(commit.hexsha) or self.notes.get(
+            commit.hexsha, {}
+        )
+        # the latest result goes first, so that it is kept the longest
+        self._pending_notes[commit.hexsha] = {
+            fingerprint: payload,
+            **{key: value for key, value in existing.items() if key != fingerprint},
+        }
+
+    def flush(self) -> None:
+        """Write out the notes of all pending results in a single commit"""
+        if not self._pending_notes or self._notes_disabled:
+            return
+
+        try:
+            write_notes(self.git, self._pending_notes, self.ref)
+        except GitCommandError as err:
+            self._disable_notes(err)
+            return
+
+        self.notes.update(self._pending_notes)
+        self.stored += len(self._pending_notes)
+        self._pending_notes.clear()
+
+    def close(self) -> None:
+        """Write out the pending notes & close the database of the checkpoints"""
+        self.flush()
+        super().close()
+
+    def _disable_notes(self, err: Exception) -> None:
+        logger.warning("Disabling the parse cache in %s: %s", self.ref, err)
+        self._notes_disabled = True
+        self._pending_notes.clear()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__}: {self.ref}>"
@@ -0,0 +1,139 @@
+"""Parsing of large commit histories on a pool of worker processes."""
+
+from __future__ import annotations
+
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING
+
+from git.objects.commit import Commit
+from git.repo.base import Repo
+from git.util import hex_to_bin
+
+from semantic_release.globals import logger
+from semantic_release.history.commits import CommitRecord
+from semantic_release.history.parse_cache import dump_parse_result, load_parse_result
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Sequence
+
+    from semantic_release.commit_parser import (
+        CommitParser,
+        ParseResult,
+        ParserOptions,
+    )
+
+
+# Below this number of commits, starting the worker processes costs more than it saves
+MIN_PARALLEL_COMMITS = 2000
+
+# Lower bound of commits sent to a worker at once, keeps the IPC overhead low
+MIN_CHUNK_SIZE = 250
+
+# The parser & repository of the current worker process, set once by the pool initializer
+_worker_parser: CommitParser[ParseResult, ParserOptions] | None = None
+_worker_repo: Repo | None = None
+
+
+def resolve_workers(workers: int) -> int:
+    """Resolve the configured number of workers, where ``0`` means one per CPU"""
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def _init_worker(
+    commit_parser: CommitParser[ParseResult, ParserOptions], git_dir: str
+) -> None:
+    global _worker_parser, _worker_repo  # noqa: PLW0603
+    _worker_parser = commit_parser
+    _worker_repo = Repo(git_dir)
+
+
+def _parse_chunk(records: list[CommitRecord]) -> list[str | None]:
+    if _worker_parser is None or _worker_repo is None:
+        raise RuntimeError("worker process was not initialized with a parser")
+
+    payloads: list[str | None] = []
+    for record in records:
+        # Every attribute a parser usually reads is populated from the record,
+        # so the worker does not need to read the object database
+        commit = record.populate(Commit(_worker_repo, hex_to_bin(record.hexsha)))
+        commit.parents = tuple(
+            Commit(_worker_repo, hex_to_bin(sha)) for sha in record.parent_shas
+        )
+        payloads.append(dump_parse_result(commit, _worker_parser.parse(commit)))
+
+    return payloads
+
+
+def _is_picklable(obj: object) -> bool:
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, TypeError, AttributeError) as err:
+        logger.debug("%s can not be sent to worker processes: %s", obj, err)
+        return False
+    return True
+
+
+def parse_commits(
+    commit_parser: CommitParser[ParseResult, ParserOptions],
+    commits: Sequence[Commit],
+    workers: int = 1,
+) -> list[ParseResult | list[ParseResult]]:
+    """
+    Parse the given commits, spreading the work over ``workers`` processes.
+
+    The results are returned in the same order as ``commits`` & are bound to the
+    given commit objects, exactly as if every commit had been parsed in this
+    process. Histories smaller than :py:data:`MIN_PARALLEL_COMMITS`, parsers which
+    can not be pickled & results which can not be transferred back (custom result
+    types) are parsed serially instead.
+    """
+    workers = min(resolve_workers(workers), len(commits) // MIN_CHUNK_SIZE)
+
+    if (
+        workers < 2
+        or len(commits) < MIN_PARALLEL_COMMITS
+        or not _is_picklable(commit_parser)
+    ):
+        return [commit_parser.parse(commit) for commit in commits]
+
+    # A few chunks per worker so that an uneven distribution of expensive messages
+    # does not leave workers idle at the end
+    chunk_size = max(MIN_CHUNK_SIZE, -(-len(commits) // (workers * 4)))
+    chunks = [
+        [CommitRecord.from_commit(commit) for commit in commits[i : i + chunk_size]]
+        for i in range(0, len(commits), chunk_size)
+    ]
+
+    logger.debug(
+        "parsing %s commits in %s chunks on %s worker processes",
+        len(commits),
+        len(chunks),
+        workers,
+    )
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(commit_parser, str(commits[0].repo.git_dir)),
+        ) as executor:
+            # map() yields the chunks in submission order, regardless of which
+            # worker finishes first
+            payloads = [
+                payload
+                for chunk_payloads in executor.map(_parse_chunk, chunks)
+                for payload in chunk_payloads
+            ]
+    except (BrokenProcessPool, pickle.PicklingError) as err:
+        logger.warning("Parallel commit parsing failed, parsing serially: %s", err)
+        return [commit_parser.parse(commit) for commit in commits]
+
+    return [
+        commit_parser.parse(commit)
+        if payload is None
+        else load_parse_result(commit, payload)
+        for commit, payload in zip(commits, payloads)
+    ]
@@ -0,0 +1,541 @@
+"""Persistent, on-disk cache of commit parse results."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from enum import Enum
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from git.objects.commit import Commit
+
+import semantic_release
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.commit_parser.util import deep_copy_commit, force_str
+from semantic_release.enums import LevelBump
+from semantic_release.globals import logger
+from semantic_release.version.version import Version
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from typing import Iterable, Mapping
+
+    from typing_extensions import Self
+
+    from semantic_release.commit_parser import (
+        CommitParser,
+        ParseResult,
+        ParserOptions,
+    )
+
+
+# Directory (relative to the git directory) & file name of the default cache location
+DEFAULT_CACHE_DIR = "semantic-release"
+CACHE_FILE_NAME = "parse-cache.sqlite3"
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+# Bump whenever the layout of the table or of the serialized payload changes
+SCHEMA_VERSION = 1
+
+# Number of new results which are held in memory before they are written out
+_WRITE_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_results (
+    commit_sha TEXT NOT NULL,
+    parser_fingerprint TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (commit_sha, parser_fingerprint)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS checkpoints (
+    checkpoint_key TEXT NOT NULL PRIMARY KEY,
+    payload TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS tag_versions (
+    translator_fingerprint TEXT NOT NULL,
+    tag_name TEXT NOT NULL,
+    version TEXT,
+    PRIMARY KEY (translator_fingerprint, tag_name)
+) WITHOUT ROWID;
+"""
+
+
+class ParseCacheBackend(str, Enum):
+    """Where the parse results of the cache are stored"""
+
+    # A SQLite database in the cache directory
+    SQLITE = "sqlite"
+    # git notes of the commits, see semantic_release.history.notes_cache
+    GIT_NOTES = "git-notes"
+
+
+class VersionCheckpoint(NamedTuple):
+    """
+    The outcome of evaluating the commits of a branch since its latest release, so
+    that the next evaluation only has to evaluate the commits added since
+    """
+
+    head_sha: str
+    release_tag: str
+    """The tag of the latest release, empty if there was none"""
+
+    release_sha: str
+    level_bump: LevelBump
+    """The highest level bump of the commits between the release & the head"""
+
+    prerelease: bool
+
+
+class ParseCacheStats(NamedTuple):
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+    evicted: int = 0
+
+
+def parser_fingerprint(
+    commit_parser: CommitParser[ParseResult, ParserOptions],
+    *variants: str,
+) -> str:
+    """
+    Create a fingerprint which identifies the behavior of the given parser: the
+    parser class, its options & the version of semantic-release, as well as any
+    ``variants`` of what is given to the parser (e.g. merge commit stand-ins).
+
+    A change of any of these results in a different fingerprint and therefore in
+    a re-parse of every commit.
+    """
+    parser_cls = type(commit_parser)
+    return sha256(
+        str.join(
+            "\0",
+            [
+                str(SCHEMA_VERSION),
+                semantic_release.__version__,
+                f"{parser_cls.__module__}.{parser_cls.__qualname__}",
+                repr(commit_parser.options),
+                *variants,
+            ],
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def dump_parse_result(
+    commit: Commit, result: ParseResult | list[ParseResult]
+) -> str | None:
+    """
+    Serialize the parse result of ``commit`` into a JSON payload without the commit
+    object itself, returns ``None`` if the result can not be restored faithfully.
+    """
+    results = result if isinstance(result, list) else [result]
+    original_message = force_str(commit.message)
+    entries: list[dict[str, Any]] = []
+
+    for res in results:
+        # Only the built-in result types can be restored faithfully, results of
+        # custom types (e.g. subclasses with extra fields) are never cached
+        if type(res) is ParsedCommit:
+            entry: dict[str, Any] = {
+                "bump": int(res.bump),
+                "type": res.type,
+                "scope": res.scope,
+                "descriptions": res.descriptions,
+                "breaking_descriptions": res.breaking_descriptions,
+                "release_notices": res.release_notices,
+                "linked_issues": res.linked_issues,
+                "linked_merge_request": res.linked_merge_request,
+                "include_in_changelog": res.include_in_changelog,
+            }
+        elif type(res) is ParseError:
+            entry = {"error": res.error}
+        else:
+            return None
+
+        # Results of squashed commits are bound to an artificial copy of the commit
+        # with a partial message, only store the message when it differs
+        if (message := force_str(res.commit.message)) != original_message:
+            entry["message"] = message
+
+        entries.append(entry)
+
+    return json.dumps(
+        {"is_list": isinstance(result, list), "results": entries},
+        separators=(",", ":"),
+    )
+
+
+def load_parse_result(commit: Commit, payload: str) -> ParseResult | list[ParseResult]:
+    """Restore a parse result created by :py:func:`dump_parse_result` for ``commit``"""
+    data = json.loads(payload)
+    results: list[ParseResult] = []
+
+    for entry in data["results"]:
+        result_commit = (
+            commit
+            if "message" not in entry
+            else Commit(**{**deep_copy_commit(commit), "message": entry["message"]})
+        )
+
+        if "error" in entry:
+            results.append(ParseError(commit=result_commit, error=entry["error"]))
+            continue
+
+        results.append(
+            ParsedCommit(
+                bump=LevelBump(entry["bump"]),
+                type=entry["type"],
+                scope=entry["scope"],
+                descriptions=entry["descriptions"],
+                breaking_descriptions=entry["breaking_descriptions"],
+                commit=result_commit,
+                release_notices=tuple(entry["release_notices"]),
+                linked_issues=tuple(entry["linked_issues"]),
+                linked_merge_request=entry["linked_merge_request"],
+                include_in_changelog=entry["include_in_changelog"],
+            )
+        )
+
+    return results if data["is_list"] else results[0]
+
+
+def dump_version(version: Version | None) -> str | None:
+    """Serialize the parts of ``version`` which are not given by its tag format"""
+    if version is None:
+        return None
+
+    return json.dumps(
+        [
+            version.major,
+            version.minor,
+            version.patch,
+            version.prerelease_token,
+            version.prerelease_revision,
+            version.build_metadata,
+        ],
+        separators=(",", ":"),
+    )
+
+
+def load_version(payload: str | None, tag_format: str) -> Version | None:
+    """Restore a version created by :py:func:`dump_version` without parsing it"""
+    if payload is None:
+        return None
+
+    major, minor, patch, prerelease_token, prerelease_revision, build_metadata = (
+        json.loads(payload)
+    )
+    return Version(
+        major,
+        minor,
+        patch,
+        prerelease_token=prerelease_token,
+        prerelease_revision=prerelease_revision,
+        build_metadata=build_metadata,
+        tag_format=tag_format,
+    )
+
+
+class ParseCache:
+    """
+    A SQLite backed cache of commit parse results which persists between runs.
+
+    Results are keyed by the commit sha & the fingerprint of the parser that
+    produced them (see :py:func:`parser_fingerprint`), so a change of parser or of
+    parser options never returns a stale result. Once the stored results exceed
+    ``max_size`` bytes, the least recently used entries are evicted when the cache
+    is closed.
+
+    Alongside the parse results, it holds a :py:class:`VersionCheckpoint` per branch
+    & evaluation settings and the index of the version of every tag per tag format
+    (see :py:func:`~semantic_release.history.tags.indexed_tags_and_versions`), which
+    are small & never evicted.
+
+    The cache is an optimization only: any database error disables it for the rest
+    of the run and parsing continues as if no cache was configured.
+    """
+
+    def __init__(self, path: Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.evicted = 0
+        self._connection: sqlite3.Connection | None = None
+        self._disabled = False
+        self._pending_writes: list[tuple[str, str, str, int, int]] = []
+        self._pending_touches: list[tuple[int, str, str]] = []
+
+    @property
+    def stats(self) -> ParseCacheStats:
+        return ParseCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            stored=self.stored,
+            evicted=self.evicted,
+        )
+
+    @property
+    def connection(self) -> sqlite3.Connection | None:
+        """The database connection, opened (and created) on first use"""
+        if self._connection is None and not self._disabled:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._connection = sqlite3.connect(str(self.path), timeout=10)
+                self._connection.executescript(_SCHEMA)
+                logger.debug("opened parse cache at %s", self.path)
+            except (OSError, sqlite3.Error) as err:
+                self._disable(err)
+        return self._connection
+
+    def get(
+        self, commit: Commit, fingerprint: str
+    ) -> ParseResult | list[ParseResult] | None:
+        """Return the cached parse result of the given commit, if any"""
+        if (conn := self.connection) is None:
+            return None
+
+        try:
+            row = conn.execute(
+                "SELECT payload FROM parse_results "
+                "WHERE commit_sha = ? AND parser_fingerprint = ?",
+                (commit.hexsha, fingerprint),
+            ).fetchone()
+        except sqlite3.Error as err:
+            self._disable(err)
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        try:
+            result = load_parse_result(commit, row[0])
+        except (ValueError, KeyError, TypeError) as err:
+            logger.debug("ignoring unreadable parse cache entry: %s", err)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._pending_touches.append((int(time.time()), commit.hexsha, fingerprint))
+        return result
+
+    def put(
+        self,
+        commit: Commit,
+        fingerprint: str,
+        result: ParseResult | list[ParseResult],
+    ) -> None:
+        """Store the parse result of the given commit, written out in batches"""
+        if self._disabled or (payload := dump_parse_result(commit, result)) is None:
+            return
+
+        self._pending_writes.append(
+            (commit.hexsha, fingerprint, payload, len(payload), int(time.time()))
+        )
+        if len(self._pending_writes) >= _WRITE_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out all pending results & access times"""
+        if not (self._pending_writes or self._pending_touches):
+            return
+
+        if (conn := self.connection) is None:
+            return
+
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO parse_results "
+                    "(commit_sha, parser_fingerprint, payload, size, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    self._pending_writes,
+                )
+                conn.executemany(
+                    "UPDATE parse_results SET last_used = ? "
+                    "WHERE commit_sha = ? AND parser_fingerprint = ?",
+                    self._pending_touches,
+                )
+        except sqlite3.Error as err:
+            self._disable(err)
+            return
+
+        self.stored += len(self._pending_writes)
+        self._pending_writes.clear()
+        self._pending_touches.clear()
+
+    def get_checkpoint(self, key: str) -> VersionCheckpoint | None:
+        """Return the version checkpoint stored under ``key``, if any"""
+        if (conn := self.connection) is None:
+            return None
+
+        try:
+            row = conn.execute(
+                "SELECT payload FROM checkpoints WHERE checkpoint_key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as err:
+            self._disable(err)
+            return None
+
+        if row is None:
+            return None
+
+        try:
+            data = json.loads(row[0])
+            return VersionCheckpoint(
+                **{**data, "level_bump": LevelBump(data["level_bump"])}
+            )
+        except (ValueError, KeyError, TypeError) as err:
+            logger.debug("ignoring unreadable version checkpoint: %s", err)
+            return None
+
+    def put_checkpoint(self, key: str, checkpoint: VersionCheckpoint) -> None:
+        """Store the version checkpoint under ``key``, replacing any previous one"""
+        if (conn := self.connection) is None:
+            return
+
+        payload = json.dumps(
+            {**checkpoint._asdict(), "level_bump": int(checkpoint.level_bump)},
+            separators=(",", ":"),
+        )
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO checkpoints (checkpoint_key, payload) "
+                    "VALUES (?, ?)",
+                    (key, payload),
+                )
+        except sqlite3.Error as err:
+            self._disable(err)
+
+    def get_tag_versions(
+        self, fingerprint: str, tag_format: str
+    ) -> dict[str, Version | None] | None:
+        """
+        The version of every indexed tag name for the translator ``fingerprint``,
+        ``None`` for the tags which do not match its format. Returns ``None`` when
+        the cache is unavailable.
+        """
+        if (conn := self.connection) is None:
+            return None
+
+        try:
+            rows = conn.execute(
+                "SELECT tag_name, version FROM tag_versions "
+                "WHERE translator_fingerprint = ?",
+                (fingerprint,),
+            ).fetchall()
+        except sqlite3.Error as err:
+            self._disable(err)
+            return None
+
+        try:
+            return {name: load_version(version, tag_format) for name, version in rows}
+        except (ValueError, TypeError) as err:
+            logger.debug("ignoring unreadable tag version index: %s", err)
+            return {}
+
+    def update_tag_versions(
+        self,
+        fingerprint: str,
+        added: Mapping[str, Version | None],
+        removed: Iterable[str],
+    ) -> None:
+        """Add the versions of new tag names & remove the names of deleted tags"""
+        if (conn := self.connection) is None:
+            return
+
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO tag_versions "
+                    "(translator_fingerprint, tag_name, version) VALUES (?, ?, ?)",
+                    (
+                        (fingerprint, name, dump_version(version))
+                        for name, version in added.items()
+                    ),
+                )
+                conn.executemany(
+                    "DELETE FROM tag_versions "
+                    "WHERE translator_fingerprint = ? AND tag_name = ?",
+                    ((fingerprint, name) for name in removed),
+                )
+        except sqlite3.Error as err:
+            self._disable(err)
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits ``max_size``"""
+        if (conn := self.connection) is None:
+            return
+
+        try:
+            with conn:
+                evicted = conn.execute(
+                    """
+                    DELETE FROM parse_results WHERE (commit_sha, parser_fingerprint) IN (
+                        SELECT commit_sha, parser_fingerprint FROM (
+                            SELECT
+                                commit_sha,
+                                parser_fingerprint,
+                                SUM(size) OVER (
+                                    ORDER BY last_used DESC, commit_sha
+                                ) AS total_size
+                            FROM parse_results
+                        ) WHERE total_size > ?
+                    )
+                    """,
+                    (self.max_size,),
+                ).rowcount
+
+            if evicted > 0:
+                self.evicted += evicted
+                # Give the freed pages back to the filesystem
+                conn.execute("VACUUM")
+
+        except sqlite3.Error as err:
+            self._disable(err)
+
+    def close(self) -> None:
+        """Write out pending results, apply the size limit & close the database"""
+        if self._connection is not None:
+            self.flush()
+            self.evict()
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+        if self.hits or self.misses:
+            logger.info(
+                "parse cache: %s hits, %s misses, %s stored, %s evicted",
+                self.hits,
+                self.misses,
+                self.stored,
+                self.evicted,
+            )
+
+    def _disable(self, err: Exception) -> None:
+        logger.warning("Disabling the parse cache at %s: %s", self.path, err)
+        self._disabled = True
+        self._pending_writes.clear()
+        self._pending_touches.clear()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__}: {self.path}>"
@@ -0,0 +1,30 @@
+"""Awareness of partial clones, whose missing objects are fetched on demand."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from git.repo.base import Repo
+
+
+def is_partial_clone(repo: Repo) -> bool:
+    """
+    Whether the repository is a partial clone (e.g. ``git clone --filter=blob:none``),
+    i.e. reading the contents of any file of the history but the checked out one
+    may fetch it from the promisor remote.
+
+    The history itself (commits & tags) is always complete, everything this tool
+    reads to determine a version & the changelog.
+    """
+    promisor_settings = repo.git.config(
+        r"^(remote\..*\.promisor|extensions\.partialclone)$",
+        get_regexp=True,
+        with_exceptions=False,
+    )
+    return any(
+        value.lower() not in ("", "false")
+        for _, _, value in (
+            line.partition(" ") for line in promisor_settings.splitlines()
+        )
+    )
@@ -0,0 +1,179 @@
+"""The paths changed by each commit, read from a single ``git diff-tree`` process."""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+from semantic_release.globals import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import IO, Iterable, Iterator, Sequence
+
+    from git.repo.base import Repo
+
+
+# Each record starts with this separator (``%x01``) followed by the commit sha, the
+# changed paths follow NUL-terminated (``-z``) so that they may contain anything
+RECORD_SEPARATOR = b"\x01"
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+class ChangedPathIndex:
+    """
+    The paths (relative to the repository root) changed by each commit compared to
+    its first parent, loaded on demand in batches.
+
+    The shas of every batch are streamed into a single ``git diff-tree --stdin``
+    process rather than diffing one commit at a time. Each distinct path is stored
+    once, a commit only holds the ids of the paths it changed.
+
+    Merge commits are not diffed, they have no changed paths as their changes are
+    attributed to the merged commits. With ``first_parent`` (see
+    :py:attr:`~semantic_release.history.snapshot.HistorySnapshot.first_parent`) the
+    merged commits are not traversed, so merge commits are diffed against their
+    first parent instead, i.e. they changed everything they merged.
+    """
+
+    def __init__(self, repo: Repo, first_parent: bool = False) -> None:
+        self.repo = repo
+        self.first_parent = first_parent
+        self._path_ids: dict[str, int] = {}
+        self._paths: list[str] = []
+        self._changes: dict[str, tuple[int, ...]] = {}
+
+    def __contains__(self, sha: object) -> bool:
+        return sha in self._changes
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def load(self, shas: Iterable[str]) -> None:
+        """Read the changed paths of every given commit which is not loaded yet"""
+        pending = [sha for sha in dict.fromkeys(shas) if sha not in self._changes]
+        if not pending:
+            return
+
+        for sha, paths in _iter_diff_tree(self.repo, pending, self.first_parent):
+            self._changes[sha] = tuple(map(self._path_id, paths))
+
+        logger.debug(
+            "loaded the changed paths of %s commits (%s distinct paths)",
+            len(pending),
+            len(self._paths),
+        )
+
+    def paths(self, sha: str) -> frozenset[str]:
+        """The paths changed by the commit ``sha``, loaded if necessary"""
+        if sha not in self._changes:
+            self.load([sha])
+        return frozenset(self._paths[path_id] for path_id in self._changes[sha])
+
+    def _path_id(self, path: str) -> int:
+        if (path_id := self._path_ids.get(path)) is None:
+            path_id = self._path_ids[path] = len(self._paths)
+            self._paths.append(path)
+        return path_id
+
+
+def _write_shas(stdin: IO[bytes], shas: Sequence[str]) -> None:
+    try:
+        for sha in shas:
+            stdin.write(f"{sha}\n".encode())
+    except BrokenPipeError:
+        # git exited early, the error is raised when waiting for the process
+        pass
+    finally:
+        stdin.close()
+
+
+def _iter_diff_tree(
+    repo: Repo, shas: Sequence[str], first_parent: bool = False
+) -> Iterator[tuple[str, list[str]]]:
+    # With -m a merge commit is diffed against each of its parents in turn, every
+    # diff is a record of its own. Only the first one is kept, `--first-parent`
+    # is not honoured by git diff-tree.
+    proc = repo.git.diff_tree(
+        *(("-m",) if first_parent else ()),
+        "--stdin",
+        "--root",
+        "--always",
+        "--no-renames",
+        "-r",
+        "-z",
+        name_only=True,
+        no_color=True,
+        format="%x01%H",
+        istream=subprocess.PIPE,
+        as_process=True,
+    )
+    if proc.proc is None or proc.proc.stdin is None or proc.proc.stdout is None:
+        raise ValueError("git diff-tree process has no stdin or stdout stream")
+
+    # The shas are written from another thread, so that neither side of the pipe
+    # can block the other
+    writer = threading.Thread(
+        target=_write_shas, args=(proc.proc.stdin, shas), daemon=True
+    )
+    writer.start()
+
+    stream = proc.proc.stdout
+    sha = ""
+    paths: list[str] = []
+    # whether the current record is the diff of a merge against a further parent
+    skip = False
+    buffer = b""
+    while chunk := stream.read(_READ_CHUNK_SIZE):
+        buffer += chunk
+        *entries, buffer = buffer.split(b"\0")
+        for entry in entries:
+            if entry.startswith(RECORD_SEPARATOR):
+                record_sha = entry[1:].decode()
+                if skip := record_sha == sha:
+                    continue
+                if sha:
+                    yield sha, paths
+                sha, paths = record_sha, []
+            elif skip:
+                continue
+            elif entry:
+                # The first path of a commit is preceded by a newline
+                paths.append(
+                    (entry[1:] if not paths and entry[:1] == b"\n" else entry).decode(
+                        "utf-8", "replace"
+                    )
+                )
+
+    writer.join()
+    # raises a GitCommandError if git diff-tree exited with a failure
+    proc.wait()
+
+    if sha:
+        yield sha, paths
+
+
+def normalize_path_filter(path: str) -> str:
+    """
+    Normalize a path relative to the repository root for :py:func:`touches_paths`,
+    the root itself is represented by an empty string
+    """
+    normalized = PurePosixPath(path.replace("\\", "/")).as_posix().strip("/")
+    return "" if normalized == "." else normalized
+
+
+def touches_paths(changed: Iterable[str], path_filters: Sequence[str]) -> bool:
+    """
+    Whether any of the ``changed`` paths is (inside) one of the normalized
+    ``path_filters``
+    """
+    if "" in path_filters:
+        return True
+
+    return any(
+        path == path_filter or path.startswith(f"{path_filter}/")
+        for path in changed
+        for path_filter in path_filters
+    )
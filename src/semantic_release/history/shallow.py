@@ -0,0 +1,163 @@
+"""Deepening of shallow clones until the latest release is part of the history."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from semantic_release.globals import logger
+from semantic_release.history.tags import tags_and_versions
+
+if TYPE_CHECKING:  # pragma: no cover
+    from git.repo.base import Repo
+
+    from semantic_release.version.translator import VersionTranslator
+
+
+# Depth of the history the first deepening fetches, doubled with every following fetch
+DEFAULT_INITIAL_DEPTH = 50
+
+
+class RemoteTag(NamedTuple):
+    """A tag of the remote repository, as listed by ``git ls-remote``"""
+
+    name: str
+    commit_sha: str
+    """Peeled sha of the object the tag (eventually) points to"""
+
+
+def is_shallow(repo: Repo) -> bool:
+    """Whether the repository is a shallow clone"""
+    return repo.git.rev_parse(is_shallow_repository=True).strip() == "true"
+
+
+def shallow_commits(repo: Repo) -> set[str]:
+    """The commits at the boundary of a shallow clone, whose parents are missing"""
+    shallow_file = Path(repo.common_dir, "shallow")
+    if not shallow_file.exists():
+        return set()
+    return set(shallow_file.read_text().split())
+
+
+def list_remote_tags(repo: Repo, remote: str) -> list[RemoteTag]:
+    """
+    Every tag of the ``remote``, without fetching any object. Annotated tags are
+    peeled to the object they point to.
+    """
+    peeled: dict[str, str] = {}
+    for line in str(repo.git.ls_remote("--tags", remote)).splitlines():
+        sha, _, ref = line.partition("\t")
+        name = ref[len("refs/tags/") :]
+        if name.endswith("^{}"):
+            peeled[name[: -len("^{}")]] = sha
+        else:
+            peeled.setdefault(name, sha)
+
+    return [RemoteTag(name, sha) for name, sha in peeled.items()]
+
+
+class ShallowHistory:
+    """
+    Completes the history of a shallow clone (e.g. a CI checkout) as far as the
+    evaluation of a revision needs it, rather than requiring a full clone.
+
+    The history of the evaluated revision is deepened with ``git fetch --depth`` in
+    exponentially growing steps until the commit of the latest full release (as seen
+    by the translator) is part of it, then only the tags which point into the fetched
+    history are fetched. Without any release the history is fetched completely, as
+    every commit counts. Only the branch of the revision (or the revision itself, if
+    it is not a branch) is fetched, and after each step only the newly fetched
+    commits are read.
+
+    The tags of the ``remote`` are listed once, however many revisions and tag
+    formats are evaluated.
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        remote: str = "origin",
+        initial_depth: int = DEFAULT_INITIAL_DEPTH,
+    ) -> None:
+        self.repo = repo
+        self.remote = remote
+        self.initial_depth = initial_depth
+        self._remote_tags: list[RemoteTag] | None = None
+
+    @property
+    def remote_tags(self) -> list[RemoteTag]:
+        if self._remote_tags is None:
+            self._remote_tags = list_remote_tags(self.repo, self.remote)
+        return self._remote_tags
+
+    def complete(self, rev: str, translator: VersionTranslator) -> bool:
+        """
+        Deepen the history of ``rev`` until it includes the latest full release of
+        ``translator``'s format & fetch the tags of the releases within it.
+
+        Returns whether anything was fetched, which is never the case when the
+        repository is not shallow.
+        """
+        if not is_shallow(self.repo):
+            return False
+
+        releases = tags_and_versions(self.remote_tags, translator)
+        release_shas = {
+            tag.commit_sha for tag, version in releases if not version.is_prerelease
+        }
+
+        refspec = self._refspec(rev)
+        history = self._history(rev)
+        fetched = False
+        if not release_shas:
+            logger.info("no releases on %s, fetching the full history", self.remote)
+            self._fetch(refspec, unshallow=True)
+            history = self._history(rev)
+            fetched = True
+
+        # Unlike --deepen, which deepens the history of every shallow ref, --depth
+        # only applies to the history of the fetched ref
+        depth = self.initial_depth
+        while release_shas.isdisjoint(history) and (
+            boundary := shallow_commits(self.repo) & history
+        ):
+            logger.info("deepening the shallow history to %s commits", depth)
+            self._fetch(refspec, depth=depth)
+            # The newly fetched commits are the ancestors of the previous boundary
+            history.update(self._history(*boundary))
+            fetched = True
+            depth *= 2
+
+        local_tags = set(self.repo.git.tag(list=True).splitlines())
+        missing_tags = [
+            tag.name
+            for tag, _ in releases
+            if tag.commit_sha in history and tag.name not in local_tags
+        ]
+        if missing_tags:
+            logger.info("fetching %s release tags", len(missing_tags))
+            self._fetch(
+                *(f"refs/tags/{name}:refs/tags/{name}" for name in missing_tags)
+            )
+            fetched = True
+
+        return fetched
+
+    def _refspec(self, rev: str) -> str:
+        """
+        The refspec which fetches the history of ``rev`` alone: its branch on the
+        remote, or its commit if it is not a branch
+        """
+        ref = self.repo.git.rev_parse("--symbolic-full-name", rev).strip()
+        for prefix in ("refs/heads/", f"refs/remotes/{self.remote}/"):
+            if ref.startswith(prefix):
+                branch = ref[len(prefix) :]
+                return f"refs/heads/{branch}:refs/remotes/{self.remote}/{branch}"
+
+        return self.repo.git.rev_parse("--verify", f"{rev}^{{commit}}").strip()
+
+    def _history(self, *revs: str) -> set[str]:
+        return set(self.repo.git.rev_list(*revs).split())
+
+    def _fetch(self, *refspecs: str, **kwargs: int | bool) -> None:
+        self.repo.git.fetch(self.remote, *refspecs, no_tags=True, **kwargs)
@@ -0,0 +1,610 @@
+from __future__ import annotations
+
+from hashlib import sha256
+from typing import TYPE_CHECKING
+
+from semantic_release.commit_parser._base import supports_bump_parsing
+from semantic_release.commit_parser.token import ParsedCommit
+from semantic_release.enums import LevelBump
+from semantic_release.globals import logger
+from semantic_release.history.commits import (
+    MergeUnit,
+    TraversalMode,
+    iter_commits,
+    merge_unit,
+)
+from semantic_release.history.parallel import parse_commits
+from semantic_release.history.parse_cache import VersionCheckpoint, parser_fingerprint
+from semantic_release.history.paths import (
+    ChangedPathIndex,
+    normalize_path_filter,
+    touches_paths,
+)
+from semantic_release.history.tags import (
+    indexed_tags_and_versions,
+    iter_tag_records,
+    merged_tag_names,
+    tag_format_patterns,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Sequence
+
+    from git.objects.commit import Commit
+    from git.repo.base import Repo
+
+    from semantic_release.commit_parser import (
+        CommitParser,
+        ParseResult,
+        ParserOptions,
+    )
+    from semantic_release.history.parse_cache import ParseCache
+    from semantic_release.history.shallow import ShallowHistory
+    from semantic_release.history.tags import TagRecord
+    from semantic_release.version.translator import VersionTranslator
+    from semantic_release.version.version import Version
+
+
+class HistorySnapshot:
+    """
+    A per-run view of the repository history which is shared between every
+    consumer of a single command invocation (version calculation, the "already
+    released" check & the release history).
+
+    Everything is evaluated lazily and only once:
+
+    * the tag to version index is resolved on first access
+    * the commit history of ``rev`` is streamed from git on first access
+    * each commit is parsed at most once, no matter how many consumers ask for it
+      (and not at all when its result is found in the optional ``parse_cache``),
+      large batches of commits are parsed on ``parser_workers`` processes
+    * the paths changed by each commit are only read for the commits which are
+      checked against ``paths`` or ``exclude_paths``, in batches
+
+    A snapshot can be limited to the commits which change any of the given ``paths``
+    (relative to the repository root), e.g. to a single package of a monorepo, and
+    to the commits which change anything outside of the ``exclude_paths``, e.g. to
+    ignore commits which only change the documentation. See :py:meth:`is_relevant`.
+
+    With the ``FIRST_PARENT`` ``traversal`` only the mainline of ``rev`` is walked.
+    Each merge commit on it is parsed as a stand-in for everything it merged, see
+    :py:class:`MergeUnit`.
+
+    The level bump of a commit is determined with the bump-only mode of the parser
+    where possible, unless ``bump_parsing`` is disabled because the full results of
+    the same commits are needed anyway (e.g. for the release history).
+
+    A shallow clone is deepened by the optional ``shallow_history`` before the tags
+    or the history are first read, as far as the latest release of ``rev`` (see
+    :py:class:`ShallowHistory`).
+
+    The snapshot is only valid as long as the repository is not modified, it should
+    not be reused after a new commit or tag has been created.
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        translator: VersionTranslator,
+        commit_parser: CommitParser[ParseResult, ParserOptions],
+        rev: str = "HEAD",
+        parse_cache: ParseCache | None = None,
+        parser_workers: int = 1,
+        paths: Sequence[str] = (),
+        exclude_paths: Sequence[str] = (),
+        traversal: TraversalMode = TraversalMode.FULL,
+        merge_unit: MergeUnit = MergeUnit.MERGE_COMMIT,
+        shallow_history: ShallowHistory | None = None,
+        bump_parsing: bool = True,
+    ) -> None:
+        self.repo = repo
+        self.translator = translator
+        self.commit_parser = commit_parser
+        self.rev = rev
+        self.parse_cache = parse_cache
+        self.parser_workers = parser_workers
+        self.paths = tuple(normalize_path_filter(path) for path in paths)
+        self.exclude_paths = tuple(
+            normalize_path_filter(path) for path in exclude_paths
+        )
+        self.traversal = traversal
+        self.path_index = ChangedPathIndex(repo, first_parent=self.first_parent)
+        self.merge_unit = merge_unit
+        self.shallow_history = shallow_history
+        self._history_completed = shallow_history is None
+        self._parser_fingerprint: str | None = None
+        self._tag_records: list[TagRecord] | None = None
+        self._format_tag_records: list[TagRecord] | None = None
+        self._tags_and_versions: list[tuple[TagRecord, Version]] | None = None
+        self._merged_tag_names: set[str] | None = None
+        self._head_commit: Commit | None = None
+        self._branch: str | None = None
+        self._commits: list[Commit] | None = None
+        self._parse_results: dict[str, ParseResult | list[ParseResult]] = {}
+        self._bumps: dict[str, LevelBump] = {}
+        self.bump_parsing_supported = bump_parsing and supports_bump_parsing(
+            commit_parser
+        )
+
+    @property
+    def tag_records(self) -> list[TagRecord]:
+        """Every tag of the repository, regardless of the translator's format"""
+        self._complete_history()
+        if self._tag_records is None:
+            # All tags, their peeled commits & tagger details come from a single
+            # `git for-each-ref` call rather than per-tag object reads
+            self._tag_records = list(iter_tag_records(self.repo))
+        return self._tag_records
+
+    @property
+    def format_tag_records(self) -> list[TagRecord]:
+        """
+        The tags which start with the literal prefix of the translator's tag format,
+        i.e. every tag which may match it (see
+        :py:func:`~semantic_release.version.translator.tag_format_prefix`)
+        """
+        self._complete_history()
+        if self._format_tag_records is None:
+            if self._tag_records is not None:
+                # Every tag is loaded already (e.g. shared by another snapshot)
+                self._format_tag_records = [
+                    tag
+                    for tag in self._tag_records
+                    if tag.name.startswith(self.translator.tag_prefix)
+                ]
+            else:
+                # The tags of other formats (e.g. of other packages) are never read
+                self._format_tag_records = list(
+                    iter_tag_records(
+                        self.repo, *tag_format_patterns(self.translator.tag_format)
+                    )
+                )
+        return self._format_tag_records
+
+    @property
+    def tags_and_versions(self) -> list[tuple[TagRecord, Version]]:
+        """All tags matching the translator's format, sorted descending by version"""
+        if self._tags_and_versions is None:
+            self._tags_and_versions = indexed_tags_and_versions(
+                self.format_tag_records, self.translator, self.parse_cache
+            )
+        return self._tags_and_versions
+
+    @property
+    def historic_tags_and_versions(self) -> list[tuple[TagRecord, Version]]:
+        """
+        The tags & versions of :py:attr:`tags_and_versions` which point to a commit
+        in the history of ``rev``, sorted descending by version
+        """
+        self._complete_history()
+        if self._merged_tag_names is None:
+            # git answers the reachability query for all tags at once, without
+            # loading the history of rev
+            self._merged_tag_names = merged_tag_names(
+                self.repo, self.rev, *tag_format_patterns(self.translator.tag_format)
+            )
+
+        return [
+            (tag, version)
+            for tag, version in self.tags_and_versions
+            if tag.name in self._merged_tag_names
+        ]
+
+    @property
+    def released_versions(self) -> set[Version]:
+        return {version for _, version in self.tags_and_versions}
+
+    @property
+    def commits(self) -> list[Commit]:
+        """Every commit reachable from ``rev`` in topological order (newest first)"""
+        self._complete_history()
+        if self._commits is None:
+            self._commits = list(
+                iter_commits(
+                    self.repo,
+                    self.rev,
+                    topo_order=True,
+                    first_parent=self.first_parent,
+                )
+            )
+            logger.debug(
+                "loaded %s commits reachable from %s", len(self._commits), self.rev
+            )
+        return self._commits
+
+    def _complete_history(self) -> None:
+        if self._history_completed or self.shallow_history is None:
+            return
+
+        self._history_completed = True
+        if self.shallow_history.complete(self.rev, self.translator):
+            # Anything read before (e.g. shared by another snapshot) is incomplete
+            self._tag_records = None
+            self._format_tag_records = None
+            self._tags_and_versions = None
+            self._merged_tag_names = None
+            self._commits = None
+
+    @property
+    def first_parent(self) -> bool:
+        """Whether only the first parent of merge commits is traversed"""
+        return self.traversal is TraversalMode.FIRST_PARENT
+
+    def is_merge_unit(self, commit: Commit) -> bool:
+        """Whether the commit is parsed as a stand-in for everything it merged"""
+        return self.first_parent and len(commit.parents) > 1
+
+    @property
+    def is_path_limited(self) -> bool:
+        """Whether the relevance of a commit depends on the paths it changes"""
+        return bool((self.paths and "" not in self.paths) or self.exclude_paths)
+
+    def is_relevant(self, commit: Commit) -> bool:
+        """
+        Whether the commit changes any of the ``paths`` the snapshot is limited to
+        and anything outside of the ``exclude_paths``, always true for a snapshot
+        which is not limited by paths. Commits without changes (e.g. merge commits)
+        are only relevant when the snapshot is not limited to any ``paths``.
+
+        On a :py:attr:`first_parent` traversal a merge commit is checked against
+        the paths changed compared to its first parent, i.e. everything it merged,
+        as the merged commits themselves are not traversed.
+        """
+        if not self.is_path_limited:
+            return True
+
+        changed = self.path_index.paths(commit.hexsha)
+        if self.paths and not touches_paths(changed, self.paths):
+            return False
+
+        return not changed or any(
+            not touches_paths([path], self.exclude_paths) for path in changed
+        )
+
+    def relevant_commits(self, commits: Sequence[Commit]) -> list[Commit]:
+        """
+        The given commits which are relevant (see :py:meth:`is_relevant`), the
+        changed paths of all of them are read in one batch
+        """
+        if not self.is_path_limited:
+            return list(commits)
+
+        self.path_index.load(commit.hexsha for commit in commits)
+        return [commit for commit in commits if self.is_relevant(commit)]
+
+    @property
+    def head_commit(self) -> Commit:
+        """The commit ``rev`` points to, resolved without loading the history"""
+        if self._head_commit is None:
+            self._head_commit = self.repo.commit(self.rev)
+        return self._head_commit
+
+    @property
+    def fingerprint(self) -> str:
+        """The fingerprint of the parse results, see :py:func:`parser_fingerprint`"""
+        if self._parser_fingerprint is None:
+            self._parser_fingerprint = parser_fingerprint(
+                self.commit_parser,
+                *(
+                    [f"{self.traversal.value}:{self.merge_unit.value}"]
+                    if self.first_parent
+                    else []
+                ),
+            )
+        return self._parser_fingerprint
+
+    def parse(self, commit: Commit) -> ParseResult | list[ParseResult]:
+        """Parse the given commit, re-using the result of any previous parse"""
+        if (result := self._parse_results.get(commit.hexsha)) is None:
+            result = self.parse_many([commit])[0]
+        return result
+
+    def parse_many(
+        self, commits: Sequence[Commit]
+    ) -> list[ParseResult | list[ParseResult]]:
+        """
+        Parse the given commits, re-using the result of any previous parse.
+
+        Commits which are neither already parsed nor found in the ``parse_cache``
+        are parsed together, on ``parser_workers`` processes when the number of
+        commits is large enough. The results are returned in the order of
+        ``commits``.
+        """
+        pending = list(
+            {
+                commit.hexsha: commit
+                for commit in commits
+                if commit.hexsha not in self._parse_results
+            }.values()
+        )
+
+        # On a first parent traversal a merge commit is bound to a copy with a single
+        # parent, so that its results are neither ignored as those of a merge commit
+        # nor restored from the cache as such
+        stand_ins = {
+            commit.hexsha: merge_unit(commit, MergeUnit.MERGE_COMMIT)
+            for commit in pending
+            if self.is_merge_unit(commit)
+        }
+
+        if pending and self.parse_cache is not None:
+            uncached = []
+            for commit in pending:
+                if (
+                    result := self.parse_cache.get(
+                        stand_ins.get(commit.hexsha, commit), self.fingerprint
+                    )
+                ) is None:
+                    uncached.append(commit)
+                    continue
+                self._parse_results[commit.hexsha] = result
+
+            pending = uncached
+
+        if pending:
+            for commit, result in zip(
+                pending,
+                parse_commits(
+                    self.commit_parser,
+                    [
+                        merge_unit(commit, self.merge_unit)
+                        if commit.hexsha in stand_ins
+                        else commit
+                        for commit in pending
+                    ],
+                    self.parser_workers,
+                ),
+            ):
+                self._parse_results[commit.hexsha] = result
+                if self.parse_cache is not None:
+                    self.parse_cache.put(
+                        stand_ins.get(commit.hexsha, commit),
+                        self.fingerprint,
+                        result,
+                    )
+
+        return [self._parse_results[commit.hexsha] for commit in commits]
+
+    def parse_bump(self, commit: Commit) -> LevelBump:
+        """
+        The highest level bump of the given commit.
+
+        Uses the bump-only mode of the parser when it provides one (see
+        :py:func:`supports_bump_parsing`) and the commit has not been fully parsed
+        already, otherwise the bump is taken from the full parse results.
+        """
+        if (bump := self._bumps.get(commit.hexsha)) is not None:
+            return bump
+
+        if (
+            self.bump_parsing_supported
+            and commit.hexsha not in self._parse_results
+            and not self.is_merge_unit(commit)
+        ):
+            bump = self.commit_parser.parse_bump(commit)  # type: ignore[attr-defined]
+        else:
+            parse_result = self.parse(commit)
+            bump = max(
+                (
+                    result.bump
+                    for result in (
+                        parse_result
+                        if isinstance(parse_result, list)
+                        else [parse_result]
+                    )
+                    if isinstance(result, ParsedCommit)
+                ),
+                default=LevelBump.NO_RELEASE,
+            )
+
+        self._bumps[commit.hexsha] = bump
+        return bump
+
+    @property
+    def branch(self) -> str:
+        """The full name of the branch ``rev`` refers to, empty for any other rev"""
+        if self._branch is None:
+            name = self.repo.git.rev_parse(
+                self.rev, symbolic_full_name=True, with_exceptions=False
+            ).strip()
+            self._branch = name if name.startswith("refs/heads/") else ""
+        return self._branch
+
+    def _checkpoint_key(self, prerelease: bool, max_level: LevelBump) -> str:
+        # Everything the outcome of the evaluation of the branch depends on
+        return sha256(
+            repr(
+                (
+                    self.branch,
+                    self.fingerprint,
+                    self.translator.tag_format,
+                    self.translator.prerelease_token,
+                    self.paths,
+                    self.exclude_paths,
+                    prerelease,
+                    int(max_level),
+                )
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def load_checkpoint(
+        self, release_tag: str, prerelease: bool, max_level: LevelBump
+    ) -> VersionCheckpoint | None:
+        """
+        The checkpoint of the previous evaluation of the branch ``rev`` refers to, if
+        it is still valid: it was made with the same settings, the latest release is
+        still ``release_tag`` (pointing to the same commit) & its head is part of the
+        history of ``rev`` (i.e. the branch has not been rewritten since).
+
+        Checkpoints are stored in the ``parse_cache``, there are none without it or
+        when ``rev`` is not a branch.
+        """
+        if self.parse_cache is None or not self.branch:
+            return None
+
+        key = self._checkpoint_key(prerelease, max_level)
+        if (checkpoint := self.parse_cache.get_checkpoint(key)) is None:
+            return None
+
+        if (checkpoint.release_tag, checkpoint.release_sha) != (
+            release_tag,
+            self._release_sha(release_tag),
+        ):
+            logger.debug(
+                "version checkpoint of %s is outdated by a release", self.branch
+            )
+            return None
+
+        head_sha = self.head_commit.hexsha
+        if checkpoint.head_sha != head_sha and not self.is_ancestor(
+            checkpoint.head_sha, head_sha
+        ):
+            logger.debug("version checkpoint of %s is not in its history", self.branch)
+            return None
+
+        return checkpoint
+
+    def save_checkpoint(
+        self,
+        release_tag: str,
+        prerelease: bool,
+        max_level: LevelBump,
+        level_bump: LevelBump,
+    ) -> None:
+        """
+        Store the highest ``level_bump`` of the commits between the ``release_tag``
+        & the head of the branch ``rev`` refers to, see :py:meth:`load_checkpoint`
+        """
+        if self.parse_cache is None or not self.branch:
+            return
+
+        self.parse_cache.put_checkpoint(
+            self._checkpoint_key(prerelease, max_level),
+            VersionCheckpoint(
+                head_sha=self.head_commit.hexsha,
+                release_tag=release_tag,
+                release_sha=self._release_sha(release_tag),
+                level_bump=level_bump,
+                prerelease=prerelease,
+            ),
+        )
+
+    def is_ancestor(self, ancestor_sha: str, sha: str) -> bool:
+        """
+        Whether the commit ``ancestor_sha`` is in the history of ``sha``, also false
+        when it no longer exists (e.g. after a force push)
+        """
+        status, _, _ = self.repo.git.merge_base(
+            "--is-ancestor",
+            ancestor_sha,
+            sha,
+            with_extended_output=True,
+            with_exceptions=False,
+        )
+        return status == 0
+
+    def _release_sha(self, release_tag: str) -> str:
+        return next(
+            (
+                tag.commit_sha
+                for tag, _ in self.tags_and_versions
+                if tag.name == release_tag
+            ),
+            "",
+        )
+
+    def derive(
+        self,
+        rev: str,
+        reuse_tags: bool = True,
+        translator: VersionTranslator | None = None,
+        paths: Sequence[str] | None = None,
+        exclude_paths: Sequence[str] | None = None,
+    ) -> HistorySnapshot:
+        """
+        A snapshot of ``rev`` for the same or a later state of the same repository,
+        optionally with a different ``translator`` (e.g. another tag format) or
+        limited by other ``paths`` & ``exclude_paths``.
+
+        The parse results & changed paths are shared with this snapshot, they stay
+        valid as they are keyed by the commit sha. The tags are re-used as well unless
+        ``reuse_tags`` is false, i.e. the tags have changed since this snapshot
+        was created. The history of ``rev`` is only re-used if it is the ``rev`` of
+        this snapshot.
+        """
+        snapshot = HistorySnapshot(
+            repo=self.repo,
+            translator=translator or self.translator,
+            commit_parser=self.commit_parser,
+            rev=rev,
+            parse_cache=self.parse_cache,
+            parser_workers=self.parser_workers,
+            paths=self.paths if paths is None else paths,
+            exclude_paths=(
+                self.exclude_paths if exclude_paths is None else exclude_paths
+            ),
+            traversal=self.traversal,
+            merge_unit=self.merge_unit,
+            shallow_history=self.shallow_history,
+            bump_parsing=self.bump_parsing_supported,
+        )
+        snapshot._parser_fingerprint = self._parser_fingerprint  # noqa: SLF001
+        snapshot._parse_results = self._parse_results  # noqa: SLF001
+        snapshot._bumps = self._bumps  # noqa: SLF001
+        snapshot.path_index = self.path_index
+
+        # The tags which are read are limited to the prefix of the tag format
+        same_tag_format = snapshot.translator.tag_format == self.translator.tag_format
+        if reuse_tags:
+            snapshot._tag_records = self._tag_records  # noqa: SLF001
+            if same_tag_format:
+                snapshot._format_tag_records = self._format_tag_records  # noqa: SLF001
+            if translator is None:
+                snapshot._tags_and_versions = self._tags_and_versions  # noqa: SLF001
+
+        if rev == self.rev:
+            if translator is None:
+                # The latest release of another tag format may be further back
+                snapshot._history_completed = self._history_completed  # noqa: SLF001
+            snapshot._head_commit = self._head_commit  # noqa: SLF001
+            snapshot._branch = self._branch  # noqa: SLF001
+            snapshot._commits = self._commits  # noqa: SLF001
+            if reuse_tags and same_tag_format:
+                snapshot._merged_tag_names = self._merged_tag_names  # noqa: SLF001
+
+        return snapshot
+
+    def excluding(self, exclude_paths: Sequence[str]) -> HistorySnapshot:
+        """
+        This snapshot, additionally ignoring the commits which only change any of
+        the ``exclude_paths``
+        """
+        if not exclude_paths:
+            return self
+
+        return self.derive(
+            self.rev, exclude_paths=(*self.exclude_paths, *exclude_paths)
+        )
+
+    def without_exclusions(self) -> HistorySnapshot:
+        """
+        This snapshot, no longer ignoring the commits which only change the
+        ``exclude_paths``, it is still limited to its ``paths``
+        """
+        if not self.exclude_paths:
+            return self
+
+        return self.derive(self.rev, exclude_paths=())
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__qualname__}: rev={self.rev!r}, "
+            + ("first-parent, " if self.first_parent else "")
+            + (f"paths={list(self.paths)!r}, " if self.paths else "")
+            + (
+                f"exclude_paths={list(self.exclude_paths)!r}, "
+                if self.exclude_paths
+                else ""
+            )
+            + f"{len(self._parse_results)} commits parsed>"
+        )
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import logging
+from hashlib import sha256
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+from git.objects.util import utctz_to_altz
+from git.util import Actor
+
+import semantic_release
+from semantic_release.errors import InvalidVersion
+from semantic_release.globals import logger
+from semantic_release.version.translator import tag_format_prefix
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterable, Iterator, Mapping, Protocol, Sequence
+
+    from git.repo.base import Repo
+
+    from semantic_release.history.parse_cache import ParseCache
+    from semantic_release.version.translator import VersionTranslator
+    from semantic_release.version.version import Version
+
+    class NamedRef(Protocol):
+        @property
+        def name(self) -> str: ...
+
+
+_RefT = TypeVar("_RefT", bound="NamedRef")
+
+FIELD_SEPARATOR = "\x1f"
+
+GIT_FOR_EACH_REF_FORMAT = str.join(
+    "%1f",
+    [
+        "%(refname:strip=2)",  # tag name
+        "%(objecttype)",  # "tag" for annotated tags, otherwise the target type
+        "%(objectname)",  # sha the ref points to
+        "%(*objecttype)",  # type of the object an annotated tag points to
+        "%(*objectname)",  # sha of the object an annotated tag points to
+        "%(taggername)",
+        "%(taggeremail)",
+        "%(taggerdate:raw)",
+        "%(authorname)",  # lightweight tags: fields of the target commit
+        "%(authoremail)",
+        "%(authordate:raw)",
+        "%(committerdate:raw)",
+    ],
+)
+
+_NUM_FIELDS = GIT_FOR_EACH_REF_FORMAT.count("%1f") + 1
+
+
+class TagRecord(NamedTuple):
+    """
+    A lightweight representation of a single tag and the commit it (eventually)
+    points to, as read from ``git for-each-ref``.
+
+    For annotated tags the tagger fields are the tagger of the tag object, for
+    lightweight tags they fall back to the author of the tagged commit.
+    """
+
+    name: str
+    object_sha: str
+    commit_sha: str
+    """Peeled commit sha, or an empty string if the tag does not point to a commit"""
+
+    is_annotated: bool
+    tagger: Actor
+    tagged_date: int
+    tagger_tz_offset: int
+    """The timezone of ``tagged_date`` in seconds west of UTC (like GitPython)"""
+
+    def __str__(self) -> str:
+        return self.name
+
+    @staticmethod
+    def from_ref_entry(entry: str) -> TagRecord:
+        """Create a record from a single line of the for-each-ref output"""
+        fields = entry.split(FIELD_SEPARATOR)
+        if len(fields) != _NUM_FIELDS:
+            raise ValueError(f"Unexpected git for-each-ref entry: {entry[:80]!r}")
+
+        (
+            name,
+            object_type,
+            object_sha,
+            target_type,
+            target_sha,
+            tagger_name,
+            tagger_email,
+            tagger_date,
+            author_name,
+            author_email,
+            author_date,
+            committer_date,
+        ) = fields
+
+        if object_type == "tag":
+            tagged_date, tz_offset = _parse_raw_date(tagger_date)
+            return TagRecord(
+                name=name,
+                object_sha=object_sha,
+                # A tag of a tag is left unresolved here, see iter_tag_records()
+                commit_sha=target_sha if target_type == "commit" else "",
+                is_annotated=True,
+                tagger=Actor(tagger_name, tagger_email.strip("<>")),
+                tagged_date=tagged_date,
+                tagger_tz_offset=tz_offset,
+            )
+
+        # lightweight tags use the details of the commit, if any
+        _, tz_offset = _parse_raw_date(author_date)
+        committed_date, _ = _parse_raw_date(committer_date)
+        return TagRecord(
+            name=name,
+            object_sha=object_sha,
+            commit_sha=object_sha if object_type == "commit" else "",
+            is_annotated=False,
+            tagger=Actor(author_name, author_email.strip("<>")),
+            tagged_date=committed_date,
+            tagger_tz_offset=tz_offset,
+        )
+
+
+def _parse_raw_date(raw_date: str) -> tuple[int, int]:
+    # Output of the :raw date format is "<seconds since epoch> <+/-hhmm>",
+    # which is empty when the field does not apply to the object type
+    timestamp, _, utc_offset = raw_date.partition(" ")
+    return int(timestamp or 0), utctz_to_altz(utc_offset or "+0000")
+
+
+def iter_tag_records(repo: Repo, *patterns: str) -> Iterator[TagRecord]:
+    """
+    Read every tag (optionally limited to the given ``refs/tags/...`` patterns)
+    including its peeled commit and tagger details with a single
+    ``git for-each-ref`` call.
+    """
+    output = repo.git.for_each_ref(
+        *(patterns or ("refs/tags",)),
+        format=GIT_FOR_EACH_REF_FORMAT,
+    )
+
+    for line in output.splitlines():
+        if not line:
+            continue
+
+        record = TagRecord.from_ref_entry(line)
+
+        if record.is_annotated and not record.commit_sha:
+            # Rare: a tag of a tag (or of a non-commit object), peel it fully
+            record = record._replace(
+                commit_sha=repo.git.rev_parse(
+                    f"{record.object_sha}^{{commit}}",
+                    verify=True,
+                    quiet=True,
+                    with_exceptions=False,
+                ).strip()
+            )
+
+        yield record
+
+
+def merged_tag_names(repo: Repo, rev: str, *patterns: str) -> set[str]:
+    """
+    The names of all tags (optionally limited to the given ``refs/tags/...``
+    patterns) which point to a commit in the history of ``rev``.
+
+    Reachability is resolved by git (using commit-graph generation numbers where
+    available), so the cost scales with the number of tags rather than with the
+    size of the history.
+    """
+    return set(
+        repo.git.for_each_ref(
+            *(patterns or ("refs/tags",)),
+            format="%(refname:strip=2)",
+            merged=rev,
+        ).splitlines()
+    )
+
+
+def tag_format_patterns(tag_format: str) -> tuple[str, ...]:
+    """
+    The ``refs/tags/...`` patterns of :py:func:`iter_tag_records` &
+    :py:func:`merged_tag_names` which only list the tags starting with the prefix
+    of ``tag_format``, none if it has no prefix.
+
+    Only the prefix is used: the suffix of a format is not anchored at the end of
+    the tag (``v{version}-a`` matches ``v1.0.0-a-b``), nor does the ``*`` of a
+    pattern match a ``/`` (which no valid version contains).
+    """
+    prefix = tag_format_prefix(tag_format)
+    return (f"refs/tags/{prefix}*",) if prefix else ()
+
+
+def tag_version(tag_name: str, translator: VersionTranslator) -> Version | None:
+    """
+    The version of the tag according to `translator`, or ``None`` if the tag is
+    not matched by it or is not a valid version
+    """
+    try:
+        return translator.from_tag(tag_name)
+    except (NotImplementedError, InvalidVersion) as e:
+        logger.warning(
+            "Couldn't parse tag %s as as Version: %s",
+            tag_name,
+            str(e),
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+        return None
+
+
+def tags_and_versions(
+    tags: Iterable[_RefT],
+    translator: VersionTranslator,
+    known_versions: Mapping[str, Version | None] | None = None,
+) -> list[tuple[_RefT, Version]]:
+    """
+    Return a list of 2-tuples, where each element is a tuple (tag, version)
+    from the tags in the Git repo and their corresponding `Version` according
+    to `Version.from_tag`. The returned list is sorted according to semver
+    ordering rules.
+
+    Tags which are not matched by `translator` are ignored. The versions of the tag
+    names in `known_versions` are taken from it rather than parsed again.
+    """
+    known_versions = known_versions or {}
+    ts_and_vs: list[tuple[_RefT, Version]] = []
+    for tag in tags:
+        version = (
+            known_versions[tag.name]
+            if tag.name in known_versions
+            else tag_version(tag.name, translator)
+        )
+        if version:
+            ts_and_vs.append((tag, version))
+
+    logger.info("found %s previous tags", len(ts_and_vs))
+    return sorted(ts_and_vs, reverse=True, key=lambda v: v[1])
+
+
+def translator_fingerprint(translator: VersionTranslator) -> str:
+    """
+    Identifies how the translator turns tag names into versions, i.e. its tag format
+    & prerelease token as well as the version of semantic-release
+    """
+    translator_cls = type(translator)
+    return sha256(
+        str.join(
+            "\0",
+            [
+                semantic_release.__version__,
+                f"{translator_cls.__module__}.{translator_cls.__qualname__}",
+                translator.tag_format,
+                translator.prerelease_token,
+            ],
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def indexed_tags_and_versions(
+    tags: Sequence[_RefT],
+    translator: VersionTranslator,
+    parse_cache: ParseCache | None,
+) -> list[tuple[_RefT, Version]]:
+    """
+    Like :py:func:`tags_and_versions`, with the version of each tag name looked up
+    in the index of the ``parse_cache`` rather than parsed.
+
+    The index is updated incrementally: only the tag names which were added since
+    the last run are parsed & the names of deleted tags are removed. Without a
+    cache, every tag is parsed.
+    """
+    fingerprint = translator_fingerprint(translator)
+    if (
+        parse_cache is None
+        or (index := parse_cache.get_tag_versions(fingerprint, translator.tag_format))
+        is None
+    ):
+        return tags_and_versions(tags, translator)
+
+    tag_names = dict.fromkeys(tag.name for tag in tags)
+    added = {
+        name: tag_version(name, translator) for name in tag_names if name not in index
+    }
+    removed = [name for name in index if name not in tag_names]
+    if added or removed:
+        logger.debug(
+            "tag version index: %s tags added, %s removed", len(added), len(removed)
+        )
+        parse_cache.update_tag_versions(fingerprint, added, removed)
+
+    return tags_and_versions(tags, translator, known_versions={**index, **added})
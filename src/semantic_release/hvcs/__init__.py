@@ -1,10 +1,17 @@
-from semantic_release.hvcs._base import HvcsBase
-from semantic_release.hvcs.bitbucket import Bitbucket
-from semantic_release.hvcs.gitea import Gitea
-from semantic_release.hvcs.github import Github
-from semantic_release.hvcs.gitlab import Gitlab
-from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
-from semantic_release.hvcs.token_auth import TokenAuth
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from semantic_release.helpers import lazy_module_attributes
+
+if TYPE_CHECKING:  # pragma: no cover
+    from semantic_release.hvcs._base import HvcsBase
+    from semantic_release.hvcs.bitbucket import Bitbucket
+    from semantic_release.hvcs.gitea import Gitea
+    from semantic_release.hvcs.github import Github
+    from semantic_release.hvcs.gitlab import Gitlab
+    from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
+    from semantic_release.hvcs.token_auth import TokenAuth
 
 __all__ = [
     "Bitbucket",
@@ -15,3 +22,18 @@ __all__ = [
     "RemoteHvcsBase",
     "TokenAuth",
 ]
+
+# Clients are only imported once they are used, e.g. python-gitlab is not loaded
+# for a GitHub project
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "Bitbucket": f"{__name__}.bitbucket",
+        "Gitea": f"{__name__}.gitea",
+        "Github": f"{__name__}.github",
+        "Gitlab": f"{__name__}.gitlab",
+        "HvcsBase": f"{__name__}._base",
+        "RemoteHvcsBase": f"{__name__}.remote_hvcs_base",
+        "TokenAuth": f"{__name__}.token_auth",
+    },
+)
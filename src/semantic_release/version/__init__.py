@@ -1,7 +1,36 @@
-import semantic_release.version.declaration as declaration
-from semantic_release.version.algorithm import (
-    next_version,
-    tags_and_versions,
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from semantic_release.helpers import lazy_module_attributes
+
+if TYPE_CHECKING:  # pragma: no cover
+    import semantic_release.version.declaration as declaration
+    from semantic_release.version.algorithm import (
+        next_version,
+        next_versions,
+        tags_and_versions,
+    )
+    from semantic_release.version.translator import VersionTranslator
+    from semantic_release.version.version import Version
+
+__all__ = [
+    "Version",
+    "VersionTranslator",
+    "declaration",
+    "next_version",
+    "next_versions",
+    "tags_and_versions",
+]
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "declaration": f"{__name__}.declaration",
+        "next_version": f"{__name__}.algorithm",
+        "next_versions": f"{__name__}.algorithm",
+        "tags_and_versions": f"{__name__}.algorithm",
+        "VersionTranslator": f"{__name__}.translator",
+        "Version": f"{__name__}.version",
+    },
 )
-from semantic_release.version.translator import VersionTranslator
-from semantic_release.version.version import Version
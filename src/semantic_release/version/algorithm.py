@@ -1,24 +1,22 @@
 from __future__ import annotations
 
-import logging
-from contextlib import suppress
-from functools import reduce
-from queue import LifoQueue
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING
 
 from semantic_release.commit_parser import ParsedCommit
 from semantic_release.commit_parser.token import ParseError
 from semantic_release.const import DEFAULT_VERSION
 from semantic_release.enums import LevelBump, SemanticReleaseLogLevels
-from semantic_release.errors import InternalError, InvalidVersion
+from semantic_release.errors import InternalError
 from semantic_release.globals import logger
 from semantic_release.helpers import validate_types_in_sequence
+from semantic_release.history.commits import iter_commits
+from semantic_release.history.snapshot import HistorySnapshot
+from semantic_release.history.tags import tags_and_versions
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Sequence
+    from typing import Iterable, Iterator, Sequence
 
     from git.objects.commit import Commit
-    from git.refs.tag import Tag
     from git.repo.base import Repo
 
     from semantic_release.commit_parser import (
@@ -30,78 +28,47 @@ if TYPE_CHECKING:  # pragma: no cover
     from semantic_release.version.version import Version
 
 
-def tags_and_versions(
-    tags: Iterable[Tag], translator: VersionTranslator
-) -> list[tuple[Tag, Version]]:
-    """
-    Return a list of 2-tuples, where each element is a tuple (tag, version)
-    from the tags in the Git repo and their corresponding `Version` according
-    to `Version.from_tag`. The returned list is sorted according to semver
-    ordering rules.
-
-    Tags which are not matched by `translator` are ignored.
-    """
-    ts_and_vs: list[tuple[Tag, Version]] = []
-    for tag in tags:
-        try:
-            version = translator.from_tag(tag.name)
-        except (NotImplementedError, InvalidVersion) as e:
-            logger.warning(
-                "Couldn't parse tag %s as as Version: %s",
-                tag.name,
-                str(e),
-                exc_info=logger.isEnabledFor(logging.DEBUG),
-            )
-            continue
-
-        if version:
-            ts_and_vs.append((tag, version))
+# tags_and_versions() has moved to semantic_release.history.tags, it is re-exported
+# for the code which imports it from here
+__all__ = [
+    "next_version",
+    "next_versions",
+    "tags_and_versions",
+]
 
-    logger.info("found %s previous tags", len(ts_and_vs))
-    return sorted(ts_and_vs, reverse=True, key=lambda v: v[1])
+# Number of commits parsed before the first check for an early stop, doubled with
+# every following batch
+_INITIAL_PARSE_BATCH_SIZE = 64
 
 
 def _traverse_graph_for_commits(
     head_commit: Commit,
     latest_release_tag_str: str = "",
+    first_parent: bool = False,
+    since_sha: str = "",
 ) -> Sequence[Commit]:
-    # Depth-first search
-    def dfs(start_commit: Commit, stop_nodes: set[Commit]) -> Sequence[Commit]:
-        # Create a stack for DFS
-        stack: LifoQueue[Commit] = LifoQueue()
-
-        # Create a set to store visited graph nodes (commit objects in this case)
-        visited: set[Commit] = set()
-
-        # Initialize the result
-        commits: list[Commit] = []
-
-        # Add the source node in the queue to start the search
-        stack.put(start_commit)
-
-        # Traverse the git history capturing each commit found before it reaches a stop node
-        while not stack.empty():
-            if (node := stack.get()) in visited or node in stop_nodes:
-                continue
-
-            visited.add(node)
-            commits.append(node)
-
-            # Add all parent commits to the stack from left to right so that the rightmost is popped first
-            # as the left side is generally the merged into branch
-            for parent in node.parents:
-                stack.put(parent)
-
-        return commits
-
-    # Run a Depth First Search to find all the commits since the last release
-    return dfs(
-        start_commit=head_commit,
-        stop_nodes=set(
-            head_commit.repo.iter_commits(latest_release_tag_str)
-            if latest_release_tag_str
-            else []
-        ),
+    """
+    Return every commit reachable from `head_commit` that is not reachable from the
+    given release tag (i.e. ``git log HEAD ^tag``), in topological order. Only the
+    first parent of merge commits is followed when `first_parent` is set. Commits
+    reachable from `since_sha` (e.g. evaluated by a previous run) are left out too.
+
+    The range is resolved by git itself, so the cost scales with the number of
+    unreleased commits rather than with the age of the repository.
+    """
+    exclusions = [
+        # Fully qualified to avoid any ambiguity with a branch of the same name
+        *([f"^refs/tags/{latest_release_tag_str}"] if latest_release_tag_str else []),
+        *([f"^{since_sha}"] if since_sha else []),
+    ]
+    return list(
+        iter_commits(
+            head_commit.repo,
+            head_commit.hexsha,
+            *exclusions,
+            topo_order=True,
+            first_parent=first_parent,
+        )
     )
 
 
@@ -241,6 +208,110 @@ def _increment_version(
     return target_next_version
 
 
+def _max_reachable_level(
+    latest_version: Version,
+    allow_zero_version: bool,
+    major_on_zero: bool,
+) -> LevelBump:
+    """
+    The highest level bump that can still change the outcome of
+    :py:func:`_increment_version` for the given settings, any higher level results
+    in the same next version.
+    """
+    if latest_version.major == 0:
+        if not allow_zero_version:
+            # Always bumped to 1.0.0, regardless of the commits
+            return LevelBump.NO_RELEASE
+
+        if not major_on_zero:
+            # Breaking changes are reduced to a minor bump
+            return LevelBump.MINOR
+
+    return LevelBump.MAJOR
+
+
+def _level_of_parse_result(
+    parsed_result: ParseResult | list[ParseResult],
+) -> LevelBump:
+    # Validation type check for the parser results (important because of possible custom parsers)
+    if not any(
+        (
+            isinstance(parsed_result, (ParseError, ParsedCommit)),
+            type(parsed_result) == list
+            and validate_types_in_sequence(parsed_result, (ParseError, ParsedCommit)),
+            type(parsed_result) == tuple
+            and validate_types_in_sequence(parsed_result, (ParseError, ParsedCommit)),
+        )
+    ):
+        raise TypeError("Unexpected type returned from commit_parser.parse")
+
+    return max(
+        (
+            result.bump
+            for result in
+            (
+                # Cast to list if not already a list
+                parsed_result
+                if isinstance(parsed_result, list) or type(parsed_result) == tuple
+                else [parsed_result]
+            )
+            # Filter out any non-ParsedCommit results (i.e. ParseErrors)
+            if isinstance(result, ParsedCommit)
+        ),
+        default=LevelBump.NO_RELEASE,
+    )
+
+
+def _iter_commit_levels(
+    history: HistorySnapshot,
+    commits: Sequence[Commit],
+) -> Iterator[LevelBump]:
+    """
+    Yield the level bump of each of the given commits in order, parsing them lazily
+    so that a consumer which stops early also stops the parsing.
+    """
+    if history.bump_parsing_supported:
+        # The parser can determine the bump level without building the full results
+        yield from map(history.parse_bump, commits)
+        return
+
+    # Parse in growing batches: an early stop wastes little work while long
+    # histories still reach the size at which they are parsed in parallel
+    batch_start, batch_size = 0, _INITIAL_PARSE_BATCH_SIZE
+    while batch_start < len(commits):
+        batch = commits[batch_start : batch_start + batch_size]
+        yield from map(_level_of_parse_result, history.parse_many(batch))
+        batch_start += len(batch)
+        batch_size *= 2
+
+
+def _evaluate_level_bump(
+    history: HistorySnapshot,
+    commits: Sequence[Commit],
+    max_level: LevelBump,
+) -> LevelBump:
+    """
+    Determine the highest level bump of the given commits in a single pass, stopping
+    as soon as ``max_level`` is reached since no further commit can raise it.
+    """
+    level_bump = LevelBump.NO_RELEASE
+    evaluated = 0
+
+    levels = _iter_commit_levels(history, commits)
+    while level_bump < max_level and (level := next(levels, None)) is not None:
+        level_bump = max(level_bump, level)
+        evaluated += 1
+
+    logger.debug(
+        "evaluated %s of %s commits since the last release (highest reachable level: %s)",
+        evaluated,
+        len(commits),
+        max_level,
+    )
+
+    return level_bump
+
+
 def next_version(
     repo: Repo,
     translator: VersionTranslator,
@@ -248,11 +319,34 @@ def next_version(
     allow_zero_version: bool,
     major_on_zero: bool,
     prerelease: bool = False,
+    history: HistorySnapshot | None = None,
+    rev: str | None = None,
+    exclude_paths: Sequence[str] = (),
 ) -> Version:
     """
     Evaluate the history within `repo`, and based on the tags and commits in the repo
     history, identify the next semantic version that should be applied to a release
+
+    The history of `rev` (any commit-ish, e.g. a branch or a tag) is evaluated,
+    which defaults to the active branch. Nothing needs to be checked out.
+
+    A `history` snapshot can be provided to share the resolved tags & parsed commits
+    with other consumers of the same run (e.g. the release history), `rev` is
+    ignored in that case.
+
+    Commits which only change `exclude_paths` (e.g. the documentation) never cause
+    a release.
     """
+    history = (
+        history
+        or HistorySnapshot(
+            repo=repo,
+            translator=translator,
+            commit_parser=commit_parser,
+            rev=rev or repo.active_branch.commit.hexsha,
+        )
+    ).excluding(exclude_paths)
+
     # Default initial version
     # Since the translator is configured by the user, we can't guarantee that it will
     # be able to parse the default version. So we first cast it to a tag using the default
@@ -266,24 +360,13 @@ def next_version(
             "Translator was unable to parse the embedded default version"
         )
 
-    # Step 1. All tags, sorted descending by semver ordering rules
-    all_git_tags_as_versions = tags_and_versions(repo.tags, translator)
-
-    # Retrieve all commit hashes (regardless of merges) in the current branch's history from repo origin
-    commit_hash_set = {
-        commit.hexsha
-        for commit in _traverse_graph_for_commits(head_commit=repo.active_branch.commit)
-    }
-
-    # Filter all releases that are not found in the current branch's history
-    historic_versions: list[Version] = []
-    for tag, version in all_git_tags_as_versions:
-        # TODO: move this to tags_and_versions() function?
-        # Ignore the error that is raised when tag points to a Blob or Tree object rather
-        # than a commit object (tags that point to tags that then point to commits are resolved automatically)
-        with suppress(ValueError):
-            if tag.commit.hexsha in commit_hash_set:
-                historic_versions.append(version)
+    # Step 1. All tags in the current branch's history, sorted descending by semver
+    # ordering rules. Tags that point to a Blob or Tree object rather than a commit
+    # object are never part of the history (tags that point to tags that then point
+    # to commits are resolved automatically)
+    historic_versions: list[Version] = [
+        version for _, version in history.historic_tags_and_versions
+    ]
 
     # Step 2. Get the latest final release version in the history of the current branch
     #  or fallback to the default 0.0.0 starting version value if none are found
@@ -327,73 +410,53 @@ def next_version(
 
     logger.info("The latest release in this branch's history was %s", latest_version)
 
+    # NOTE: the default_initial_version should not actually exist on the repository (ie v0.0.0)
+    # so we provide an empty tag string when there are no tags on the repository yet
+    latest_release_tag = (
+        latest_version.as_tag() if latest_version != default_initial_version else ""
+    )
+    max_level = _max_reachable_level(
+        latest_version=latest_version,
+        allow_zero_version=allow_zero_version,
+        major_on_zero=major_on_zero,
+    )
+
+    # The commits up to the head of a previous run on this branch have been evaluated
+    # before, unless the branch has been rewritten or released since
+    checkpoint = history.load_checkpoint(latest_release_tag, prerelease, max_level)
+
     # Step 4. Walk the git tree to find all commits that have been made since the last release
     commits_since_last_release = _traverse_graph_for_commits(
-        head_commit=repo.active_branch.commit,
-        latest_release_tag_str=(
-            # NOTE: the default_initial_version should not actually exist on the repository (ie v0.0.0)
-            # so we provide an empty tag string when there are no tags on the repository yet
-            latest_version.as_tag() if latest_version != default_initial_version else ""
-        ),
+        head_commit=history.head_commit,
+        latest_release_tag_str=latest_release_tag,
+        first_parent=history.first_parent,
+        since_sha=checkpoint.head_sha if checkpoint else "",
     )
 
+    since = "evaluation" if checkpoint else "release"
     logger.info(
-        f"Found {len(commits_since_last_release)} commits since the last release!"
+        f"Found {len(commits_since_last_release)} commits since the last {since}!"
         if len(commits_since_last_release) > 0
-        else "No commits found since the last release!"
+        else f"No commits found since the last {since}!"
     )
 
-    # Step 5. apply the parser to each commit in the history (could return multiple results per commit)
-    parsed_results = list(map(commit_parser.parse, commits_since_last_release))
-
-    # Step 5A. Validation type check for the parser results (important because of possible custom parsers)
-    for parsed_result in parsed_results:
-        if not any(
-            (
-                isinstance(parsed_result, (ParseError, ParsedCommit)),
-                type(parsed_result) == list
-                and validate_types_in_sequence(
-                    parsed_result, (ParseError, ParsedCommit)
-                ),
-                type(parsed_result) == tuple
-                and validate_types_in_sequence(
-                    parsed_result, (ParseError, ParsedCommit)
-                ),
-            )
-        ):
-            raise TypeError("Unexpected type returned from commit_parser.parse")
-
-    # Step 5B. Accumulate all parsed results into a single list accounting for possible multiple results per commit
-    consolidated_results: list[ParseResult] = reduce(
-        lambda accumulated_results, p_results: [
-            *accumulated_results,
-            *(
-                # Cast to list if not already a list
-                p_results
-                if isinstance(p_results, list) or type(p_results) == tuple
-                else [p_results]
+    # Step 5. determine the highest bump level of the commits in the history, commits
+    # beyond the point where the highest reachable level is found are not parsed.
+    # Commits outside of the paths the history is limited to (e.g. a single package
+    # of a monorepo) never cause a release, the changed paths are only read for the
+    # commits since the last release
+    level_bump = checkpoint.level_bump if checkpoint else LevelBump.NO_RELEASE
+    if level_bump < max_level:
+        level_bump = max(
+            level_bump,
+            _evaluate_level_bump(
+                history,
+                history.relevant_commits(commits_since_last_release),
+                max_level=max_level,
             ),
-        ],
-        parsed_results,
-        [],
-    )
-
-    # Step 5C. Parse the commits to determine the bump level that should be applied
-    parsed_levels: set[LevelBump] = {
-        parsed_result.bump  # type: ignore[union-attr] # too complex for type checkers
-        for parsed_result in filter(
-            # Filter out any non-ParsedCommit results (i.e. ParseErrors)
-            lambda parsed_result: isinstance(parsed_result, ParsedCommit),
-            consolidated_results,
         )
-    }
-
-    logger.debug(
-        "parsed the following distinct levels from the commits since the last release: %s",
-        parsed_levels,
-    )
 
-    level_bump = max(parsed_levels, default=LevelBump.NO_RELEASE)
+    history.save_checkpoint(latest_release_tag, prerelease, max_level, level_bump)
     logger.info("The type of the next release release is: %s", level_bump)
 
     if all(
@@ -414,3 +477,44 @@ def next_version(
         major_on_zero=major_on_zero,
         allow_zero_version=allow_zero_version,
     )
+
+
+def next_versions(
+    repo: Repo,
+    refs: Iterable[str],
+    translator: VersionTranslator,
+    commit_parser: CommitParser[ParseResult, ParserOptions],
+    allow_zero_version: bool,
+    major_on_zero: bool,
+    prerelease: bool = False,
+    history: HistorySnapshot | None = None,
+) -> dict[str, Version]:
+    """
+    Identify the next version of each of the `refs` (any commit-ish) in one go,
+    without checking any of them out.
+
+    The tags are resolved once for all refs and every commit is parsed at most once,
+    so the commits which the refs have in common (e.g. the history of the branch
+    that the refs were branched off) are only parsed for the first ref. The resolved
+    tags & parsed commits of a `history` snapshot are re-used when provided.
+    """
+    history = history or HistorySnapshot(
+        repo=repo,
+        translator=translator,
+        commit_parser=commit_parser,
+    )
+    # Resolve the tags before deriving the snapshot of each ref so they share them
+    history.tags_and_versions  # noqa: B018
+
+    return {
+        ref: next_version(
+            repo=repo,
+            translator=translator,
+            commit_parser=commit_parser,
+            allow_zero_version=allow_zero_version,
+            major_on_zero=major_on_zero,
+            prerelease=prerelease,
+            history=history.derive(ref),
+        )
+        for ref in refs
+    }
@@ -1,12 +1,49 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from semantic_release.const import SEMVER_REGEX
 from semantic_release.globals import logger
 from semantic_release.helpers import check_tag_format
 from semantic_release.version.version import Version
 
+# Leading characters of a tag format which are literal both in the (verbose) regex
+# the format is inverted to & in a git ref pattern
+_LITERAL_PREFIX_RE = re.compile(r"[\w/@-]*")
+
+_PRERELEASE_IDENTIFIER = r"(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)"
+
+# The subset of SEMVER_REGEX which Version.parse accepts, with the prerelease split
+# into its token & revision the same way: the revision is the last identifier
+VERSION_PARTS_PATTERN = rf"""
+    (?P<major>0|[1-9]\d*)
+    \.
+    (?P<minor>0|[1-9]\d*)
+    \.
+    (?P<patch>0|[1-9]\d*)
+    (?:-
+        (?P<prerelease_token>{_PRERELEASE_IDENTIFIER}(?:\.{_PRERELEASE_IDENTIFIER})*)
+        \.
+        (?P<prerelease_revision>0|[1-9]\d*)
+    )?
+    (?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?
+"""
+
+
+@lru_cache(maxsize=512)
+def tag_format_prefix(tag_format: str) -> str:
+    """
+    The literal prefix every tag matched by ``tag_format`` starts with, e.g.
+    ``pkg-a-v`` for ``pkg-a-v{version}``.
+
+    The prefix ends at the first character which is not taken literally by the
+    regex the format is inverted to (see :py:class:`VersionTranslator`), so it may
+    be empty.
+    """
+    prefix_match = _LITERAL_PREFIX_RE.match(tag_format)
+    return prefix_match.group() if prefix_match else ""
+
 
 class VersionTranslator:
     """
@@ -47,6 +84,18 @@ class VersionTranslator:
         self.tag_format = tag_format
         self.prerelease_token = prerelease_token
         self.from_tag_re = self._invert_tag_format_to_re(self.tag_format)
+        self.tag_prefix = tag_format_prefix(self.tag_format)
+        # A format of a literal prefix followed by the version (e.g. "v{version}")
+        # is decoded with a single regex, which yields the parts of the version
+        # directly. Any tag it does not match takes the general path below.
+        self.from_tag_parts_re = (
+            re.compile(
+                rf"{re.escape(self.tag_prefix)}{VERSION_PARTS_PATTERN}\Z",
+                flags=re.VERBOSE,
+            )
+            if self.tag_format == f"{self.tag_prefix}{{version}}"
+            else None
+        )
 
     def from_string(self, version_str: str) -> Version:
         """
@@ -66,6 +115,28 @@ class VersionTranslator:
         For example, a tag of 'v1.2.3' should be matched if `tag_format = 'v{version}`,
         but not if `tag_format = staging--v{version}`.
         """
+        if not tag.startswith(self.tag_prefix):
+            return None
+
+        if self.from_tag_parts_re is not None and (
+            parts := self.from_tag_parts_re.match(tag)
+        ):
+            # Valid by construction, no need to validate it again
+            prerelease_revision = parts.group("prerelease_revision")
+            return Version(
+                int(parts.group("major")),
+                int(parts.group("minor")),
+                int(parts.group("patch")),
+                prerelease_token=(
+                    parts.group("prerelease_token") or self.prerelease_token
+                ),
+                prerelease_revision=(
+                    int(prerelease_revision) if prerelease_revision else None
+                ),
+                build_metadata=parts.group("buildmetadata") or "",
+                tag_format=self.tag_format,
+            )
+
         tag_match = self.from_tag_re.match(tag)
         if not tag_match:
             return None
@@ -35,9 +35,13 @@ INITIAL_COMMIT_MESSAGE = "Initial commit"
 MAIN_PROG_NAME = str(semantic_release.__name__).replace("_", "-")
 SUCCESS_EXIT_CODE = 0
 
+BENCH_SUBCMD = Cli.SubCmds.BENCH.name.lower()
 CHANGELOG_SUBCMD = Cli.SubCmds.CHANGELOG.name.lower()
+CHANNELS_SUBCMD = Cli.SubCmds.CHANNELS.name.lower()
 GENERATE_CONFIG_SUBCMD = Cli.SubCmds.GENERATE_CONFIG.name.lower()
+PACKAGES_SUBCMD = Cli.SubCmds.PACKAGES.name.lower()
 PUBLISH_SUBCMD = Cli.SubCmds.PUBLISH.name.lower()
+SERVE_SUBCMD = Cli.SubCmds.SERVE.name.lower()
 VERSION_SUBCMD = Cli.SubCmds.VERSION.name.lower()
 
 NULL_HEX_SHA = git.Object.NULL_HEX_SHA
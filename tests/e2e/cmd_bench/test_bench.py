@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from tests.const import BENCH_SUBCMD, MAIN_PROG_NAME
+from tests.fixtures.repos import repo_w_trunk_only_conventional_commits
+from tests.util import assert_successful_exit_code
+
+if TYPE_CHECKING:
+    from tests.conftest import RunCliFn
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.mark.parametrize(
+    "repo_result", [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)]
+)
+def test_bench_json_report(repo_result: BuiltRepoResult, run_cli: RunCliFn):
+    repo = repo_result["repo"]
+    repo_status_before = repo.git.status(short=True)
+    head_before = repo.head.commit.hexsha
+    tags_before = {tag.name for tag in repo.tags}
+
+    cli_cmd = [MAIN_PROG_NAME, BENCH_SUBCMD, "--format", "json"]
+
+    # Act
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, cli_cmd)
+    report = json.loads(result.stdout)
+
+    expected_phases = [
+        "config load",
+        "tag scan",
+        "tag decode",
+        "traversal",
+        "parse",
+        "release history",
+        "changelog render",
+        "release notes render",
+    ]
+    assert expected_phases == [phase["name"] for phase in report["phases"]]
+
+    num_commits = len(list(repo.iter_commits()))
+    phases = {phase["name"]: phase for phase in report["phases"]}
+    assert num_commits == report["commits"] == phases["parse"]["processed"]
+    assert len(tags_before) == report["tags"]
+    assert len(tags_before) == phases["release history"]["processed"]
+    assert phases["release notes render"]["processed"] == 1
+    assert report["commits_per_second"] > 0
+    assert report["tags_per_second"] > 0
+    assert len(tags_before) == phases["tag decode"]["processed"]
+    assert report["tags_decoded_per_second"] > 0
+    assert all(phase["seconds"] >= 0 for phase in report["phases"])
+
+    # Nothing is modified
+    assert repo_status_before == repo.git.status(short=True)
+    assert head_before == repo.head.commit.hexsha
+    assert tags_before == {tag.name for tag in repo.tags}
+
+
+@pytest.mark.usefixtures(repo_w_trunk_only_conventional_commits.__name__)
+def test_bench_table_report(run_cli: RunCliFn):
+    cli_cmd = [MAIN_PROG_NAME, BENCH_SUBCMD]
+
+    # Act
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, cli_cmd)
+    assert "release notes render" in result.stdout
+    assert "commits/sec" in result.stdout
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.history.parse_cache import CACHE_FILE_NAME
+
+from tests.const import CHANNELS_SUBCMD, MAIN_PROG_NAME, VERSION_SUBCMD
+from tests.fixtures.repos.git_flow.repo_w_4_release_channels import (
+    repo_w_git_flow_w_beta_alpha_rev_prereleases_n_conventional_commits,
+)
+from tests.util import assert_successful_exit_code
+
+if TYPE_CHECKING:
+    from git import Repo
+
+    from tests.conftest import RunCliFn
+    from tests.fixtures.example_project import UpdatePyprojectTomlFn
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.fixture
+def monorepo(
+    repo_w_initial_commit: BuiltRepoResult,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+) -> Repo:
+    """A repository with a released "a" & "b" package, only "b" has changed"""
+    repo = repo_w_initial_commit["repo"]
+
+    update_pyproject_toml(
+        "tool.semantic_release.packages",
+        {
+            name: {"path": f"packages/{name}", "tag_format": f"{name}-v{{version}}"}
+            for name in ("a", "b")
+        },
+    )
+    update_pyproject_toml(
+        "tool.semantic_release.branches",
+        {
+            "main": {"match": "^(main|master)$"},
+            "beta": {"match": "^beta$", "prerelease": True, "prerelease_token": "beta"},
+        },
+    )
+    repo.git.add("pyproject.toml")
+    repo.git.commit(m="build: configure the packages & channels")
+
+    for name in ("a", "b"):
+        commit_file(repo, f"packages/{name}/__init__.py", f"feat({name}): add {name}")
+        repo.git.tag(f"{name}-v1.0.0", m=f"{name}-v1.0.0")
+    commit_file(repo, "packages/b/feature.py", "feat(b): add a feature")
+
+    return repo
+
+
+def commit_file(repo: Repo, path: str, message: str) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(f"# {message}\n")
+    repo.git.add(path)
+    repo.git.commit(m=message)
+
+
+def channel_versions(run_cli: RunCliFn, *global_opts: str) -> dict[str, str]:
+    """The next version of each branch as reported by the channels command"""
+    cli_cmd = [MAIN_PROG_NAME, *global_opts, CHANNELS_SUBCMD, "--format", "json"]
+    result = run_cli(cli_cmd[1:])
+    assert_successful_exit_code(result, cli_cmd)
+    return {
+        branch["branch"]: branch["version"]
+        for channel in json.loads(result.stdout)["channels"]
+        for branch in channel["branches"]
+    }
+
+
+def print_version(run_cli: RunCliFn, *global_opts: str) -> str:
+    cli_cmd = [MAIN_PROG_NAME, *global_opts, VERSION_SUBCMD, "--print"]
+    result = run_cli(cli_cmd[1:])
+    assert_successful_exit_code(result, cli_cmd)
+    return result.stdout.strip()
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(
+            repo_w_git_flow_w_beta_alpha_rev_prereleases_n_conventional_commits.__name__
+        )
+    ],
+)
+def test_channels_match_version_of_each_branch(
+    repo_result: BuiltRepoResult, run_cli: RunCliFn
+):
+    repo = repo_result["repo"]
+    active_branch = repo.active_branch.name
+    head_before = repo.head.commit.hexsha
+    tags_before = {tag.name for tag in repo.tags}
+
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, CHANNELS_SUBCMD, "--format", "json"]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, cli_cmd)
+    report = json.loads(result.stdout)
+    assert [channel["name"] for channel in report["channels"]] == [
+        "main",
+        "beta",
+        "dev",
+        "features",
+    ]
+
+    # Nothing is checked out or tagged
+    assert active_branch == repo.active_branch.name
+    assert head_before == repo.head.commit.hexsha
+    assert tags_before == {tag.name for tag in repo.tags}
+
+    # Every branch head is released like a separate run from the branch would
+    branch_versions = {
+        branch["branch"]: branch["version"]
+        for channel in report["channels"]
+        for branch in channel["branches"]
+    }
+    # Branches which match no channel (e.g. fix/*) are not evaluated
+    assert {"main", "beta", "dev"} < set(branch_versions)
+    assert set(branch_versions) < {head.name for head in repo.heads}
+
+    for branch, expected_version in branch_versions.items():
+        repo.git.checkout(branch)
+        version_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, "--print"]
+        version_result = run_cli(version_cmd[1:])
+        assert_successful_exit_code(version_result, version_cmd)
+        assert f"{expected_version}\n" == version_result.stdout
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(
+            repo_w_git_flow_w_beta_alpha_rev_prereleases_n_conventional_commits.__name__
+        )
+    ],
+)
+def test_channels_table_on_detached_head(
+    repo_result: BuiltRepoResult, run_cli: RunCliFn
+):
+    repo = repo_result["repo"]
+    repo.git.checkout("HEAD", detach=True)
+
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, CHANNELS_SUBCMD]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, cli_cmd)
+    for channel in ("main", "beta", "dev", "features"):
+        assert channel in result.stdout
+
+
+def test_channels_of_a_package_only_count_its_commits(
+    monorepo: Repo, run_cli: RunCliFn
+):
+    default_branch = monorepo.active_branch.name
+
+    versions = {
+        package: channel_versions(run_cli, "--package", package)[default_branch]
+        for package in ("a", "b")
+    }
+
+    assert versions == {"a": "1.0.0", "b": "1.1.0"}
+    for package, version in versions.items():
+        assert version == print_version(run_cli, "--package", package)
+
+
+def test_channels_use_the_tag_format_of_each_channel(monorepo: Repo, run_cli: RunCliFn):
+    default_branch = monorepo.active_branch.name
+    monorepo.git.checkout("-b", "beta")
+    commit_file(monorepo, "packages/a/feature.py", "feat(a): add a feature")
+    monorepo.git.tag("a-v1.1.0-beta.1", m="a-v1.1.0-beta.1")
+    commit_file(monorepo, "packages/a/fix.py", "fix(a): fix the feature")
+    # A prerelease of another token & of another package, neither counts for "a"
+    monorepo.git.tag("a-v1.1.0-rc.1", m="a-v1.1.0-rc.1")
+    monorepo.git.tag("b-v1.1.0-beta.5", m="b-v1.1.0-beta.5")
+    monorepo.git.checkout(default_branch)
+
+    versions = channel_versions(run_cli, "--package", "a")
+
+    assert versions == {default_branch: "1.0.0", "beta": "1.1.0-beta.2"}
+    monorepo.git.checkout("beta")
+    assert versions["beta"] == print_version(run_cli, "--package", "a")
+
+
+def test_channels_share_the_checkpoint_of_each_branch_with_version(
+    monorepo: Repo, run_cli: RunCliFn, tmp_path: Path
+):
+    cache_opts = ("--cache-dir", str(tmp_path), "--package", "a")
+    monorepo.git.checkout("-b", "beta")
+    commit_file(monorepo, "packages/a/feature.py", "feat(a): add a feature")
+
+    def checkpoints() -> int:
+        with sqlite3.connect(tmp_path / CACHE_FILE_NAME) as connection:
+            return connection.execute("SELECT COUNT(*) FROM checkpoints").fetchone()[0]
+
+    versions = channel_versions(run_cli, *cache_opts)
+    stored = checkpoints()
+
+    # The checkpoint of the beta channel is stored with its prerelease token,
+    # the version command on that branch resumes from it instead of adding one
+    assert versions["beta"] == print_version(run_cli, *cache_opts) == "1.1.0-beta.1"
+    assert checkpoints() == stored
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.const import MAIN_PROG_NAME, PACKAGES_SUBCMD, VERSION_SUBCMD
+from tests.util import assert_exit_code, assert_successful_exit_code
+
+if TYPE_CHECKING:
+    from git import Repo
+
+    from tests.conftest import RunCliFn
+    from tests.fixtures.example_project import UpdatePyprojectTomlFn
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.fixture
+def monorepo(
+    repo_w_initial_commit: BuiltRepoResult,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+) -> Repo:
+    """A repository with a released "core" & "cli" package, only "core" has changed"""
+    repo = repo_w_initial_commit["repo"]
+
+    update_pyproject_toml(
+        "tool.semantic_release.packages",
+        {
+            name: {
+                "path": f"packages/{name}",
+                "tag_format": f"{name}-v{{version}}",
+                "version_variables": [f"packages/{name}/__init__.py:__version__"],
+            }
+            for name in ("core", "cli")
+        },
+    )
+    repo.git.add("pyproject.toml")
+    repo.git.commit(m="build: configure the packages")
+
+    def commit_file(path: str, content: str, message: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(content)
+        repo.git.add(path)
+        repo.git.commit(m=message)
+
+    commit_file("packages/core/__init__.py", '__version__ = "1.0.0"\n', "feat: core")
+    commit_file("packages/cli/__init__.py", '__version__ = "1.0.0"\n', "feat: cli")
+    repo.git.tag("core-v1.0.0", m="core-v1.0.0")
+    repo.git.tag("cli-v1.0.0", m="cli-v1.0.0")
+    commit_file("packages/core/util.py", "UTIL = 1\n", "fix(core): fix the core")
+    commit_file("README.md", "# Monorepo\n", "feat: change outside of the packages")
+
+    return repo
+
+
+def test_packages_evaluates_every_package(monorepo: Repo, run_cli: RunCliFn):
+    tags_before = {tag.name for tag in monorepo.tags}
+
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, PACKAGES_SUBCMD, "--format", "json"]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, cli_cmd)
+    report = {
+        package["name"]: package for package in json.loads(result.stdout)["packages"]
+    }
+    assert list(report) == ["core", "cli"]
+    assert report["core"]["version"] == "1.0.1"
+    assert report["core"]["tag"] == "core-v1.0.1"
+    assert not report["core"]["released"]
+    assert report["core"]["unreleased_changes"] == 1
+    assert report["cli"]["version"] == "1.0.0"
+    assert report["cli"]["released"]
+    assert report["cli"]["unreleased_changes"] == 0
+
+    # Nothing is tagged
+    assert tags_before == {tag.name for tag in monorepo.tags}
+
+
+def test_packages_with_the_parse_cache(
+    monorepo: Repo,
+    run_cli: RunCliFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+):
+    update_pyproject_toml("tool.semantic_release.parse_cache.enabled", True)
+
+    # Act: the second run reads the tag index & checkpoints of the first one
+    reports = []
+    for _ in range(2):
+        cli_cmd = [MAIN_PROG_NAME, PACKAGES_SUBCMD, "--format", "json"]
+        result = run_cli(cli_cmd[1:])
+        assert_successful_exit_code(result, cli_cmd)
+        reports.append(json.loads(result.stdout))
+
+    # Evaluate
+    assert reports[0] == reports[1]
+    versions = {
+        package["name"]: package["version"] for package in reports[0]["packages"]
+    }
+    assert versions == {"core": "1.0.1", "cli": "1.0.0"}
+
+
+def test_version_of_a_single_package(monorepo: Repo, run_cli: RunCliFn):
+    # Act: preview each package
+    versions = {}
+    for package in ("core", "cli"):
+        cli_cmd = [MAIN_PROG_NAME, "--package", package, VERSION_SUBCMD, "--print"]
+        result = run_cli(cli_cmd[1:])
+        assert_successful_exit_code(result, cli_cmd)
+        versions[package] = result.stdout.strip()
+
+    # Act: release the changed package
+    cli_cmd = [
+        MAIN_PROG_NAME,
+        "--package",
+        "core",
+        VERSION_SUBCMD,
+        "--no-changelog",
+        "--no-push",
+    ]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert versions == {"core": "1.0.1", "cli": "1.0.0"}
+    assert_successful_exit_code(result, cli_cmd)
+    assert "core-v1.0.1" in {tag.name for tag in monorepo.tags}
+    assert "cli-v1.0.1" not in {tag.name for tag in monorepo.tags}
+    assert Path("packages/core/__init__.py").read_text() == '__version__ = "1.0.1"\n'
+    assert Path("packages/cli/__init__.py").read_text() == '__version__ = "1.0.0"\n'
+
+
+@pytest.mark.parametrize("first_parent", [False, True])
+def test_version_of_a_package_with_a_merged_change(
+    monorepo: Repo,
+    run_cli: RunCliFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    first_parent: bool,
+):
+    update_pyproject_toml(
+        "tool.semantic_release.traversal_merge_unit", "merged-commits"
+    )
+    monorepo.git.commit(a=True, m="build: merge by merged commits")
+    default_branch = monorepo.active_branch.name
+    monorepo.git.checkout("-b", "feature")
+    Path("packages/core/feature.py").write_text("FEATURE = 1\n")
+    monorepo.git.add("packages/core/feature.py")
+    monorepo.git.commit(m="feat(core): add a feature")
+    monorepo.git.checkout(default_branch)
+    monorepo.git.merge("feature", no_ff=True, m="Merge branch 'feature'")
+
+    # Act
+    cli_cmd = [
+        MAIN_PROG_NAME,
+        "--package",
+        "core",
+        *(["--first-parent"] if first_parent else []),
+        VERSION_SUBCMD,
+        "--print",
+    ]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate: the feature is merged by the merge commit on the mainline
+    assert_successful_exit_code(result, cli_cmd)
+    assert result.stdout.strip() == "1.1.0"
+
+
+def test_unknown_package(monorepo: Repo, run_cli: RunCliFn):
+    cli_cmd = [MAIN_PROG_NAME, "--package", "missing", VERSION_SUBCMD, "--print"]
+    result = run_cli(cli_cmd[1:])
+
+    assert_exit_code(1, result, cli_cmd)
+    assert "Unknown package 'missing'" in result.stderr
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.cli.commands.serve import (
+    DEFAULT_SOCKET_FILE,
+    SUPPORTS_UNIX_SOCKETS,
+    WarmRepository,
+)
+from semantic_release.cli.config import (
+    GlobalCommandLineOptions,
+    RawConfig,
+    RuntimeContext,
+)
+from semantic_release.cli.util import load_raw_config_file
+from semantic_release.history.parse_cache import CACHE_FILE_NAME
+
+from tests.const import MAIN_PROG_NAME, SERVE_SUBCMD
+from tests.fixtures.git_repo import get_commit_def_of_conventional_commit
+from tests.fixtures.repos import repo_w_trunk_only_conventional_commits
+from tests.util import assert_successful_exit_code
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from click.testing import Result
+
+    from tests.conftest import RunCliFn
+    from tests.fixtures.git_repo import (
+        BuiltRepoResult,
+        GetCommitDefFn,
+        GetVersionsFromRepoBuildDefFn,
+        SimulateChangeCommitsNReturnChangelogEntryFn,
+    )
+
+
+pytestmark = pytest.mark.skipif(
+    not SUPPORTS_UNIX_SOCKETS, reason="Unix sockets are not supported"
+)
+
+
+def query(socket_file: Path, *requests: dict[str, Any]) -> list[dict[str, Any]]:
+    """Send the requests over a single connection & return the responses"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_file))
+        with sock.makefile("rwb") as stream:
+            responses = []
+            for request in requests:
+                stream.write(json.dumps(request).encode() + b"\n")
+                stream.flush()
+                responses.append(json.loads(stream.readline()))
+
+    return responses
+
+
+@pytest.mark.parametrize(
+    "repo_result, get_commit_def_fn",
+    [
+        (
+            lazy_fixture(repo_w_trunk_only_conventional_commits.__name__),
+            lazy_fixture(get_commit_def_of_conventional_commit.__name__),
+        )
+    ],
+)
+def test_serve_answers_queries_on_a_changing_repo(
+    repo_result: BuiltRepoResult,
+    get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
+    simulate_change_commits_n_rtn_changelog_entry: SimulateChangeCommitsNReturnChangelogEntryFn,
+    get_commit_def_fn: GetCommitDefFn,
+    run_cli: RunCliFn,
+):
+    repo = repo_result["repo"]
+    socket_file = Path(DEFAULT_SOCKET_FILE)
+    latest_release_version = get_versions_from_repo_build_def(
+        repo_result["definition"]
+    )[-1]
+    major, minor, patch = map(int, latest_release_version.split("."))
+    next_release_version = f"{major}.{minor}.{patch + 1}"
+
+    # Setup: run the daemon in the background until it is asked to shut down
+    cli_cmd = [MAIN_PROG_NAME, SERVE_SUBCMD]
+    results: list[Result] = []
+    daemon = threading.Thread(target=lambda: results.append(run_cli(cli_cmd[1:])))
+    daemon.start()
+
+    try:
+        deadline = time.monotonic() + 30
+        while not socket_file.exists() and daemon.is_alive():
+            assert time.monotonic() < deadline, "daemon did not start listening"
+            time.sleep(0.05)
+
+        # Act & Evaluate: nothing to release yet
+        ping, unchanged = query(
+            socket_file,
+            {"id": 1, "method": "ping"},
+            {"id": 2, "method": "next_version", "params": {"ref": "HEAD"}},
+        )
+        assert ping["id"] == 1
+        assert "semantic_release_version" in ping["result"]
+        assert unchanged["id"] == 2
+        assert latest_release_version == unchanged["result"]["version"]
+        assert unchanged["result"]["released"]
+
+        # Act & Evaluate: a new commit is picked up on the next query
+        simulate_change_commits_n_rtn_changelog_entry(
+            repo, [get_commit_def_fn("fix: make a patch fix to codebase")]
+        )
+        next_ver, notes, bad_method, bad_ref = query(
+            socket_file,
+            {"id": 3, "method": "next_version"},
+            {"id": 4, "method": "release_notes"},
+            {"id": 5, "method": "does_not_exist"},
+            {"id": 6, "method": "next_version", "params": {"ref": "no-such-ref"}},
+        )
+        assert next_release_version == next_ver["result"]["version"]
+        assert repo.head.commit.hexsha == next_ver["result"]["commit"]
+        assert not next_ver["result"]["released"]
+        assert next_release_version == notes["result"]["version"]
+        assert (
+            "make a patch fix to codebase" in notes["result"]["release_notes"].lower()
+        )
+        assert bad_method["error"]["type"] == "ValueError"
+        assert "error" in bad_ref
+
+        # Act & Evaluate: a new tag is picked up on the next query
+        repo.create_tag(f"v{next_release_version}")
+        (released,) = query(socket_file, {"id": 7, "method": "next_version"})
+        assert next_release_version == released["result"]["version"]
+        assert released["result"]["released"]
+
+    finally:
+        if socket_file.exists():
+            query(socket_file, {"id": 8, "method": "shutdown"})
+        daemon.join(timeout=30)
+
+    assert not daemon.is_alive()
+    assert_successful_exit_code(results[0], cli_cmd)
+    assert not socket_file.exists()
+
+
+def test_serve_only_drops_the_results_of_changed_tags(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+    example_pyproject_toml: Path,
+):
+    runtime = RuntimeContext.from_raw_config(
+        RawConfig.model_validate(load_raw_config_file(example_pyproject_toml)),
+        global_cli_options=GlobalCommandLineOptions(),
+    )
+    repo = repo_w_trunk_only_conventional_commits["repo"]
+    warm_repo = WarmRepository(repo, runtime)
+
+    repo.git.commit(allow_empty=True, m="fix: make a patch fix to codebase")
+    head_sha = repo.head.commit.hexsha
+    repo.git.checkout("-b", "side")
+    repo.git.commit(allow_empty=True, m="feat: a change on a side branch")
+    side_sha = repo.head.commit.hexsha
+    repo.git.checkout("-")
+
+    with mock.patch.object(
+        warm_repo, "_next_version", wraps=warm_repo._next_version
+    ) as next_version_spy:
+        unreleased = warm_repo.next_version()
+        next_release_tag = unreleased["tag"]
+
+        # Act: release the next version from a commit outside of the history
+        repo.git.tag(next_release_tag, side_sha)
+        released_elsewhere = warm_repo.next_version()
+
+        # Act: move the tag into the history
+        repo.git.tag("-f", next_release_tag, head_sha)
+        released = warm_repo.next_version()
+
+    # Evaluate: only the tag in the history has recomputed the next version
+    assert next_version_spy.call_count == 2
+    assert not unreleased["released"]
+    assert released_elsewhere["released"]
+    assert released_elsewhere["version"] == unreleased["version"]
+    assert released["released"]
+    assert released["version"] == unreleased["version"]
+
+
+def test_serve_writes_new_parse_results_after_each_query(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+    example_pyproject_toml: Path,
+    tmp_path: Path,
+):
+    runtime = RuntimeContext.from_raw_config(
+        RawConfig.model_validate(load_raw_config_file(example_pyproject_toml)),
+        global_cli_options=GlobalCommandLineOptions(cache_dir=str(tmp_path)),
+    )
+    assert runtime.parse_cache is not None
+    repo = repo_w_trunk_only_conventional_commits["repo"]
+    warm_repo = WarmRepository(repo, runtime)
+
+    def stored_results() -> int:
+        with sqlite3.connect(tmp_path / CACHE_FILE_NAME) as connection:
+            (count,) = connection.execute("SELECT COUNT(*) FROM parse_results")
+        return count[0]
+
+    repo.git.commit(allow_empty=True, m="fix: make a patch fix to codebase")
+
+    with mock.patch.object(
+        runtime.parse_cache, "flush", wraps=runtime.parse_cache.flush
+    ) as flush_spy:
+        # Act: the first query parses the whole history
+        first = warm_repo.handle({"id": 1, "method": "release_notes"})
+        stored = stored_results()
+
+        # Act: a repeated query parses nothing new
+        second = warm_repo.handle({"id": 2, "method": "release_notes"})
+
+        # Act: a new commit is parsed by the next query
+        repo.git.commit(allow_empty=True, m="feat: add a feature")
+        third = warm_repo.handle({"id": 3, "method": "release_notes"})
+
+    # Evaluate: the parse results are written without shutting down the daemon
+    assert "result" in first
+    assert second["result"] == first["result"]
+    assert "result" in third
+    assert stored > 0
+    assert stored_results() == stored + 1
+    assert flush_spy.call_count == 2
+    runtime.parse_cache.close()
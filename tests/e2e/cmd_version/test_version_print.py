@@ -1072,3 +1072,171 @@ def test_version_print_next_tag_fails_on_detached_head(
     assert not tags_set_difference
     assert mocked_git_push.call_count == 0
     assert post_mocker.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "repo_result, get_commit_def_fn",
+    [
+        (
+            lazy_fixture(repo_w_trunk_only_conventional_commits.__name__),
+            lazy_fixture(get_commit_def_of_conventional_commit.__name__),
+        )
+    ],
+)
+def test_version_print_next_version_wo_remote(
+    repo_result: BuiltRepoResult,
+    get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
+    run_cli: RunCliFn,
+    simulate_change_commits_n_rtn_changelog_entry: SimulateChangeCommitsNReturnChangelogEntryFn,
+    get_commit_def_fn: GetCommitDefFn,
+    mocked_git_push: MagicMock,
+    post_mocker: Mocker,
+    strip_logging_messages: StripLoggingMessagesFn,
+):
+    """
+    Given a repository without a remote,
+    When the next version is printed,
+    Then the version is printed because neither the remote nor the VCS client
+    is needed to determine it
+    """
+    repo = repo_result["repo"]
+    latest_release_version = get_versions_from_repo_build_def(
+        repo_result["definition"]
+    )[-1]
+    major, minor, patch = map(int, latest_release_version.split("."))
+    next_release_version = f"{major}.{minor}.{patch + 1}"
+
+    # Setup: remove the remote & make a commit to ensure we have something to release
+    repo.delete_remote(repo.remotes[0])
+    simulate_change_commits_n_rtn_changelog_entry(
+        repo,
+        [get_commit_def_fn("fix: make a patch fix to codebase")],
+    )
+
+    # Setup: take measurement before running the version command
+    repo_status_before = repo.git.status(short=True)
+    head_before = repo.head.commit.hexsha
+    tags_before = {tag.name for tag in repo.tags}
+
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, "--print"]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate (expected -> actual)
+    assert_successful_exit_code(result, cli_cmd)
+    assert not strip_logging_messages(result.stderr)
+    assert f"{next_release_version}\n" == result.stdout
+
+    # assert nothing else happened (no code changes, no commit, no tag, no push, no vcs release)
+    assert repo_status_before == repo.git.status(short=True)
+    assert head_before == repo.head.commit.hexsha
+    assert tags_before == {tag.name for tag in repo.tags}
+    assert mocked_git_push.call_count == 0
+    assert post_mocker.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "repo_result, get_commit_def_fn",
+    [
+        (
+            lazy_fixture(repo_w_trunk_only_conventional_commits.__name__),
+            lazy_fixture(get_commit_def_of_conventional_commit.__name__),
+        )
+    ],
+)
+def test_version_print_next_version_of_refs(
+    repo_result: BuiltRepoResult,
+    get_versions_from_repo_build_def: GetVersionsFromRepoBuildDefFn,
+    run_cli: RunCliFn,
+    simulate_change_commits_n_rtn_changelog_entry: SimulateChangeCommitsNReturnChangelogEntryFn,
+    get_commit_def_fn: GetCommitDefFn,
+    mocked_git_push: MagicMock,
+    post_mocker: Mocker,
+    strip_logging_messages: StripLoggingMessagesFn,
+):
+    repo = repo_result["repo"]
+    trunk = repo.active_branch.name
+    latest_release_version = get_versions_from_repo_build_def(
+        repo_result["definition"]
+    )[-1]
+    major, minor, patch = map(int, latest_release_version.split("."))
+
+    # Setup: make a patch & a feature branch & return to the release branch
+    for branch, commit_msg in [
+        ("bugfix", "fix: make a patch fix to codebase"),
+        ("feature", "feat: add a new feature"),
+    ]:
+        repo.git.checkout("-b", branch, trunk)
+        simulate_change_commits_n_rtn_changelog_entry(
+            repo, [get_commit_def_fn(commit_msg)]
+        )
+    repo.git.checkout(trunk)
+
+    # Setup: take measurement before running the version command
+    repo_status_before = repo.git.status(short=True)
+    head_before = repo.head.commit.hexsha
+    tags_before = {tag.name for tag in repo.tags}
+
+    # Act
+    cli_cmd = [
+        MAIN_PROG_NAME,
+        VERSION_SUBCMD,
+        "--print-tag",
+        *["--ref", "bugfix"],
+        *["--ref", "feature"],
+        *["--ref", trunk],
+    ]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate (expected -> actual)
+    assert_successful_exit_code(result, cli_cmd)
+    assert not strip_logging_messages(result.stderr)
+    assert (
+        str.join(
+            "\n",
+            [
+                f"bugfix v{major}.{minor}.{patch + 1}",
+                f"feature v{major}.{minor + 1}.0",
+                f"{trunk} v{latest_release_version}",
+                "",
+            ],
+        )
+        == result.stdout
+    )
+
+    # assert nothing else happened (no checkout, no commit, no tag, no push, no vcs release)
+    assert trunk == repo.active_branch.name
+    assert repo_status_before == repo.git.status(short=True)
+    assert head_before == repo.head.commit.hexsha
+    assert tags_before == {tag.name for tag in repo.tags}
+    assert mocked_git_push.call_count == 0
+    assert post_mocker.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "extra_args, expected_exit_code",
+    [
+        (["--print", "--ref", "does-not-exist"], 1),
+        (["--ref", "HEAD"], 2),
+        (["--print", "--major", "--ref", "HEAD"], 2),
+        (["--print-last-released", "--ref", "HEAD"], 2),
+        (["--print-last-released-tag", "--ref", "HEAD"], 2),
+    ],
+)
+@pytest.mark.usefixtures(repo_w_trunk_only_conventional_commits.__name__)
+def test_version_print_next_version_of_refs_invalid(
+    extra_args: list[str],
+    expected_exit_code: int,
+    run_cli: RunCliFn,
+    mocked_git_push: MagicMock,
+    post_mocker: Mocker,
+):
+    # Act
+    cli_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, *extra_args]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate (expected -> actual)
+    assert_exit_code(expected_exit_code, result, cli_cmd)
+    assert not result.stdout
+    assert mocked_git_push.call_count == 0
+    assert post_mocker.call_count == 0
@@ -5,10 +5,14 @@ from typing import TYPE_CHECKING
 import pytest
 from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 
+from semantic_release.cli.commands.bench import bench
 from semantic_release.cli.commands.changelog import changelog
+from semantic_release.cli.commands.channels import channels
 from semantic_release.cli.commands.generate_config import generate_config
 from semantic_release.cli.commands.main import main
+from semantic_release.cli.commands.packages import packages
 from semantic_release.cli.commands.publish import publish
+from semantic_release.cli.commands.serve import serve
 from semantic_release.cli.commands.version import version
 
 from tests.const import MAIN_PROG_NAME, SUCCESS_EXIT_CODE
@@ -32,7 +36,17 @@ HELP_EXIT_CODE = SUCCESS_EXIT_CODE
 )
 @pytest.mark.parametrize(
     "command",
-    (main, changelog, generate_config, publish, version),
+    (
+        main,
+        bench,
+        changelog,
+        channels,
+        generate_config,
+        packages,
+        publish,
+        serve,
+        version,
+    ),
     ids=lambda cmd: cmd.name,
 )
 def test_help_no_repo(
@@ -81,7 +95,17 @@ def test_help_no_repo(
 )
 @pytest.mark.parametrize(
     "command",
-    (main, changelog, generate_config, publish, version),
+    (
+        main,
+        bench,
+        changelog,
+        channels,
+        generate_config,
+        packages,
+        publish,
+        serve,
+        version,
+    ),
     ids=lambda cmd: cmd.name,
 )
 @pytest.mark.usefixtures(repo_w_trunk_only_conventional_commits.__name__)
@@ -129,7 +153,17 @@ def test_help_valid_config(
 )
 @pytest.mark.parametrize(
     "command",
-    (main, changelog, generate_config, publish, version),
+    (
+        main,
+        bench,
+        changelog,
+        channels,
+        generate_config,
+        packages,
+        publish,
+        serve,
+        version,
+    ),
     ids=lambda cmd: cmd.name,
 )
 @pytest.mark.usefixtures(repo_w_trunk_only_conventional_commits.__name__)
@@ -182,7 +216,17 @@ def test_help_invalid_config(
 )
 @pytest.mark.parametrize(
     "command",
-    (main, changelog, generate_config, publish, version),
+    (
+        main,
+        bench,
+        changelog,
+        channels,
+        generate_config,
+        packages,
+        publish,
+        serve,
+        version,
+    ),
     ids=lambda cmd: cmd.name,
 )
 @pytest.mark.parametrize(
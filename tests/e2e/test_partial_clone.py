@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tests.const import (
+    CHANGELOG_SUBCMD,
+    EXAMPLE_PROJECT_LICENSE,
+    MAIN_PROG_NAME,
+    VERSION_SUBCMD,
+)
+from tests.util import add_text_to_file, assert_successful_exit_code
+
+if TYPE_CHECKING:
+    import pytest
+    from git import Repo
+    from requests_mock import Mocker
+
+    from tests.conftest import RunCliFn
+    from tests.fixtures.example_project import UpdatePyprojectTomlFn
+    from tests.fixtures.git_repo import BuiltRepoResult, ClonePartiallyFn
+
+
+def missing_objects(repo: Repo) -> set[str]:
+    return {
+        line[1:]
+        for line in repo.git.rev_list(
+            "--objects", "--missing=print", "--all"
+        ).splitlines()
+        if line.startswith("?")
+    }
+
+
+def test_partial_clone_reads_no_file_contents(
+    repo_w_initial_commit: BuiltRepoResult,
+    clone_partially: ClonePartiallyFn,
+    tmp_path_factory: pytest.TempPathFactory,
+    monkeypatch: pytest.MonkeyPatch,
+    run_cli: RunCliFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    post_mocker: Mocker,
+):
+    repo = repo_w_initial_commit["repo"]
+
+    # Every commit changes the file, so that its earlier contents are never
+    # checked out
+    def commit(message: str) -> None:
+        add_text_to_file(repo, "file.txt", message)
+        repo.git.commit(a=True, m=message)
+
+    add_text_to_file(repo, "file.txt", "Initial content")
+    repo.git.add("file.txt")
+    repo.git.commit(m="feat: add the file")
+    repo.git.tag("v1.0.0", m="v1.0.0")
+    commit("fix: correct the file\n\n* feat: add another section\n* docs: describe it")
+    commit("perf: shorten the file")
+    update_pyproject_toml("project.keywords", ["partial-clone"])
+    repo.git.commit(a=True, m="build: add keywords")
+
+    clone_dir = tmp_path_factory.mktemp("clone") / "repo"
+    clone = clone_partially(repo, clone_dir)
+    missing_before = missing_objects(clone)
+    assert missing_before
+
+    def release_outputs(project_dir: Path) -> tuple[str, str, str]:
+        monkeypatch.chdir(project_dir)
+
+        version_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, "--print"]
+        version_result = run_cli(version_cmd[1:])
+        assert_successful_exit_code(version_result, version_cmd)
+
+        changelog_cmd = [MAIN_PROG_NAME, CHANGELOG_SUBCMD]
+        changelog_result = run_cli(changelog_cmd[1:])
+        assert_successful_exit_code(changelog_result, changelog_cmd)
+
+        release_notes_cmd = [
+            MAIN_PROG_NAME,
+            CHANGELOG_SUBCMD,
+            "--post-to-release-tag",
+            "v1.0.0",
+        ]
+        release_notes_result = run_cli(release_notes_cmd[1:])
+        assert_successful_exit_code(release_notes_result, release_notes_cmd)
+        assert post_mocker.last_request is not None
+
+        return (
+            version_result.stdout,
+            Path(project_dir, "CHANGELOG.md").read_text(),
+            post_mocker.last_request.json()["body"],
+        )
+
+    # Act
+    partial_clone_outputs = release_outputs(clone_dir)
+    full_clone_outputs = release_outputs(Path(str(repo.working_tree_dir)))
+
+    # Evaluate: the results are the same, without fetching anything from the (gone)
+    # promisor remote of the partial clone
+    assert full_clone_outputs == partial_clone_outputs
+    assert partial_clone_outputs[0].strip() == "1.1.0"
+    assert EXAMPLE_PROJECT_LICENSE in partial_clone_outputs[2]
+    assert missing_before == missing_objects(clone)
@@ -386,6 +386,9 @@ if TYPE_CHECKING:
     class GetGitRepo4DirFn(Protocol):
         def __call__(self, directory: Path | str) -> Repo: ...
 
+    class ClonePartiallyFn(Protocol):
+        def __call__(self, repo: Repo, clone_dir: Path) -> Repo: ...
+
     class SplitRepoActionsByReleaseTagsFn(Protocol):
         def __call__(
             self, repo_definition: Sequence[RepoActions], tag_format_str: str
@@ -2172,6 +2175,45 @@ def git_repo_for_directory() -> Generator[GetGitRepo4DirFn, None, None]:
             repo.close()
 
 
+@pytest.fixture
+def clone_partially(
+    git_repo_for_directory: GetGitRepo4DirFn,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> ClonePartiallyFn:
+    """
+    Create a blobless partial clone (``--filter=blob:none``) of a repository, whose
+    promisor remote is gone once the clone is checked out. Reading any file content
+    which is not checked out (e.g. a file of an earlier commit) fails, as it would
+    have to be fetched from the promisor remote.
+
+    The remotes of the repository are added to the clone as well.
+    """
+
+    def _clone_partially(repo: Repo, clone_dir: Path) -> Repo:
+        promisor_dir = tmp_path_factory.mktemp("promisor") / "repo.git"
+        Repo.clone_from(
+            str(repo.working_tree_dir), str(promisor_dir), bare=True
+        ).close()
+        with Repo(str(promisor_dir)) as promisor_repo:
+            promisor_repo.git.config("uploadpack.allowFilter", "true")
+
+        Repo.clone_from(
+            f"file://{promisor_dir}",
+            str(clone_dir),
+            filter="blob:none",
+            origin="promisor",
+        ).close()
+
+        clone = git_repo_for_directory(clone_dir)
+        clone.git.remote("set-url", "promisor", str(promisor_dir.with_name("gone.git")))
+        for remote in repo.remotes:
+            clone.create_remote(remote.name, remote.url)
+
+        return clone
+
+    return _clone_partially
+
+
 @pytest.fixture
 def example_project_git_repo(
     example_project_dir: ExProjectDir,
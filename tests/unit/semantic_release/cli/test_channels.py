@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from semantic_release.cli.commands.channels import assign_channels, branch_heads
+from semantic_release.cli.config import BranchConfig
+
+if TYPE_CHECKING:
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+def test_assign_channels_first_match_wins():
+    channels = {
+        "main": BranchConfig(match="^main$"),
+        "features": BranchConfig(match="^feat/", prerelease=True),
+        "catch-all": BranchConfig(match="*", prerelease=True),
+        "unused": BranchConfig(match="^release/", prerelease=True),
+    }
+
+    assigned = assign_channels(channels, ["main", "feat/a", "feat/b", "fix/c"])
+
+    assert assigned == {
+        "main": ["main"],
+        "features": ["feat/a", "feat/b"],
+        "catch-all": ["fix/c"],
+        "unused": [],
+    }
+
+
+def test_branch_heads_prefers_local_branches(repo_w_initial_commit: BuiltRepoResult):
+    repo = repo_w_initial_commit["repo"]
+    trunk = repo.active_branch.name
+    repo.git.branch("local-only")
+    repo.git.update_ref(f"refs/remotes/origin/{trunk}", "HEAD")
+    repo.git.update_ref("refs/remotes/origin/remote-only", "HEAD")
+    repo.git.symbolic_ref("refs/remotes/origin/HEAD", f"refs/remotes/origin/{trunk}")
+    repo.git.update_ref("refs/remotes/other/other-remote", "HEAD")
+
+    assert branch_heads(repo, "origin") == {
+        trunk: f"refs/heads/{trunk}",
+        "local-only": "refs/heads/local-only",
+        "remote-only": "refs/remotes/origin/remote-only",
+    }
@@ -10,11 +10,13 @@ from unittest import mock
 
 import pytest
 import tomlkit
+from git import Repo
 from pydantic import RootModel, ValidationError
 from urllib3.util.url import parse_url
 
 import semantic_release
 from semantic_release.cli.config import (
+    BaseRuntimeContext,
     BranchConfig,
     ChangelogConfig,
     ChangelogOutputFormat,
@@ -31,7 +33,8 @@ from semantic_release.commit_parser.scipy import ScipyParserOptions
 from semantic_release.commit_parser.tag import TagParserOptions
 from semantic_release.const import DEFAULT_COMMIT_AUTHOR
 from semantic_release.enums import LevelBump
-from semantic_release.errors import ParserLoadError
+from semantic_release.errors import InvalidConfiguration, ParserLoadError
+from semantic_release.history.notes_cache import GitNotesParseCache
 
 from tests.fixtures.repos import repo_w_no_tags_conventional_commits
 from tests.util import (
@@ -227,6 +230,143 @@ def test_load_valid_runtime_config(
     assert runtime_ctx
 
 
+@pytest.mark.parametrize(
+    "parse_cache_config, cli_cache_dir, expected_cache_file",
+    [
+        ({}, None, None),
+        (
+            {"enabled": True},
+            None,
+            Path(".git", "semantic-release", "parse-cache.sqlite3"),
+        ),
+        (
+            {"enabled": True, "cache_dir": ".psr-cache"},
+            None,
+            Path(".psr-cache", "parse-cache.sqlite3"),
+        ),
+        # the command line option enables the cache & takes precedence
+        (
+            {"cache_dir": ".psr-cache"},
+            "cli-cache",
+            Path("cli-cache", "parse-cache.sqlite3"),
+        ),
+        # the checkpoints of the git notes backend stay in the cache directory
+        (
+            {"enabled": True, "backend": "git-notes"},
+            None,
+            Path(".git", "semantic-release", "parse-cache.sqlite3"),
+        ),
+    ],
+)
+@pytest.mark.usefixtures(repo_w_no_tags_conventional_commits.__name__)
+def test_parse_cache_location(
+    example_pyproject_toml: Path,
+    example_project_dir: ExProjectDir,
+    change_to_ex_proj_dir: None,
+    parse_cache_config: dict[str, Any],
+    cli_cache_dir: str | None,
+    expected_cache_file: Path | None,
+):
+    content = tomlkit.loads(example_pyproject_toml.read_text(encoding="utf-8")).unwrap()
+    content["tool"]["semantic_release"]["parse_cache"] = parse_cache_config
+
+    runtime = RuntimeContext.from_raw_config(
+        raw=RawConfig.model_validate(content["tool"]["semantic_release"]),
+        global_cli_options=GlobalCommandLineOptions(cache_dir=cli_cache_dir),
+    )
+
+    if expected_cache_file is None:
+        assert runtime.parse_cache is None
+        return
+
+    assert runtime.parse_cache is not None
+    assert (
+        example_project_dir.resolve() / expected_cache_file
+    ) == runtime.parse_cache.path.resolve()
+    assert isinstance(runtime.parse_cache, GitNotesParseCache) == (
+        parse_cache_config.get("backend") == "git-notes"
+    )
+    # opening the database is deferred until it is first used
+    assert not runtime.parse_cache.path.exists()
+
+
+@pytest.mark.usefixtures(repo_w_no_tags_conventional_commits.__name__)
+def test_load_base_runtime_config_wo_remote(
+    example_pyproject_toml: Path,
+    change_to_ex_proj_dir: None,
+):
+    content = tomlkit.loads(example_pyproject_toml.read_text(encoding="utf-8")).unwrap()
+    raw = RawConfig.model_validate(content["tool"]["semantic_release"])
+
+    with Repo(".") as git_repo:
+        git_repo.delete_remote(git_repo.remotes[0])
+
+    with mock.patch.dict(_known_hvcs, {}, clear=True):
+        runtime = BaseRuntimeContext.from_raw_config(
+            raw=raw, global_cli_options=GlobalCommandLineOptions()
+        )
+
+    assert not isinstance(runtime, RuntimeContext)
+    assert runtime.repo_dir == Path.cwd()
+    assert runtime.major_on_zero == raw.major_on_zero
+    assert runtime.version_translator.tag_format == raw.tag_format
+
+
+@pytest.mark.usefixtures(repo_w_no_tags_conventional_commits.__name__)
+def test_load_runtime_config_for_package(
+    example_pyproject_toml: Path,
+    change_to_ex_proj_dir: None,
+):
+    content = tomlkit.loads(example_pyproject_toml.read_text(encoding="utf-8")).unwrap()
+    raw = RawConfig.model_validate(
+        {
+            **content["tool"]["semantic_release"],
+            "packages": {
+                "core": {
+                    "path": "packages/core",
+                    "tag_format": "core-v{version}",
+                    "version_variables": ["packages/core/__init__.py:__version__"],
+                    "changelog_file": "packages/core/CHANGELOG.md",
+                },
+                "cli": {"path": "packages/cli", "tag_format": "cli-v{version}"},
+            },
+        }
+    )
+
+    runtime = RuntimeContext.from_raw_config(
+        raw=raw.for_package("core"),
+        global_cli_options=GlobalCommandLineOptions(package="core"),
+    )
+
+    assert runtime.paths == ("packages/core",)
+    assert runtime.version_translator.tag_format == "core-v{version}"
+    # The top-level version declarations are replaced by those of the package
+    assert len(runtime.version_declarations) == 1
+    assert runtime.changelog_file == Path.cwd() / "packages/core/CHANGELOG.md"
+
+    with pytest.raises(InvalidConfiguration, match="'core', 'cli'"):
+        raw.for_package("missing")
+
+
+@pytest.mark.parametrize(
+    "packages",
+    [
+        # Missing tag format
+        {"core": {"path": "packages/core"}},
+        # Invalid tag format
+        {"core": {"path": "packages/core", "tag_format": "core"}},
+        # Shared tag format
+        {
+            "core": {"path": "packages/core", "tag_format": "v{version}"},
+            "cli": {"path": "packages/cli", "tag_format": "v{version}"},
+        },
+    ],
+)
+def test_invalid_packages_config(packages: dict[str, Any]):
+    with pytest.raises(ValidationError):
+        RawConfig.model_validate({"packages": packages})
+
+
 @pytest.mark.parametrize(
     "commit_parser",
     [
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.commit_parser._base import supports_bump_parsing
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitParser,
+    ConventionalCommitParserOptions,
+)
+from semantic_release.commit_parser.emoji import EmojiCommitParser, EmojiParserOptions
+from semantic_release.commit_parser.scipy import ScipyCommitParser, ScipyParserOptions
+from semantic_release.commit_parser.token import ParsedCommit
+from semantic_release.enums import LevelBump
+
+from tests.fixtures.commit_parsers import (
+    default_conventional_parser,
+    default_emoji_parser,
+)
+from tests.fixtures.scipy import default_scipy_parser
+from tests.util import CustomConventionalParserWithIgnorePatterns
+
+if TYPE_CHECKING:
+    from semantic_release.commit_parser import CommitParser, ParseResult, ParserOptions
+
+    from tests.conftest import MakeCommitObjFn
+
+
+def _max_bump(result: ParseResult | list[ParseResult]) -> LevelBump:
+    return max(
+        (
+            res.bump
+            for res in (result if isinstance(result, list) else [result])
+            if isinstance(res, ParsedCommit)
+        ),
+        default=LevelBump.NO_RELEASE,
+    )
+
+
+@pytest.mark.parametrize(
+    "commit_parser",
+    [
+        lazy_fixture(default_conventional_parser.__name__),
+        ConventionalCommitParser(
+            ConventionalCommitParserOptions(parse_squash_commits=False)
+        ),
+        lazy_fixture(default_emoji_parser.__name__),
+        EmojiCommitParser(EmojiParserOptions(parse_linked_issues=True)),
+        lazy_fixture(default_scipy_parser.__name__),
+        ScipyCommitParser(ScipyParserOptions(parse_squash_commits=False)),
+    ],
+)
+@pytest.mark.parametrize(
+    "commit_message",
+    [
+        "feat: add a new feature",
+        "fix(parser): fix a bug",
+        "docs: update the readme",
+        "feat!: drop support for python 3.7",
+        "refactor: rework everything\n\nBREAKING CHANGE: the api changed",
+        "not a conventional commit",
+        "ENH: add a new feature",
+        "BUG: fix a bug",
+        "API: remove a deprecated function",
+        "MAINT: tidy up",
+        ":sparkles: add a new feature (#12)",
+        ":bug: fix a bug",
+        ":boom: drop support for python 3.7",
+        "Merge branch 'feature' into main",
+        # squashed commits
+        "feat: release all the things (#12)\n\n* fix(a): thing one\n\n* feat!: thing two\n",
+        "ci: tidy up (#13)\n\n* docs: thing one\n\n* fix: thing two\n",
+        "ENH: squash (#12)\n\n* BUG: thing one\n\n* API: thing two\n",
+        ":memo: squash (#12)\n\n* :bug: thing one\n\n* :sparkles: thing two\n",
+        str.join(
+            "\n",
+            [
+                "Squashed commit of the following:",
+                "",
+                "commit 1234567890abcdef1234567890abcdef12345678",
+                "Author: author <author@example.com>",
+                "Date:   Sun Jan 1 00:00:00 2025 +0000",
+                "",
+                "    feat: thing one",
+                "",
+                "commit abcdef1234567890abcdef1234567890abcdef12",
+                "Author: author <author@example.com>",
+                "Date:   Sun Jan 1 00:00:00 2025 +0000",
+                "",
+                "    fix: thing two",
+            ],
+        ),
+    ],
+)
+def test_parse_bump_matches_parse(
+    commit_parser: CommitParser[ParseResult, ParserOptions],
+    commit_message: str,
+    make_commit_obj: MakeCommitObjFn,
+):
+    commit = make_commit_obj(commit_message)
+
+    assert supports_bump_parsing(commit_parser)
+    assert commit_parser.parse_bump(commit) == _max_bump(commit_parser.parse(commit))  # type: ignore[attr-defined]
+
+
+def test_bump_parsing_unsupported_when_parse_is_overridden():
+    assert not supports_bump_parsing(
+        CustomConventionalParserWithIgnorePatterns(ConventionalCommitParserOptions())
+    )
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.history.commits import (
+    CommitRecord,
+    iter_commit_records,
+    iter_commits,
+)
+
+from tests.fixtures.repos import (
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits,
+    repo_w_trunk_only_conventional_commits,
+)
+
+if TYPE_CHECKING:
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(repo_w_trunk_only_conventional_commits.__name__),
+        lazy_fixture(
+            repo_w_git_flow_w_alpha_prereleases_n_conventional_commits.__name__
+        ),
+    ],
+)
+def test_iter_commits_matches_gitpython(repo_result: BuiltRepoResult):
+    repo = repo_result["repo"]
+    expected_commits = list(repo.iter_commits("HEAD", topo_order=True))
+
+    actual_commits = list(iter_commits(repo, "HEAD", topo_order=True))
+
+    assert [c.hexsha for c in expected_commits] == [c.hexsha for c in actual_commits]
+    for expected, actual in zip(expected_commits, actual_commits):
+        for attr in (
+            "message",
+            "author",
+            "authored_date",
+            "author_tz_offset",
+            "committer",
+            "committed_date",
+            "committer_tz_offset",
+            "parents",
+            "tree",
+        ):
+            assert getattr(expected, attr) == getattr(actual, attr), attr
+
+
+def test_iter_commits_links_parents_in_memory(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_trunk_only_conventional_commits["repo"]
+
+    commits = {commit.hexsha: commit for commit in iter_commits(repo, "HEAD")}
+
+    for commit in commits.values():
+        for parent in commit.parents:
+            # the parent must be the same (populated) object that was yielded
+            assert commits[parent.hexsha] is parent
+
+
+def test_commit_record_from_log_entry():
+    entry = str.join(
+        "\x1f",
+        [
+            "a" * 40,
+            f"{'b' * 40} {'c' * 40}",
+            "d" * 40,
+            "Jane Doe",
+            "jane@example.com",
+            "1700000000 +0200",
+            "John Doe",
+            "john@example.com",
+            "1700000100 -0130",
+            "feat: add a field\x1fseparator\n\nbody\n",
+        ],
+    )
+
+    record = CommitRecord.from_log_entry(entry)
+
+    assert record.hexsha == "a" * 40
+    assert record.parent_shas == ("b" * 40, "c" * 40)
+    assert record.authored_date == 1700000000
+    # GitPython stores the offset as seconds west of UTC
+    assert record.author_tz_offset == -7200
+    assert record.committer_tz_offset == 5400
+    assert record.message == "feat: add a field\x1fseparator\n\nbody\n"
+
+
+def test_iter_commit_records_stops_early(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_trunk_only_conventional_commits["repo"]
+    records = iter_commit_records(repo, "HEAD")
+
+    first_record = next(records)
+    records.close()
+
+    assert first_record.hexsha == repo.head.commit.hexsha
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from git import Repo
+
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitParser,
+    ConventionalCommitParserOptions,
+)
+from semantic_release.history.commits import iter_commits
+from semantic_release.history.notes_cache import (
+    MAX_FINGERPRINTS_PER_NOTE,
+    NOTES_REF,
+    GitNotesParseCache,
+)
+from semantic_release.history.parse_cache import ParseCacheStats, parser_fingerprint
+from semantic_release.history.snapshot import HistorySnapshot
+from semantic_release.version.translator import VersionTranslator
+
+if TYPE_CHECKING:
+    import pytest
+
+    from semantic_release.commit_parser.token import ParseResult
+
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+def _as_comparable(result: ParseResult | list[ParseResult]) -> list[tuple]:
+    return [
+        (type(res), res.message, res.hexsha, str(res))
+        for res in (result if isinstance(result, list) else [result])
+    ]
+
+
+def test_notes_cache_round_trip(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    tmp_path: Path,
+):
+    repo = repo_w_initial_commit["repo"]
+    repo.git.commit(allow_empty=True, m="feat(parser): add a feature\n\nCloses: #12")
+    repo.git.commit(allow_empty=True, m="not a conventional commit")
+    repo.git.commit(
+        allow_empty=True,
+        m="feat: big change (#12)\n\n* feat(a): thing one\n\n* fix(b): thing two\n",
+    )
+    commits = list(iter_commits(repo, "HEAD"))
+    fingerprint = parser_fingerprint(default_conventional_parser)
+    expected = {
+        commit.hexsha: default_conventional_parser.parse(commit) for commit in commits
+    }
+
+    repo_dir = Path(str(repo.working_tree_dir))
+    with GitNotesParseCache(repo_dir, tmp_path / "cache.sqlite3") as cache:
+        for commit in commits:
+            assert cache.get(commit, fingerprint) is None
+            cache.put(commit, fingerprint, expected[commit.hexsha])
+
+    assert cache.stats == ParseCacheStats(misses=len(commits), stored=len(commits))
+
+    # A single commit holds every note
+    assert repo.git.rev_list("--count", NOTES_REF) == "1"
+    assert len(repo.git.notes("--ref", NOTES_REF, "list").splitlines()) == len(commits)
+
+    with GitNotesParseCache(repo_dir, tmp_path / "cache.sqlite3") as cache:
+        cached = {commit.hexsha: cache.get(commit, fingerprint) for commit in commits}
+
+    assert cache.stats == ParseCacheStats(hits=len(commits))
+    for sha, result in expected.items():
+        assert cached[sha] is not None
+        assert _as_comparable(result) == _as_comparable(cached[sha])  # type: ignore[arg-type]
+
+    # Nothing was written, so the notes are left alone
+    assert repo.git.rev_list("--count", NOTES_REF) == "1"
+
+
+def test_notes_cache_commits_sharing_a_note(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    tmp_path: Path,
+):
+    repo = repo_w_initial_commit["repo"]
+    repo.git.commit(allow_empty=True, m="fix: typo")
+    repo.git.commit(allow_empty=True, m="fix: typo")
+    commits = list(repo.iter_commits("HEAD", max_count=2))
+    fingerprint = parser_fingerprint(default_conventional_parser)
+
+    repo_dir = Path(str(repo.working_tree_dir))
+    with GitNotesParseCache(repo_dir, tmp_path / "cache.sqlite3") as cache:
+        for commit in commits:
+            cache.put(commit, fingerprint, default_conventional_parser.parse(commit))
+
+    # Identical notes are stored in the same blob
+    note_shas = {
+        line.split()[0]
+        for line in repo.git.notes("--ref", NOTES_REF, "list").splitlines()
+        if line.split()[1] in {commit.hexsha for commit in commits}
+    }
+    assert len(note_shas) == 1
+
+    with GitNotesParseCache(repo_dir, tmp_path / "cache.sqlite3") as cache:
+        cached = [cache.get(commit, fingerprint) for commit in commits]
+
+    # Both are hits, each bound to its own commit
+    assert cache.stats == ParseCacheStats(hits=len(commits))
+    for commit, result in zip(commits, cached):
+        assert result is not None
+        assert _as_comparable(default_conventional_parser.parse(commit)) == (
+            _as_comparable(result)
+        )
+
+
+def test_notes_cache_keeps_the_latest_fingerprints(
+    repo_w_initial_commit: BuiltRepoResult,
+    tmp_path: Path,
+):
+    repo = repo_w_initial_commit["repo"]
+    repo_dir = Path(str(repo.working_tree_dir))
+    commit = repo.head.commit
+    parsers = [
+        ConventionalCommitParser(
+            ConventionalCommitParserOptions(patch_tags=("fix", f"type{i}"))
+        )
+        for i in range(MAX_FINGERPRINTS_PER_NOTE + 1)
+    ]
+
+    for parser in parsers:
+        with GitNotesParseCache(repo_dir, tmp_path / "cache.sqlite3") as cache:
+            cache.put(commit, parser_fingerprint(parser), parser.parse(commit))
+
+    with GitNotesParseCache(repo_dir, tmp_path / "cache.sqlite3") as cache:
+        cached = [cache.get(commit, parser_fingerprint(parser)) for parser in parsers]
+
+    assert cached[0] is None
+    assert all(result is not None for result in cached[1:])
+
+
+def test_notes_cache_travels_with_the_repository(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    tmp_path_factory: pytest.TempPathFactory,
+):
+    repo = repo_w_trunk_only_conventional_commits["repo"]
+
+    def parse_all_commits(clone: Repo) -> list[str]:
+        with GitNotesParseCache(
+            Path(str(clone.working_tree_dir)),
+            tmp_path_factory.mktemp("cache") / "cache.sqlite3",
+        ) as cache, mock.patch.object(
+            default_conventional_parser,
+            "parse",
+            wraps=default_conventional_parser.parse,
+        ) as parse_spy:
+            history = HistorySnapshot(
+                repo=clone,
+                translator=VersionTranslator(),
+                commit_parser=default_conventional_parser,
+                parse_cache=cache,
+            )
+            history.parse_many(history.commits)
+
+        return [call.args[0].hexsha for call in parse_spy.call_args_list]
+
+    assert parse_all_commits(repo)
+
+    # A fresh clone which fetches the notes parses nothing
+    with Repo.clone_from(
+        str(repo.working_tree_dir), str(tmp_path_factory.mktemp("clone") / "repo")
+    ) as clone:
+        clone.git.fetch("origin", f"{NOTES_REF}:{NOTES_REF}")
+        assert parse_all_commits(clone) == []
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+import semantic_release.history.parallel
+from semantic_release.commit_parser.token import ParseError
+from semantic_release.history.commits import iter_commits
+from semantic_release.history.parallel import parse_commits
+
+from tests.fixtures.repos import (
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits,
+    repo_w_trunk_only_conventional_commits,
+)
+
+if TYPE_CHECKING:
+    from semantic_release.commit_parser.conventional import ConventionalCommitParser
+    from semantic_release.commit_parser.token import ParseResult
+
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+def _as_comparable(result: ParseResult | list[ParseResult]) -> list[tuple]:
+    return [
+        (
+            type(res),
+            res.message,
+            res.hexsha,
+            *(res[:-1] if isinstance(res, ParseError) else (*res[:5], *res[6:])),
+        )
+        for res in (result if isinstance(result, list) else [result])
+    ]
+
+
+@pytest.fixture
+def parallel_thresholds(monkeypatch: pytest.MonkeyPatch) -> None:
+    # parallelize even the small histories of the test repositories
+    monkeypatch.setattr(semantic_release.history.parallel, "MIN_PARALLEL_COMMITS", 1)
+    monkeypatch.setattr(semantic_release.history.parallel, "MIN_CHUNK_SIZE", 2)
+
+
+@pytest.mark.usefixtures(parallel_thresholds.__name__)
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(repo_w_trunk_only_conventional_commits.__name__),
+        lazy_fixture(
+            repo_w_git_flow_w_alpha_prereleases_n_conventional_commits.__name__
+        ),
+    ],
+)
+def test_parse_commits_in_parallel_matches_serial(
+    repo_result: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_result["repo"]
+    repo.git.commit(
+        allow_empty=True,
+        m="feat: big change (#12)\n\n* feat(a): thing one\n\n* fix(b): thing two\n",
+    )
+    commits = list(iter_commits(repo, "HEAD", topo_order=True))
+
+    with mock.patch(
+        "semantic_release.history.parallel.ProcessPoolExecutor",
+        wraps=semantic_release.history.parallel.ProcessPoolExecutor,
+    ) as executor_spy:
+        results = parse_commits(default_conventional_parser, commits, workers=3)
+
+    assert executor_spy.call_count == 1
+    assert [_as_comparable(result) for result in results] == [
+        _as_comparable(default_conventional_parser.parse(commit)) for commit in commits
+    ]
+
+
+@pytest.mark.usefixtures(parallel_thresholds.__name__)
+def test_parse_commits_serially_with_unpicklable_parser(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    commits = list(iter_commits(repo_w_trunk_only_conventional_commits["repo"]))
+    # lambdas can not be pickled
+    default_conventional_parser.unpicklable = lambda: None  # type: ignore[attr-defined]
+
+    with mock.patch(
+        "semantic_release.history.parallel.ProcessPoolExecutor"
+    ) as executor_mock:
+        results = parse_commits(default_conventional_parser, commits, workers=3)
+
+    assert executor_mock.call_count == 0
+    assert len(results) == len(commits)
+
+
+def test_parse_commits_serially_for_small_histories(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    commits = list(iter_commits(repo_w_trunk_only_conventional_commits["repo"]))
+
+    with mock.patch(
+        "semantic_release.history.parallel.ProcessPoolExecutor"
+    ) as executor_mock:
+        results = parse_commits(default_conventional_parser, commits, workers=16)
+
+    assert executor_mock.call_count == 0
+    assert [_as_comparable(result) for result in results] == [
+        _as_comparable(default_conventional_parser.parse(commit)) for commit in commits
+    ]
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import importlib.metadata
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import semantic_release
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitParser,
+    ConventionalCommitParserOptions,
+)
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.history.commits import iter_commits
+from semantic_release.history.parse_cache import (
+    ParseCache,
+    ParseCacheStats,
+    parser_fingerprint,
+)
+from semantic_release.history.snapshot import HistorySnapshot
+from semantic_release.version.translator import VersionTranslator
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from semantic_release.commit_parser.token import ParseResult
+
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+def _as_comparable(result: ParseResult | list[ParseResult]) -> list[tuple]:
+    return [
+        (
+            type(res),
+            res.message,
+            res.hexsha,
+            *(
+                res[:-1]
+                if isinstance(res, ParseError)
+                else (*res[:5], *res[6:])  # everything but the commit object
+            ),
+        )
+        for res in (result if isinstance(result, list) else [result])
+    ]
+
+
+def test_parse_cache_round_trip(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    tmp_path: Path,
+):
+    repo = repo_w_initial_commit["repo"]
+    repo.git.commit(allow_empty=True, m="feat(parser): add a feature\n\nCloses: #12")
+    repo.git.commit(allow_empty=True, m="not a conventional commit")
+    repo.git.commit(
+        allow_empty=True,
+        m="feat: big change (#12)\n\n* feat(a): thing one\n\n* fix(b): thing two\n",
+    )
+    commits = list(iter_commits(repo, "HEAD"))
+    fingerprint = parser_fingerprint(default_conventional_parser)
+    expected = {
+        commit.hexsha: default_conventional_parser.parse(commit) for commit in commits
+    }
+
+    with ParseCache(tmp_path / "cache.sqlite3") as cache:
+        for commit in commits:
+            assert cache.get(commit, fingerprint) is None
+            cache.put(commit, fingerprint, expected[commit.hexsha])
+
+    assert cache.stats == ParseCacheStats(misses=len(commits), stored=len(commits))
+
+    with ParseCache(tmp_path / "cache.sqlite3") as cache:
+        cached = {commit.hexsha: cache.get(commit, fingerprint) for commit in commits}
+
+    assert cache.stats == ParseCacheStats(hits=len(commits))
+    for sha, result in expected.items():
+        assert _as_comparable(result) == _as_comparable(cached[sha])
+
+    # Squashed commits are restored as separate results with their own messages
+    squashed = cached[repo.head.commit.hexsha]
+    assert isinstance(squashed, list)
+    assert [res.message for res in squashed] == [
+        "feat: big change (#12)",
+        "feat(a): thing one",
+        "fix(b): thing two",
+    ]
+    assert all(isinstance(res, ParsedCommit) for res in squashed)
+
+
+def test_parse_cache_fingerprint_changes_with_parser_options():
+    default_fingerprint = parser_fingerprint(ConventionalCommitParser())
+
+    assert default_fingerprint == parser_fingerprint(ConventionalCommitParser())
+    assert default_fingerprint != parser_fingerprint(
+        ConventionalCommitParser(
+            ConventionalCommitParserOptions(minor_tags=("feat", "perf"))
+        )
+    )
+
+
+def test_parse_cache_fingerprint_changes_with_the_release():
+    default_fingerprint = parser_fingerprint(ConventionalCommitParser())
+
+    # The installed distribution is not consulted, e.g. for a source checkout
+    with mock.patch(
+        "importlib.metadata.version",
+        side_effect=importlib.metadata.PackageNotFoundError,
+    ), mock.patch.object(semantic_release, "__version__", "0.0.0"):
+        release_fingerprint = parser_fingerprint(ConventionalCommitParser())
+
+    assert default_fingerprint != release_fingerprint
+
+
+def test_parse_cache_evicts_least_recently_used(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    tmp_path: Path,
+):
+    repo = repo_w_initial_commit["repo"]
+    for i in range(5):
+        repo.git.commit(allow_empty=True, m=f"fix: bug number {i}")
+
+    # oldest commit first so that it is the least recently used
+    commits = list(reversed(list(iter_commits(repo, "HEAD"))))
+    fingerprint = parser_fingerprint(default_conventional_parser)
+
+    with ParseCache(tmp_path / "cache.sqlite3") as cache:
+        for i, commit in enumerate(commits):
+            cache.put(commit, fingerprint, default_conventional_parser.parse(commit))
+            cache.flush()
+            # make the access order explicit rather than relying on the clock
+            cache._pending_touches.append((i, commit.hexsha, fingerprint))
+        cache.flush()
+
+        sizes = [
+            row[0]
+            for row in cache.connection.execute(  # type: ignore[union-attr]
+                "SELECT size FROM parse_results ORDER BY last_used DESC"
+            )
+        ]
+        cache.max_size = sum(sizes[:3])
+
+    assert cache.stats.evicted == len(commits) - 3
+
+    with ParseCache(tmp_path / "cache.sqlite3") as cache:
+        remaining = [
+            commit for commit in commits if cache.get(commit, fingerprint) is not None
+        ]
+
+    assert remaining == commits[-3:]
+
+
+def test_parse_cache_disables_itself_on_database_errors(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    tmp_path: Path,
+):
+    commit = repo_w_initial_commit["repo"].head.commit
+    cache_file = tmp_path / "cache.sqlite3"
+    cache_file.write_bytes(b"definitely not a sqlite database" * 100)
+
+    with ParseCache(cache_file) as cache:
+        assert cache.get(commit, "fingerprint") is None
+        cache.put(commit, "fingerprint", default_conventional_parser.parse(commit))
+
+    assert cache.connection is None
+    assert cache.stats == ParseCacheStats()
+
+
+def test_snapshot_only_parses_commits_missing_from_the_cache(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    tmp_path: Path,
+):
+    repo = repo_w_trunk_only_conventional_commits["repo"]
+    cache_file = tmp_path / "cache.sqlite3"
+
+    def parse_all_commits() -> tuple[list[str], ParseCacheStats]:
+        with ParseCache(cache_file) as cache, mock.patch.object(
+            default_conventional_parser,
+            "parse",
+            wraps=default_conventional_parser.parse,
+        ) as parse_spy:
+            history = HistorySnapshot(
+                repo=repo,
+                translator=VersionTranslator(),
+                commit_parser=default_conventional_parser,
+                parse_cache=cache,
+            )
+            for commit in history.commits:
+                history.parse(commit)
+
+        return [call.args[0].hexsha for call in parse_spy.call_args_list], cache.stats
+
+    all_shas = [commit.hexsha for commit in repo.iter_commits()]
+
+    parsed_shas, stats = parse_all_commits()
+    assert sorted(parsed_shas) == sorted(all_shas)
+    assert stats == ParseCacheStats(misses=len(all_shas), stored=len(all_shas))
+
+    repo.git.commit(allow_empty=True, m="fix: a new bug fix")
+
+    parsed_shas, stats = parse_all_commits()
+    assert parsed_shas == [repo.head.commit.hexsha]
+    assert stats == ParseCacheStats(hits=len(all_shas), misses=1, stored=1)
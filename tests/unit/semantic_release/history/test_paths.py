@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from semantic_release.history.paths import (
+    ChangedPathIndex,
+    _iter_diff_tree,
+    normalize_path_filter,
+    touches_paths,
+)
+
+if TYPE_CHECKING:
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+def test_changed_path_index_of_every_kind_of_commit(
+    repo_w_initial_commit: BuiltRepoResult,
+):
+    repo = repo_w_initial_commit["repo"]
+    repo_dir = Path(str(repo.working_tree_dir))
+    initial_commit = repo.head.commit
+    default_branch = repo.active_branch.name
+
+    (repo_dir / "packages" / "a b").mkdir(parents=True)
+    (repo_dir / "packages" / "a b" / "module.py").write_text("a = 1\n")
+    (repo_dir / "packages" / "c.py").write_text("c = 1\n")
+    repo.git.add("packages")
+    repo.git.commit(m="feat: add packages")
+    packages_commit = repo.head.commit
+
+    repo.git.checkout("-b", "feature")
+    repo.git.rm("packages/c.py")
+    repo.git.commit(m="fix: remove c")
+    removal_commit = repo.head.commit
+
+    repo.git.checkout(default_branch)
+    repo.git.commit(m="chore: empty", allow_empty=True)
+    empty_commit = repo.head.commit
+    repo.git.merge("feature", no_ff=True, m="Merge branch 'feature'")
+    merge_commit = repo.head.commit
+
+    index = ChangedPathIndex(repo)
+    commits = [
+        initial_commit,
+        packages_commit,
+        removal_commit,
+        empty_commit,
+        merge_commit,
+    ]
+
+    with mock.patch(
+        "semantic_release.history.paths._iter_diff_tree", wraps=_iter_diff_tree
+    ) as diff_tree_spy:
+        index.load(commit.hexsha for commit in commits)
+        index.load([packages_commit.hexsha])
+
+    # All commits are diffed by a single git process, loaded commits are never
+    # diffed again
+    assert diff_tree_spy.call_count == 1
+    assert len(index) == len(commits)
+    assert all(commit.hexsha in index for commit in commits)
+
+    assert index.paths(initial_commit.hexsha) == frozenset(initial_commit.stats.files)
+    assert index.paths(packages_commit.hexsha) == {
+        "packages/a b/module.py",
+        "packages/c.py",
+    }
+    assert index.paths(removal_commit.hexsha) == {"packages/c.py"}
+    assert index.paths(empty_commit.hexsha) == frozenset()
+    assert index.paths(merge_commit.hexsha) == frozenset()
+
+    # A commit which has not been loaded is diffed on first access
+    repo.git.commit(m="chore: another empty commit", allow_empty=True)
+    assert index.paths(repo.head.commit.hexsha) == frozenset()
+
+
+def test_changed_path_index_of_the_first_parent(
+    repo_w_initial_commit: BuiltRepoResult,
+):
+    repo = repo_w_initial_commit["repo"]
+    repo_dir = Path(str(repo.working_tree_dir))
+    default_branch = repo.active_branch.name
+
+    repo.git.checkout("-b", "feature")
+    (repo_dir / "packages" / "core").mkdir(parents=True)
+    (repo_dir / "packages" / "core" / "a.py").write_text("a = 1\n")
+    repo.git.add("packages")
+    repo.git.commit(m="feat(core): add a")
+
+    repo.git.checkout(default_branch)
+    (repo_dir / "README.md").write_text("# Changed on the default branch\n")
+    repo.git.add("README.md")
+    repo.git.commit(m="docs: update the readme")
+    repo.git.merge("feature", no_ff=True, m="Merge branch 'feature'")
+    merge_commit = repo.head.commit
+    main_commit = merge_commit.parents[0]
+
+    index = ChangedPathIndex(repo, first_parent=True)
+    index.load([merge_commit.hexsha, main_commit.hexsha])
+
+    # A merge commit changed everything it merged, compared to its first parent
+    assert index.paths(merge_commit.hexsha) == {"packages/core/a.py"}
+    assert index.paths(main_commit.hexsha) == {"README.md"}
+    assert ChangedPathIndex(repo).paths(merge_commit.hexsha) == frozenset()
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        (".", ""),
+        ("./", ""),
+        ("", ""),
+        ("packages/core", "packages/core"),
+        ("./packages/core/", "packages/core"),
+        ("packages\\core", "packages/core"),
+    ],
+)
+def test_normalize_path_filter(path: str, expected: str):
+    assert expected == normalize_path_filter(path)
+
+
+@pytest.mark.parametrize(
+    "changed, path_filters, expected",
+    [
+        ({"packages/core/a.py"}, ("packages/core",), True),
+        ({"packages/core"}, ("packages/core",), True),
+        ({"packages/core-utils/a.py"}, ("packages/core",), False),
+        ({"README.md"}, ("packages/core", "packages/cli"), False),
+        ({"README.md", "packages/cli/b.py"}, ("packages/core", "packages/cli"), True),
+        ({"README.md"}, ("",), True),
+        (set(), ("",), True),
+        (set(), ("packages/core",), False),
+    ],
+)
+def test_touches_paths(
+    changed: set[str], path_filters: tuple[str, ...], expected: bool
+):
+    assert expected == touches_paths(changed, path_filters)
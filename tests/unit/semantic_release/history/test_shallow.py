@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Repo
+
+from semantic_release.history.shallow import (
+    ShallowHistory,
+    is_shallow,
+    shallow_commits,
+)
+from semantic_release.history.snapshot import HistorySnapshot
+from semantic_release.version.algorithm import next_version
+from semantic_release.version.translator import VersionTranslator
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from semantic_release.commit_parser.conventional import ConventionalCommitParser
+
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.fixture
+def remote_dir(
+    repo_w_initial_commit: BuiltRepoResult, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """A bare copy of the repository standing in for its remote"""
+    repo = repo_w_initial_commit["repo"]
+
+    def commit(message: str) -> None:
+        repo.git.commit(m=message, allow_empty=True)
+
+    commit("feat: add a")
+    repo.git.tag("v1.0.0", m="v1.0.0")
+    commit("fix: fix b")
+    commit("fix: fix c")
+    commit("feat: add d")
+    repo.git.tag("v1.1.0")
+    commit("fix: fix e")
+    repo.git.tag("v1.2.0-rc.1", m="v1.2.0-rc.1")
+    commit("feat: add f")
+    commit("fix: fix g")
+
+    remote_dir = tmp_path_factory.mktemp("remote") / "repo.git"
+    Repo.clone_from(str(repo.working_tree_dir), str(remote_dir), bare=True).close()
+    return remote_dir
+
+
+def shallow_clone(remote_dir: Path, clone_dir: Path) -> Repo:
+    # Like a CI checkout: only the head commit & no tags
+    return Repo.clone_from(
+        f"file://{remote_dir}", str(clone_dir), depth=1, no_tags=True
+    )
+
+
+def test_deepens_until_the_latest_full_release(
+    repo_w_initial_commit: BuiltRepoResult,
+    remote_dir: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_initial_commit["repo"]
+    clone = shallow_clone(remote_dir, tmp_path_factory.mktemp("clone") / "repo")
+    assert len(list(clone.iter_commits())) == 1
+
+    history = HistorySnapshot(
+        repo=clone,
+        translator=VersionTranslator(),
+        commit_parser=default_conventional_parser,
+        shallow_history=ShallowHistory(clone, initial_depth=1),
+    )
+
+    version = next_version(
+        repo=clone,
+        translator=history.translator,
+        commit_parser=default_conventional_parser,
+        allow_zero_version=False,
+        major_on_zero=True,
+        history=history,
+    )
+
+    expected_version = next_version(
+        repo=repo,
+        translator=VersionTranslator(),
+        commit_parser=default_conventional_parser,
+        allow_zero_version=False,
+        major_on_zero=True,
+    )
+    assert expected_version == version
+    assert str(version) == "1.2.0"
+
+    # Only the history up to the latest full release & its tags are fetched
+    assert is_shallow(clone)
+    assert {"v1.1.0", "v1.2.0-rc.1"} == {tag.name for tag in clone.tags}
+    assert [commit.summary for commit in clone.iter_commits()][-1] == "feat: add d"
+    clone.close()
+
+
+def test_only_deepens_the_evaluated_branch(
+    repo_w_initial_commit: BuiltRepoResult,
+    remote_dir: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+):
+    repo = repo_w_initial_commit["repo"]
+    # A branch off the initial commit, which is not fetched to reach a release
+    other_sha = repo.git.commit_tree(
+        "HEAD^{tree}",
+        "-p",
+        repo.git.rev_list("--max-parents=0", "HEAD"),
+        m="feat: an unrelated branch",
+    )
+    repo.git.push(str(remote_dir), f"{other_sha}:refs/heads/other")
+
+    clone = Repo.clone_from(
+        f"file://{remote_dir}",
+        str(tmp_path_factory.mktemp("clone") / "repo"),
+        depth=1,
+        no_tags=True,
+        no_single_branch=True,
+    )
+    assert other_sha in shallow_commits(clone)
+
+    with mock.patch.object(
+        ShallowHistory,
+        "_history",
+        autospec=True,
+        side_effect=ShallowHistory._history,
+    ) as history_spy:
+        ShallowHistory(clone, initial_depth=1).complete("HEAD", VersionTranslator())
+
+    # The other branch is left shallow
+    assert other_sha in shallow_commits(clone)
+    assert [commit.summary for commit in clone.iter_commits()][-1] == "feat: add d"
+
+    # The full history is only read once, then only what each step fetched
+    assert history_spy.call_count > 2
+    assert history_spy.call_args_list[0].args[1:] == ("HEAD",)
+    assert all("HEAD" not in call.args for call in history_spy.call_args_list[1:])
+    clone.close()
+
+
+def test_fetches_the_full_history_without_releases(
+    repo_w_initial_commit: BuiltRepoResult,
+    remote_dir: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+):
+    repo = repo_w_initial_commit["repo"]
+    clone = shallow_clone(remote_dir, tmp_path_factory.mktemp("clone") / "repo")
+
+    fetched = ShallowHistory(clone).complete("HEAD", VersionTranslator("pkg-{version}"))
+
+    assert fetched
+    assert not is_shallow(clone)
+    assert len(list(repo.iter_commits())) == len(list(clone.iter_commits()))
+    assert not clone.tags
+    clone.close()
+
+
+def test_complete_history_is_left_alone(repo_w_initial_commit: BuiltRepoResult):
+    repo = repo_w_initial_commit["repo"]
+
+    # the remote is never contacted, it does not even exist
+    assert not ShallowHistory(repo, "missing").complete("HEAD", VersionTranslator())
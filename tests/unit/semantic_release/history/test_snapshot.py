@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.commit_parser.token import ParsedCommit
+from semantic_release.history.commits import MergeUnit, TraversalMode
+from semantic_release.history.parse_cache import ParseCache
+from semantic_release.history.paths import _iter_diff_tree
+from semantic_release.history.snapshot import HistorySnapshot
+from semantic_release.history.tags import indexed_tags_and_versions
+from semantic_release.version.algorithm import next_version
+from semantic_release.version.translator import VersionTranslator
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from semantic_release.commit_parser.conventional import ConventionalCommitParser
+
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+def test_snapshot_shared_by_next_version_and_release_history(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_trunk_only_conventional_commits["repo"]
+    translator = VersionTranslator()
+    history = HistorySnapshot(
+        repo=repo,
+        translator=translator,
+        commit_parser=default_conventional_parser,
+    )
+
+    with mock.patch(
+        "semantic_release.history.snapshot.indexed_tags_and_versions",
+        wraps=indexed_tags_and_versions,
+    ) as tags_spy, mock.patch.object(
+        default_conventional_parser,
+        "parse",
+        wraps=default_conventional_parser.parse,
+    ) as parse_spy:
+        next_version(
+            repo=repo,
+            translator=translator,
+            commit_parser=default_conventional_parser,
+            allow_zero_version=True,
+            major_on_zero=True,
+            history=history,
+        )
+        release_history = ReleaseHistory.from_git_history(
+            repo=repo,
+            translator=translator,
+            commit_parser=default_conventional_parser,
+            history=history,
+        )
+        released_versions = history.released_versions
+
+    # Tags are resolved exactly once for every consumer
+    assert tags_spy.call_count == 1
+    assert released_versions == set(release_history.released.keys())
+
+    # Every commit is parsed exactly once
+    parsed_shas = [call.args[0].hexsha for call in parse_spy.call_args_list]
+    assert len(parsed_shas) == len(set(parsed_shas))
+    assert set(parsed_shas) == {commit.hexsha for commit in repo.iter_commits()}
+
+
+def test_snapshot_without_bump_parsing_parses_each_commit_once(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_trunk_only_conventional_commits["repo"]
+    repo.git.commit(m="feat: an unreleased feature", allow_empty=True)
+    translator = VersionTranslator()
+    history = HistorySnapshot(
+        repo=repo,
+        translator=translator,
+        commit_parser=default_conventional_parser,
+        bump_parsing=False,
+    )
+
+    with mock.patch.object(
+        default_conventional_parser,
+        "parse",
+        wraps=default_conventional_parser.parse,
+    ) as parse_spy, mock.patch.object(
+        default_conventional_parser,
+        "parse_bump",
+        wraps=default_conventional_parser.parse_bump,
+    ) as parse_bump_spy:
+        next_version(
+            repo=repo,
+            translator=translator,
+            commit_parser=default_conventional_parser,
+            allow_zero_version=True,
+            major_on_zero=True,
+            history=history,
+        )
+        ReleaseHistory.from_git_history(
+            repo=repo,
+            translator=translator,
+            commit_parser=default_conventional_parser,
+            history=history,
+        )
+
+    # The next version is determined from the results of the release history
+    assert not parse_bump_spy.called
+    parsed_shas = [call.args[0].hexsha for call in parse_spy.call_args_list]
+    assert len(parsed_shas) == len(set(parsed_shas))
+    assert set(parsed_shas) == {commit.hexsha for commit in repo.iter_commits()}
+
+
+def test_derived_snapshot_reuses_parse_results(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_trunk_only_conventional_commits["repo"]
+    history = HistorySnapshot(
+        repo=repo,
+        translator=VersionTranslator(),
+        commit_parser=default_conventional_parser,
+    )
+    history.parse_many(history.commits)
+    tags = history.tags_and_versions
+    old_head = history.head_commit
+
+    repo.git.commit(m="fix: a new commit", allow_empty=True)
+
+    with mock.patch.object(
+        default_conventional_parser,
+        "parse",
+        wraps=default_conventional_parser.parse,
+    ) as parse_spy:
+        derived = history.derive(repo.head.commit.hexsha)
+        derived.parse_many(derived.commits)
+        stale_tags = derived.tags_and_versions
+        fresh_tags = history.derive("HEAD", reuse_tags=False).tags_and_versions
+
+    # Only the new commit is parsed, the tag index is shared unless requested
+    assert [call.args[0].hexsha for call in parse_spy.call_args_list] == [
+        repo.head.commit.hexsha
+    ]
+    assert derived.commits[1:] == history.commits
+    assert history.head_commit == old_head
+    assert stale_tags is tags
+    assert fresh_tags is not stale_tags
+    assert fresh_tags == stale_tags
+
+
+def test_snapshots_limited_to_paths_share_one_walk(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_initial_commit["repo"]
+    repo_dir = Path(str(repo.working_tree_dir))
+
+    def commit_file(path: str, message: str) -> None:
+        (repo_dir / path).parent.mkdir(parents=True, exist_ok=True)
+        (repo_dir / path).write_text(message)
+        repo.git.add(path)
+        repo.git.commit(m=message)
+
+    commit_file("packages/core/a.py", "feat: add core")
+    commit_file("packages/cli/b.py", "feat: add cli")
+    repo.git.tag("core-v1.0.0")
+    repo.git.tag("cli-v1.0.0")
+    commit_file("packages/core/a.py", "fix: fix core")
+    commit_file("README.md", "feat: a change outside of every package")
+
+    history = HistorySnapshot(
+        repo=repo,
+        translator=VersionTranslator(),
+        commit_parser=default_conventional_parser,
+    )
+    history.historic_tags_and_versions  # noqa: B018
+    history.path_index.load(commit.hexsha for commit in history.commits)
+
+    with mock.patch("semantic_release.history.paths._iter_diff_tree") as diff_tree_spy:
+        packages = {
+            name: history.derive(
+                history.rev,
+                translator=VersionTranslator(tag_format=f"{name}-v{{version}}"),
+                paths=[f"./packages/{name}/"],
+            )
+            for name in ("core", "cli")
+        }
+        next_versions = {
+            name: next_version(
+                repo=repo,
+                translator=package_history.translator,
+                commit_parser=default_conventional_parser,
+                allow_zero_version=True,
+                major_on_zero=True,
+                history=package_history,
+            )
+            for name, package_history in packages.items()
+        }
+
+    # The paths of every commit are read once for all packages
+    assert diff_tree_spy.call_count == 0
+    assert all(
+        snapshot.path_index is history.path_index for snapshot in packages.values()
+    )
+    assert packages["core"].paths == ("packages/core",)
+    assert [str(version) for version in next_versions.values()] == ["1.0.1", "1.0.0"]
+    # Only the tags of its own format are read for every package
+    assert [tag.name for tag in packages["core"].format_tag_records] == ["core-v1.0.0"]
+    assert not history.format_tag_records
+    assert not packages["cli"].is_relevant(repo.head.commit)
+    assert history.is_relevant(repo.head.commit)
+
+
+def test_commits_only_changing_excluded_paths_are_ignored(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_initial_commit["repo"]
+    repo_dir = Path(str(repo.working_tree_dir))
+    translator = VersionTranslator()
+
+    def commit_files(message: str, *paths: str) -> None:
+        for path in paths:
+            (repo_dir / path).parent.mkdir(parents=True, exist_ok=True)
+            (repo_dir / path).write_text(message)
+        repo.git.add(*paths)
+        repo.git.commit(m=message)
+
+    repo.git.tag("v1.0.0")
+    commit_files("feat: document a feature", "docs/feature.rst", "README.md")
+    commit_files("fix: fix a bug", "src/module.py", "docs/bug.rst")
+
+    kwargs: dict[str, Any] = {
+        "repo": repo,
+        "translator": translator,
+        "commit_parser": default_conventional_parser,
+    }
+    history = HistorySnapshot(**kwargs)
+
+    with mock.patch(
+        "semantic_release.history.paths._iter_diff_tree",
+        wraps=_iter_diff_tree,
+    ) as diff_tree_spy:
+        version = next_version(
+            **kwargs,
+            allow_zero_version=True,
+            major_on_zero=True,
+            history=history,
+            exclude_paths=["docs", "README.md"],
+        )
+
+    # Only the commits since the last release are diffed for the version
+    assert diff_tree_spy.call_count == 1
+    assert str(version) == "1.0.1"
+    # The shared snapshot itself is not limited
+    assert not history.is_path_limited
+
+
+def test_commits_only_changing_excluded_paths_are_in_the_changelog(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_initial_commit["repo"]
+    repo_dir = Path(str(repo.working_tree_dir))
+
+    def commit_files(message: str, *paths: str) -> None:
+        for path in paths:
+            (repo_dir / path).parent.mkdir(parents=True, exist_ok=True)
+            (repo_dir / path).write_text(message)
+        repo.git.add(*paths)
+        repo.git.commit(m=message)
+
+    repo.git.tag("v1.0.0")
+    commit_files("feat(pkg): add a feature", "pkg/feature.py")
+    commit_files("docs(pkg): document the feature", "pkg/docs/feature.rst")
+    commit_files("feat(other): add a feature", "other/feature.py")
+
+    kwargs: dict[str, Any] = {
+        "repo": repo,
+        "translator": VersionTranslator(),
+        "commit_parser": default_conventional_parser,
+    }
+    history = HistorySnapshot(**kwargs, paths=["pkg"], exclude_paths=["pkg/docs"])
+
+    release_history = ReleaseHistory.from_git_history(**kwargs, history=history)
+
+    # Limited to the paths of the snapshot, regardless of its exclude_paths
+    assert sorted(
+        result.descriptions[0]
+        for results in release_history.unreleased.values()
+        for result in results
+    ) == ["add a feature", "document the feature"]
+    assert history.exclude_paths == ("pkg/docs",)
+
+
+@pytest.mark.parametrize(
+    "unit, merge_message, expected_descriptions",
+    [
+        (
+            MergeUnit.MERGE_COMMIT,
+            "Merge pull request #1 from feature\n\nfeat: add the feature",
+            ["add the feature"],
+        ),
+        (
+            MergeUnit.MERGED_COMMITS,
+            "Merge branch 'feature'",
+            ["fix the feature", "add the feature"],
+        ),
+    ],
+)
+def test_first_parent_traversal_parses_merges_as_units(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    tmp_path: Path,
+    unit: MergeUnit,
+    merge_message: str,
+    expected_descriptions: list[str],
+):
+    repo = repo_w_initial_commit["repo"]
+    default_branch = repo.active_branch.name
+    repo.git.tag("v1.0.0")
+
+    repo.git.checkout("-b", "feature")
+    repo.git.commit(m="feat: add the feature", allow_empty=True)
+    repo.git.commit(m="fix: fix the feature", allow_empty=True)
+    repo.git.checkout(default_branch)
+    repo.git.merge("feature", no_ff=True, m=merge_message)
+    merge_commit = repo.head.commit
+
+    def first_parent_history(cache: ParseCache) -> HistorySnapshot:
+        return HistorySnapshot(
+            repo=repo,
+            translator=VersionTranslator(),
+            commit_parser=default_conventional_parser,
+            parse_cache=cache,
+            traversal=TraversalMode.FIRST_PARENT,
+            merge_unit=unit,
+        )
+
+    for _ in range(2):
+        # The second run restores the results of the merge commit from the cache
+        with ParseCache(tmp_path / "cache.sqlite3") as cache:
+            history = first_parent_history(cache)
+            version = next_version(
+                repo=repo,
+                translator=history.translator,
+                commit_parser=default_conventional_parser,
+                allow_zero_version=True,
+                major_on_zero=True,
+                history=history,
+            )
+            release_history = ReleaseHistory.from_git_history(
+                repo=repo,
+                translator=history.translator,
+                commit_parser=default_conventional_parser,
+                history=history,
+            )
+
+        # Only the mainline is walked, the merge stands for the merged commits
+        assert merge_commit.hexsha == history.commits[0].hexsha
+        assert len(history.commits) == len(list(repo.iter_commits("v1.0.0"))) + 1
+        assert str(version) == "1.1.0"
+        assert [
+            result.descriptions[0]
+            for results in release_history.unreleased.values()
+            for result in results
+            if isinstance(result, ParsedCommit)
+        ] == expected_descriptions
+
+    assert cache.stats.hits > 0
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+import semantic_release
+from semantic_release.history.parse_cache import ParseCache
+from semantic_release.history.tags import (
+    indexed_tags_and_versions,
+    iter_tag_records,
+    merged_tag_names,
+    tag_format_patterns,
+    tag_format_prefix,
+    tags_and_versions,
+    translator_fingerprint,
+)
+from semantic_release.version.translator import VersionTranslator
+
+from tests.fixtures.repos import (
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits,
+    repo_w_trunk_only_conventional_commits,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(repo_w_trunk_only_conventional_commits.__name__),
+        lazy_fixture(
+            repo_w_git_flow_w_alpha_prereleases_n_conventional_commits.__name__
+        ),
+    ],
+)
+def test_iter_tag_records_matches_gitpython(repo_result: BuiltRepoResult):
+    repo = repo_result["repo"]
+    expected_tags = {tag.name: tag for tag in repo.tags}
+
+    actual_records = {record.name: record for record in iter_tag_records(repo)}
+
+    assert expected_tags.keys() == actual_records.keys()
+    for name, tag in expected_tags.items():
+        record = actual_records[name]
+        assert tag.commit.hexsha == record.commit_sha
+        assert tag.tag is not None
+        assert record.is_annotated
+        assert tag.tag.tagger == record.tagger
+        assert tag.tag.tagged_date == record.tagged_date
+        assert tag.tag.tagger_tz_offset == record.tagger_tz_offset
+
+
+def test_iter_tag_records_resolves_all_kinds_of_tags(
+    repo_w_initial_commit: BuiltRepoResult,
+):
+    repo = repo_w_initial_commit["repo"]
+    head = repo.head.commit
+    repo.git.tag("lightweight")
+    repo.git.tag("annotated", m="annotated")
+    repo.git.tag("nested", "annotated", m="a tag of a tag")
+    repo.git.tag("tree-tag", head.tree.hexsha)
+
+    records = {record.name: record for record in iter_tag_records(repo)}
+
+    assert str(records["lightweight"]) == "lightweight"
+    assert not records["lightweight"].is_annotated
+    assert records["lightweight"].commit_sha == head.hexsha
+    assert records["lightweight"].tagger == head.author
+    assert records["lightweight"].tagged_date == head.committed_date
+    assert records["lightweight"].tagger_tz_offset == head.author_tz_offset
+
+    assert records["annotated"].is_annotated
+    assert records["annotated"].commit_sha == head.hexsha
+    assert records["annotated"].object_sha != head.hexsha
+
+    assert records["nested"].commit_sha == head.hexsha
+
+    assert records["tree-tag"].commit_sha == ""
+
+
+def test_iter_tag_records_w_pattern(repo_w_initial_commit: BuiltRepoResult):
+    repo = repo_w_initial_commit["repo"]
+    for tag in ("v1.0.0", "v1.1.0", "other-v1.0.0"):
+        repo.git.tag(tag)
+
+    records = iter_tag_records(repo, "refs/tags/v*")
+
+    assert {"v1.0.0", "v1.1.0"} == {record.name for record in records}
+
+
+def test_merged_tag_names(repo_w_initial_commit: BuiltRepoResult):
+    repo = repo_w_initial_commit["repo"]
+    head = repo.head.commit
+    repo.git.tag("v1.0.0", m="v1.0.0")
+    repo.git.tag("nested", "v1.0.0", m="a tag of a tag")
+    repo.git.tag("tree-tag", head.tree.hexsha)
+
+    # a tag on a side branch, which is not part of the history of the main branch
+    repo.git.checkout("-b", "side")
+    repo.git.commit(allow_empty=True, m="feat: side change")
+    repo.git.tag("v2.0.0-side")
+    repo.git.checkout("-")
+
+    repo.git.commit(allow_empty=True, m="fix: main change")
+    repo.git.tag("v1.0.1")
+
+    assert {"v1.0.0", "nested", "v1.0.1"} == merged_tag_names(repo, "HEAD")
+    assert {"v1.0.0", "nested", "v2.0.0-side"} == merged_tag_names(repo, "side")
+    assert {"v1.0.0", "v1.0.1"} == merged_tag_names(repo, "HEAD", "refs/tags/v*")
+
+
+def test_indexed_tags_and_versions_only_parses_new_tags(
+    repo_w_initial_commit: BuiltRepoResult, tmp_path: Path
+):
+    repo = repo_w_initial_commit["repo"]
+    for tag in ("v1.0.0", "v1.1.0-rc.1", "v1.1.0+build.5", "v1.x", "other-tag"):
+        repo.git.tag(tag)
+
+    def indexed(translator: VersionTranslator) -> tuple[list[tuple[str, str]], int]:
+        """The tags & versions together with the number of parsed tag names"""
+        tags = list(iter_tag_records(repo))
+        with ParseCache(tmp_path / "cache.sqlite3") as cache, mock.patch.object(
+            translator, "from_tag", wraps=translator.from_tag
+        ) as from_tag_spy:
+            result = indexed_tags_and_versions(tags, translator, cache)
+
+        assert result == tags_and_versions(tags, translator)
+        return (
+            [(tag.name, version.as_tag()) for tag, version in result],
+            from_tag_spy.call_count,
+        )
+
+    expected = [
+        ("v1.1.0+build.5", "v1.1.0+build.5"),
+        ("v1.1.0-rc.1", "v1.1.0-rc.1"),
+        ("v1.0.0", "v1.0.0"),
+    ]
+    assert indexed(VersionTranslator()) == (expected, 5)
+    assert indexed(VersionTranslator()) == (expected, 0)
+
+    # Only the tags added since are parsed, deleted tags are dropped
+    repo.git.tag("v2.0.0")
+    repo.git.tag("-d", "v1.0.0")
+    assert indexed(VersionTranslator()) == (
+        [("v2.0.0", "v2.0.0"), *expected[:2]],
+        1,
+    )
+    assert indexed(VersionTranslator()) == ([("v2.0.0", "v2.0.0"), *expected[:2]], 0)
+
+    # Another tag format has an index of its own
+    assert indexed(VersionTranslator(tag_format="other-{version}")) == ([], 5)
+
+
+def test_translator_fingerprint_changes_with_the_release():
+    default_fingerprint = translator_fingerprint(VersionTranslator())
+
+    assert default_fingerprint == translator_fingerprint(VersionTranslator())
+    assert default_fingerprint != translator_fingerprint(
+        VersionTranslator(tag_format="pkg-{version}")
+    )
+    with mock.patch.object(semantic_release, "__version__", "0.0.0"):
+        assert default_fingerprint != translator_fingerprint(VersionTranslator())
+
+
+@pytest.mark.parametrize(
+    "tag_format, expected_prefix",
+    [
+        ("v{version}", "v"),
+        ("pkg-a-v{version}", "pkg-a-v"),
+        ("packages/pkg_a@{version}", "packages/pkg_a@"),
+        ("{version}", ""),
+        ("{version}-pkg", ""),
+        # characters with a meaning in the (verbose) regex end the prefix
+        ("pkg.a-v{version}", "pkg"),
+        ("pkg a-v{version}", "pkg"),
+        (r"v\d{version}", "v"),
+    ],
+)
+def test_tag_format_prefix(tag_format: str, expected_prefix: str):
+    assert expected_prefix == tag_format_prefix(tag_format)
+    assert tag_format_patterns(tag_format) == (
+        (f"refs/tags/{expected_prefix}*",) if expected_prefix else ()
+    )
+
+
+@pytest.mark.parametrize(
+    "tag_format",
+    [
+        "v{version}",
+        "pkg-a-v{version}",
+        "pkg-a/{version}",
+        "pkg.a-v{version}",
+        "{version}",
+        "v{version}-pkg-a",
+    ],
+)
+def test_tag_format_patterns_keep_tags_and_versions(
+    repo_w_initial_commit: BuiltRepoResult,
+    tag_format: str,
+    caplog: pytest.LogCaptureFixture,
+):
+    repo = repo_w_initial_commit["repo"]
+    for tag in (
+        "v1.0.0",
+        "v1.1.0-rc.1",
+        "v1.0.0-pkg-a",
+        "v1.1.0-pkg-a-extra",
+        "1.0.0",
+        "pkg-a-v1.0.0",
+        "pkg-a-v1.2.0+build",
+        "pkg-b-v2.0.0",
+        "pkgXa-v3.0.0",
+        "pkg-a/1.0.0",
+        "pkg-a/nested/1.0.0",
+        "pkg-a-vbroken",
+    ):
+        repo.git.tag(tag)
+
+    translator = VersionTranslator(tag_format=tag_format)
+    expected = [
+        (tag.name, str(version))
+        for tag, version in tags_and_versions(iter_tag_records(repo), translator)
+    ]
+    caplog.clear()
+
+    actual = [
+        (tag.name, str(version))
+        for tag, version in tags_and_versions(
+            iter_tag_records(repo, *tag_format_patterns(tag_format)), translator
+        )
+    ]
+
+    assert expected == actual
+    # Only the tags with the prefix of the format may be logged as invalid
+    prefix = tag_format_prefix(tag_format)
+    assert all(
+        record.args[0].startswith(prefix)  # type: ignore[index,union-attr]
+        for record in caplog.records
+        if record.msg.startswith("Couldn't parse tag")
+    )
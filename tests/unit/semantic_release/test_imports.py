@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import semantic_release
+from semantic_release.cli.config import _known_commit_parsers, _known_hvcs
+from semantic_release.commit_parser import CommitParser
+from semantic_release.helpers import dynamic_import
+from semantic_release.hvcs import HvcsBase
+
+# Upper bounds of the cumulative import time, relative to the import time of the
+# heavy dependencies which are only needed once a command actually runs. Relative
+# budgets hold on slow or busy machines where absolute import times vary widely.
+REFERENCE_MODULES = ("git", "pydantic", "jinja2")
+IMPORT_TIME_BUDGETS = {
+    "semantic_release": 1.0,
+    "semantic_release.cli.commands.main": 2.5,
+}
+
+# Modules that are only needed once a command actually runs
+LAZY_MODULES = (
+    "git",
+    "gitlab",
+    "jinja2",
+    "pydantic",
+    "semantic_release.cli.config",
+    "semantic_release.commit_parser.angular",
+    "semantic_release.commit_parser.conventional",
+    "semantic_release.commit_parser.emoji",
+    "semantic_release.commit_parser.scipy",
+    "semantic_release.commit_parser.tag",
+    "semantic_release.hvcs.gitlab",
+    "semantic_release.version.algorithm",
+)
+
+
+def _cumulative_import_times(*module_names: str) -> dict[str, int]:
+    """Import the modules in a fresh interpreter & parse the `-X importtime` report"""
+    proc = subprocess.run(  # noqa: S603 # runs this interpreter only
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            str.join("; ", [f"import {name}" for name in module_names]),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Each line reads: "import time: <self us> | <cumulative us> | <module>"
+    import_times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        import_times[name.strip()] = int(cumulative)
+
+    return import_times
+
+
+@pytest.mark.parametrize("module_name", IMPORT_TIME_BUDGETS.keys())
+def test_import_time_budget(module_name: str):
+    module_import_times = _cumulative_import_times(module_name)
+    # Imported afterwards in the same interpreter, so only what the module did not
+    # already import is measured
+    import_times = _cumulative_import_times(module_name, *REFERENCE_MODULES)
+    reference_time = sum(import_times[name] for name in REFERENCE_MODULES)
+
+    assert not [name for name in LAZY_MODULES if name in module_import_times]
+    assert import_times[module_name] < IMPORT_TIME_BUDGETS[module_name] * reference_time
+
+
+def test_lazy_public_api():
+    assert semantic_release.LevelBump is dynamic_import(
+        "semantic_release.enums:LevelBump"
+    )
+    assert semantic_release.next_version is dynamic_import(
+        "semantic_release.version.algorithm:next_version"
+    )
+    assert set(semantic_release.__all__) <= set(dir(semantic_release))
+
+    with pytest.raises(AttributeError):
+        semantic_release.does_not_exist  # noqa: B018
+
+
+def test_gitlab_not_imported_for_github():
+    proc = subprocess.run(  # noqa: S603 # runs this interpreter only
+        [
+            sys.executable,
+            "-c",
+            "import sys; from semantic_release.hvcs import Github; "
+            "print('gitlab' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert proc.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("import_path", _known_commit_parsers.values())
+def test_known_commit_parsers_are_importable(import_path: str):
+    assert issubclass(dynamic_import(import_path), CommitParser)
+
+
+@pytest.mark.parametrize("import_path", _known_hvcs.values())
+def test_known_hvcs_are_importable(import_path: str):
+    assert issubclass(dynamic_import(import_path), HvcsBase)
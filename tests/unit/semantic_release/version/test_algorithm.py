@@ -4,100 +4,80 @@ from typing import TYPE_CHECKING
 from unittest import mock
 
 import pytest
-from git import Commit, Repo, TagReference
+from git import Repo
 
 from semantic_release.enums import LevelBump
+from semantic_release.history.parse_cache import ParseCache
+from semantic_release.history.snapshot import HistorySnapshot
 from semantic_release.version.algorithm import (
+    _evaluate_level_bump,
     _increment_version,
+    _max_reachable_level,
     _traverse_graph_for_commits,
+    next_version,
+    next_versions,
     tags_and_versions,
 )
 from semantic_release.version.translator import VersionTranslator
 from semantic_release.version.version import Version
 
-from tests.fixtures.repos import repo_w_initial_commit
-
 if TYPE_CHECKING:
+    from pathlib import Path
     from typing import Sequence
 
+    from semantic_release.commit_parser.conventional import ConventionalCommitParser
+
+    from tests.fixtures.git_repo import BuiltRepoResult
+
 
-@pytest.mark.usefixtures(repo_w_initial_commit.__name__)
-def test_traverse_graph_for_commits():
-    # Setup fake git graph
+def test_traverse_graph_for_commits(repo_w_initial_commit: BuiltRepoResult):
+    # Setup git graph
     """
-    * merge commit 6 (start) [3636363]
+    * merge commit 6 (start)
     |\
-    | * commit 5 [3535353]
-    | * commit 4 [3434343]
+    | * commit 5
+    | * commit 4
     |/
-    * commit 3 [3333333]
-    * commit 2 [3232323]
-    * commit 1 [3131313]
-    * v1.0.0 [3030303]
+    * commit 3
+    * commit 2
+    * commit 1
+    * v1.0.0
     """
-    repo = Repo()
-    v1_commit = Commit(repo, binsha=b"0" * 20, parents=[])
-
-    class TagReferenceOverride(TagReference):
-        commit = v1_commit  # mocking the commit property
-
-    v1_tag = TagReferenceOverride(repo, "refs/tags/v1.0.0", check_path=False)
-
-    trunk = Commit(
-        repo,
-        binsha=b"3" * 20,
-        parents=[
-            Commit(
-                repo,
-                binsha=b"2" * 20,
-                parents=[
-                    Commit(repo, binsha=b"1" * 20, parents=[v1_commit]),
-                ],
-            ),
-        ],
-    )
-    start_commit = Commit(
-        repo,
-        binsha=b"6" * 20,
-        parents=[
-            trunk,
-            Commit(
-                repo,
-                binsha=b"5" * 20,
-                parents=[
-                    Commit(repo, binsha=b"4" * 20, parents=[trunk]),
-                ],
-            ),
-        ],
-    )
+    repo = repo_w_initial_commit["repo"]
+    trunk = repo.active_branch.name
+
+    def make_commit(msg: str) -> str:
+        repo.git.commit(m=msg, allow_empty=True)
+        return repo.head.commit.hexsha
 
-    commit_1 = trunk.parents[0].parents[0]
-    commit_2 = trunk.parents[0]
-    commit_3 = trunk
-    commit_4 = start_commit.parents[1].parents[0]
-    commit_5 = start_commit.parents[1]
-    commit_6 = start_commit
+    repo.git.tag("v1.0.0", m="v1.0.0")
+    commit_1 = make_commit("commit 1")
+    commit_2 = make_commit("commit 2")
+    commit_3 = make_commit("commit 3")
+    repo.git.checkout("-b", "feature")
+    commit_4 = make_commit("commit 4")
+    commit_5 = make_commit("commit 5")
+    repo.git.checkout(trunk)
+    repo.git.merge("feature", no_ff=True, m="merge commit 6")
+    commit_6 = repo.head.commit.hexsha
 
     expected_commit_order = [
-        commit_6.hexsha,
-        commit_5.hexsha,
-        commit_4.hexsha,
-        commit_3.hexsha,
-        commit_2.hexsha,
-        commit_1.hexsha,
+        commit_6,
+        commit_5,
+        commit_4,
+        commit_3,
+        commit_2,
+        commit_1,
     ]
 
     # Execute
-    with mock.patch.object(
-        repo, repo.iter_commits.__name__, return_value=iter([v1_commit])
-    ):
-        actual_commit_order = [
-            commit.hexsha
-            for commit in _traverse_graph_for_commits(
-                head_commit=start_commit,
-                latest_release_tag_str=v1_tag.name,
-            )
-        ]
+    actual_commit_order = [
+        commit.hexsha
+        for commit in _traverse_graph_for_commits(
+            head_commit=repo.head.commit,
+            latest_release_tag_str="v1.0.0",
+        )
+    ]
 
     # Verify
     assert expected_commit_order == actual_commit_order
@@ -376,3 +356,191 @@ def test_increment_version_invalid_operation(
             major_on_zero=False,
             allow_zero_version=True,
         )
+
+
+@pytest.mark.parametrize(
+    "latest_version, allow_zero_version, major_on_zero, expected_level",
+    [
+        ("1.2.3", True, True, LevelBump.MAJOR),
+        ("1.2.3", False, False, LevelBump.MAJOR),
+        ("0.2.3", True, True, LevelBump.MAJOR),
+        ("0.2.3", True, False, LevelBump.MINOR),
+        ("0.2.3", False, True, LevelBump.NO_RELEASE),
+    ],
+)
+def test_max_reachable_level(
+    latest_version: str,
+    allow_zero_version: bool,
+    major_on_zero: bool,
+    expected_level: LevelBump,
+):
+    assert expected_level == _max_reachable_level(
+        latest_version=Version.parse(latest_version),
+        allow_zero_version=allow_zero_version,
+        major_on_zero=major_on_zero,
+    )
+
+
+@pytest.mark.parametrize(
+    "commit_levels, max_level, expected_level, expected_evaluated",
+    [
+        (
+            [LevelBump.PATCH, LevelBump.MINOR, LevelBump.PATCH, LevelBump.MAJOR],
+            LevelBump.MAJOR,
+            LevelBump.MAJOR,
+            4,
+        ),
+        (
+            [LevelBump.PATCH, LevelBump.MAJOR, LevelBump.PATCH, LevelBump.MINOR],
+            LevelBump.MAJOR,
+            LevelBump.MAJOR,
+            2,
+        ),
+        (
+            [LevelBump.PATCH, LevelBump.MINOR, LevelBump.PATCH, LevelBump.MAJOR],
+            LevelBump.MINOR,
+            LevelBump.MINOR,
+            2,
+        ),
+        (
+            [LevelBump.NO_RELEASE, LevelBump.PATCH],
+            LevelBump.MAJOR,
+            LevelBump.PATCH,
+            2,
+        ),
+        ([LevelBump.MAJOR], LevelBump.NO_RELEASE, LevelBump.NO_RELEASE, 0),
+        ([], LevelBump.MAJOR, LevelBump.NO_RELEASE, 0),
+    ],
+)
+def test_evaluate_level_bump_stops_at_max_level(
+    commit_levels: list[LevelBump],
+    max_level: LevelBump,
+    expected_level: LevelBump,
+    expected_evaluated: int,
+):
+    commits = [mock.Mock(hexsha=f"{i:040x}") for i in range(len(commit_levels))]
+    history = mock.Mock(bump_parsing_supported=True)
+    history.parse_bump.side_effect = commit_levels
+
+    actual = _evaluate_level_bump(history, commits, max_level=max_level)
+
+    assert expected_level == actual
+    assert expected_evaluated == history.parse_bump.call_count
+
+
+def test_next_versions_of_refs_share_parsing(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    """
+    * feat: commit 4 (feature)
+    | * fix: commit 3 (bugfix)
+    |/
+    * fix: commit 2 (trunk)
+    * fix: commit 1
+    * v1.0.0
+    """
+    repo = repo_w_initial_commit["repo"]
+    trunk = repo.active_branch.name
+
+    repo.git.tag("v1.0.0", m="v1.0.0")
+    repo.git.commit(m="fix: commit 1", allow_empty=True)
+    repo.git.commit(m="fix: commit 2", allow_empty=True)
+    repo.git.checkout("-b", "bugfix")
+    repo.git.commit(m="fix: commit 3", allow_empty=True)
+    repo.git.checkout("-b", "feature", trunk)
+    repo.git.commit(m="feat: commit 4", allow_empty=True)
+    repo.git.checkout(trunk)
+
+    with mock.patch.object(
+        default_conventional_parser,
+        "parse",
+        wraps=default_conventional_parser.parse,
+    ) as parse_spy, mock.patch.object(
+        default_conventional_parser,
+        "parse_bump",
+        wraps=default_conventional_parser.parse_bump,
+    ) as parse_bump_spy:
+        versions = next_versions(
+            repo=repo,
+            refs=["feature", "bugfix", trunk],
+            translator=VersionTranslator(),
+            commit_parser=default_conventional_parser,
+            allow_zero_version=True,
+            major_on_zero=True,
+        )
+
+    assert versions == {
+        "feature": Version.parse("1.1.0"),
+        "bugfix": Version.parse("1.0.1"),
+        trunk: Version.parse("1.0.1"),
+    }
+    # The checked out branch is unchanged
+    assert trunk == repo.active_branch.name
+
+    # The commits the refs have in common are parsed once
+    parsed_shas = [
+        call.args[0].hexsha
+        for call in [*parse_spy.call_args_list, *parse_bump_spy.call_args_list]
+    ]
+    assert len(parsed_shas) == len(set(parsed_shas))
+
+
+def test_next_version_resumes_from_the_checkpoint_of_the_branch(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    tmp_path: Path,
+):
+    repo = repo_w_initial_commit["repo"]
+    repo.git.tag("v1.0.0", m="v1.0.0")
+
+    def commit(message: str) -> str:
+        repo.git.commit(m=message, allow_empty=True)
+        return repo.head.commit.hexsha
+
+    def evaluate() -> tuple[str, list[str]]:
+        """The next version & the commits evaluated to determine it"""
+        with ParseCache(tmp_path / "cache.sqlite3") as cache, mock.patch(
+            "semantic_release.version.algorithm._evaluate_level_bump",
+            wraps=_evaluate_level_bump,
+        ) as evaluate_spy:
+            version = next_version(
+                repo=repo,
+                translator=VersionTranslator(),
+                commit_parser=default_conventional_parser,
+                allow_zero_version=True,
+                major_on_zero=True,
+                history=HistorySnapshot(
+                    repo=repo,
+                    translator=VersionTranslator(),
+                    commit_parser=default_conventional_parser,
+                    parse_cache=cache,
+                ),
+            )
+
+        evaluated = [
+            commit.hexsha
+            for call in evaluate_spy.call_args_list
+            for commit in call.args[1]
+        ]
+        return str(version), evaluated
+
+    fix_1, fix_2 = commit("fix: commit 1"), commit("fix: commit 2")
+    assert evaluate() == ("1.0.1", [fix_2, fix_1])
+
+    # Only the new commits are evaluated
+    assert evaluate() == ("1.0.1", [])
+    feat_3 = commit("feat: commit 3")
+    assert evaluate() == ("1.1.0", [feat_3])
+
+    # A rewritten branch is evaluated from its last release again
+    repo.git.reset("--hard", fix_2)
+    fix_4 = commit("fix: commit 4")
+    assert evaluate() == ("1.0.1", [fix_4, fix_2, fix_1])
+
+    # So is a branch with a new release
+    repo.git.tag("v1.0.1", m="v1.0.1")
+    docs_5 = commit("docs: commit 5")
+    assert evaluate() == ("1.0.1", [docs_5])
+    fix_6 = commit("fix: commit 6")
+    assert evaluate() == ("1.0.2", [fix_6])
@@ -1,6 +1,12 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest import mock
+
 import pytest
 
 from semantic_release.const import SEMVER_REGEX
+from semantic_release.errors import InvalidVersion
 from semantic_release.version.translator import VersionTranslator
 from semantic_release.version.version import Version
 
@@ -92,3 +98,90 @@ def test_translator_converts_versions_with_default_formatting_rules(
     assert expected_tag == actual_tag
     assert expected_version_obj == (translator.from_tag(expected_tag) or "")
     assert version_string == str(translator.from_tag(actual_tag) or "")
+
+
+def _decode_like_version_parse(translator: VersionTranslator, tag: str) -> Any:
+    """The parts of the version of ``tag`` decoded without the combined regex"""
+    tag_match = translator.from_tag_re.match(tag)
+    if not tag_match:
+        return None
+    try:
+        version = translator.from_string(tag_match.group("version"))
+    except (InvalidVersion, NotImplementedError) as err:
+        return type(err)
+    return (
+        version.major,
+        version.minor,
+        version.patch,
+        version.prerelease_token,
+        version.prerelease_revision,
+        version.build_metadata,
+        version.tag_format,
+    )
+
+
+@pytest.mark.parametrize(
+    "tag_format, uses_combined_regex",
+    [
+        ("v{version}", True),
+        ("pkg-a/v{version}", True),
+        ("{version}", True),
+        ("v{version}-pkg", False),
+        ("v.{version}", False),
+    ],
+)
+def test_from_tag_decodes_like_version_parse(
+    tag_format: str, uses_combined_regex: bool
+):
+    translator = VersionTranslator(tag_format=tag_format, prerelease_token="dev")
+    versions = [
+        "1.2.3",
+        "0.0.0",
+        "10.20.30+build.1-a",
+        "1.2.3-rc.1",
+        "1.2.3-rc.0",
+        "1.2.3-alpha.beta.12+meta",
+        "1.2.3-rc.1.2",
+        "1.2.3-1.2",
+        "1.2.3-my-custom-3rc.4",
+        # quirks of the prerelease token & revision split of Version.parse
+        "1.2.3-alpha.1.beta",
+        "1.2.3-rc.1a",
+        # invalid versions
+        "1.2.3-rc",
+        "1.2.3-rc.01",
+        "01.2.3",
+        "1.2",
+        "1.2.3+",
+        "1.2.3-rc.1-pkg",
+    ]
+    tags = [
+        *(translator.str_to_tag(version) for version in versions),
+        *(f"{translator.str_to_tag(version)}-pkg" for version in versions),
+        "other-1.2.3",
+        "",
+    ]
+
+    def decode(tag: str) -> Any:
+        try:
+            version = translator.from_tag(tag)
+        except (InvalidVersion, NotImplementedError) as err:
+            return type(err)
+        return version and (
+            version.major,
+            version.minor,
+            version.patch,
+            version.prerelease_token,
+            version.prerelease_revision,
+            version.build_metadata,
+            version.tag_format,
+        )
+
+    with mock.patch.object(
+        translator, "from_string", wraps=translator.from_string
+    ) as from_string_spy:
+        assert decode(translator.str_to_tag("1.2.3-rc.1+build")) is not None
+        assert (from_string_spy.call_count == 0) == uses_combined_regex
+
+    for tag in tags:
+        assert _decode_like_version_parse(translator, tag) == decode(tag), tag